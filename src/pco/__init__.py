@@ -1,32 +1,79 @@
 """Python wrapper for Planning Center Online API."""
 
 from pco.auth import OAuth2Client, OAuth2Token
-from pco.client import PCOClient
+from pco.cache import CacheBackend, MemoryCache, SQLiteCache
+from pco.client import AsyncPCOClient, PCOClient
 from pco.exceptions import (
     PCOAPIError,
     PCOAuthError,
+    PCOCircuitOpenError,
     PCOError,
     PCONotFoundError,
     PCORateLimitError,
     PCOValidationError,
+    PCOWebhookError,
 )
-from pco.modules import CheckInsModule, GivingModule, PeopleModule, ResourcesModule, ServicesModule
+from pco.hooks import RequestEvent
+from pco.metrics import MetricsCollector
+from pco.modules import (
+    AsyncCheckInsModule,
+    AsyncGivingModule,
+    AsyncPeopleModule,
+    AsyncResourcesModule,
+    AsyncServicesModule,
+    BulkItemResult,
+    BulkResult,
+    CheckInsModule,
+    GetManyResult,
+    GivingModule,
+    PeopleModule,
+    ResourcesModule,
+    ServicesModule,
+)
+from pco.ratelimit import RateLimiter
+from pco.retry import CircuitBreaker, RetryPolicy
+from pco.token_store import FileTokenStore, MemoryTokenStore, TokenStore
+from pco.webhooks import WebhookEvent, WebhookReceiver
 
 __version__ = "0.1.0"
 
 __all__ = [
     "PCOClient",
+    "AsyncPCOClient",
     "OAuth2Client",
     "OAuth2Token",
+    "TokenStore",
+    "FileTokenStore",
+    "MemoryTokenStore",
+    "RateLimiter",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "RequestEvent",
+    "MetricsCollector",
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "WebhookReceiver",
+    "WebhookEvent",
     "PeopleModule",
     "ServicesModule",
     "CheckInsModule",
     "GivingModule",
     "ResourcesModule",
+    "AsyncPeopleModule",
+    "AsyncServicesModule",
+    "AsyncCheckInsModule",
+    "AsyncGivingModule",
+    "AsyncResourcesModule",
+    "BulkItemResult",
+    "BulkResult",
+    "GetManyResult",
     "PCOError",
     "PCOAuthError",
     "PCOAPIError",
     "PCONotFoundError",
     "PCORateLimitError",
     "PCOValidationError",
+    "PCOCircuitOpenError",
+    "PCOWebhookError",
 ]
@@ -1,9 +1,18 @@
 """OAuth 2.0 authentication for PCO API."""
 
-from typing import Any
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from pco.exceptions import PCOAuthError
+
+if TYPE_CHECKING:
+    from pco.token_store import TokenStore
+
 
 class OAuth2Token:
     """OAuth 2.0 token storage and management."""
@@ -24,28 +33,59 @@ class OAuth2Token:
         self._expires_at: float | None = None
 
         if expires_in:
-            import time
-
             self._expires_at = time.time() + expires_in
 
-    def is_expired(self) -> bool:
-        """Check if the token is expired."""
+    def is_expired(self, skew: float = 0.0) -> bool:
+        """Check if the token is expired.
+
+        Args:
+            skew: Seconds before the actual expiry at which the token already counts as expired
+        """
         if self._expires_at is None:
             return False
-        import time
-
-        return time.time() >= self._expires_at
+        return time.time() + skew >= self._expires_at
 
     def to_header(self) -> dict[str, str]:
         """Convert token to Authorization header format."""
         return {"Authorization": f"{self.token_type} {self.access_token}"}
 
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the token, including its absolute expiry time."""
+        return {
+            "access_token": self.access_token,
+            "token_type": self.token_type,
+            "expires_in": self.expires_in,
+            "refresh_token": self.refresh_token,
+            "scope": self.scope,
+            "expires_at": self._expires_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "OAuth2Token":
+        """Deserialize a token produced by ``to_dict``."""
+        token = cls(
+            access_token=data["access_token"],
+            token_type=data.get("token_type", "Bearer"),
+            refresh_token=data.get("refresh_token"),
+            scope=data.get("scope"),
+        )
+        token.expires_in = data.get("expires_in")
+        token._expires_at = data.get("expires_at")
+        return token
+
+
+def _refresh_error(error: Exception) -> PCOAuthError:
+    """Wrap a failed token refresh in a PCOAuthError."""
+    status_code = error.response.status_code if isinstance(error, httpx.HTTPStatusError) else None
+    return PCOAuthError(f"Token refresh failed: {error}", status_code=status_code)
+
 
 class OAuth2Client:
     """OAuth 2.0 client for PCO API authentication."""
 
     BASE_URL = "https://api.planningcenteronline.com"
     TOKEN_URL = "https://api.planningcenteronline.com/oauth/token"
+    DEFAULT_REFRESH_SKEW = 60.0
 
     def __init__(
         self,
@@ -53,12 +93,66 @@ class OAuth2Client:
         client_secret: str,
         redirect_uri: str | None = None,
         http_client: httpx.Client | None = None,
+        refresh_skew: float = DEFAULT_REFRESH_SKEW,
+        token_store: "TokenStore | None" = None,
     ):
+        """Initialize OAuth client.
+
+        Args:
+            client_id: OAuth application ID
+            client_secret: OAuth application secret
+            redirect_uri: Redirect URI registered for the application
+            http_client: HTTP client for token requests (created if not given)
+            refresh_skew: Seconds before expiry at which the token is refreshed
+            token_store: Store shared with other processes; tokens are read from
+                and written to it, and refreshes are serialized through its lock
+        """
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
+        self.refresh_skew = refresh_skew
         self._http_client = http_client or httpx.Client()
+        self._owns_http_client = http_client is None
+        self._http_client_given = http_client is not None
+        self._http_client_lock = threading.Lock()
+        self.token_store = token_store
         self._token: OAuth2Token | None = None
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def owns_http_client(self) -> bool:
+        """Whether the HTTP client was created by (and is closed with) this client."""
+        return self._owns_http_client
+
+    def share_http_client(self, http_client: httpx.Client) -> None:
+        """Send token requests through another client's connection pool.
+
+        Ignored when this client was given an ``http_client`` or already
+        shares a pool that is still open. The shared client is not closed by
+        this client; once its owner closes it, token requests go through a
+        new pool of this client's own.
+        """
+        with self._http_client_lock:
+            if self._http_client_given or not (
+                self._owns_http_client or self._http_client.is_closed
+            ):
+                return
+            if self._owns_http_client:
+                self._http_client.close()
+            self._http_client = http_client
+            self._owns_http_client = False
+
+    def _token_http_client(self) -> httpx.Client:
+        """HTTP client for token requests, replacing a shared pool its owner has closed."""
+        with self._http_client_lock:
+            if (
+                not self._owns_http_client
+                and not self._http_client_given
+                and self._http_client.is_closed
+            ):
+                self._http_client = httpx.Client()
+                self._owns_http_client = True
+            return self._http_client
 
     def get_authorization_url(self, state: str | None = None, scope: str = "people services check_ins giving resources") -> str:
         """Generate the authorization URL for OAuth flow."""
@@ -86,16 +180,18 @@ class OAuth2Client:
         if self.redirect_uri:
             data["redirect_uri"] = self.redirect_uri
 
-        response = self._http_client.post(self.TOKEN_URL, data=data)
+        response = self._token_http_client().post(self.TOKEN_URL, data=data)
         response.raise_for_status()
         token_data = response.json()
 
-        self._token = OAuth2Token(
-            access_token=token_data["access_token"],
-            token_type=token_data.get("token_type", "Bearer"),
-            expires_in=token_data.get("expires_in"),
-            refresh_token=token_data.get("refresh_token"),
-            scope=token_data.get("scope"),
+        self._store_token(
+            OAuth2Token(
+                access_token=token_data["access_token"],
+                token_type=token_data.get("token_type", "Bearer"),
+                expires_in=token_data.get("expires_in"),
+                refresh_token=token_data.get("refresh_token"),
+                scope=token_data.get("scope"),
+            )
         )
         return self._token
 
@@ -111,31 +207,111 @@ class OAuth2Client:
             "client_secret": self.client_secret,
         }
 
-        response = self._http_client.post(self.TOKEN_URL, data=data)
+        response = self._token_http_client().post(self.TOKEN_URL, data=data)
         response.raise_for_status()
         token_data = response.json()
 
-        self._token = OAuth2Token(
-            access_token=token_data["access_token"],
-            token_type=token_data.get("token_type", "Bearer"),
-            expires_in=token_data.get("expires_in"),
-            refresh_token=token_data.get("refresh_token") or self._token.refresh_token,
-            scope=token_data.get("scope") or self._token.scope,
+        self._store_token(
+            OAuth2Token(
+                access_token=token_data["access_token"],
+                token_type=token_data.get("token_type", "Bearer"),
+                expires_in=token_data.get("expires_in"),
+                refresh_token=token_data.get("refresh_token") or self._token.refresh_token,
+                scope=token_data.get("scope") or self._token.scope,
+            )
         )
         return self._token
 
+    def _store_token(self, token: OAuth2Token) -> None:
+        """Use a new token and write it to the token store."""
+        self._token = token
+        if self.token_store is not None:
+            self.token_store.save(token)
+
+    def _current_token(self) -> OAuth2Token | None:
+        """The latest token, preferring the token store's copy."""
+        if self.token_store is not None:
+            stored = self.token_store.load()
+            if stored is not None:
+                self._token = stored
+        return self._token
+
+    @contextmanager
+    def _refresh_guard(self) -> Iterator[None]:
+        """Serialize refreshes across threads and, with a token store, processes."""
+        with (
+            self._refresh_lock,
+            self.token_store.lock() if self.token_store is not None else nullcontext(),
+        ):
+            yield
+
     def set_token(self, token: OAuth2Token) -> None:
         """Set the token manually (for token storage/retrieval)."""
-        self._token = token
+        self._store_token(token)
+
+    def _needs_refresh(self, token: OAuth2Token | None) -> bool:
+        return (
+            token is not None
+            and token.refresh_token is not None
+            and token.is_expired(self.refresh_skew)
+        )
+
+    def needs_refresh(self) -> bool:
+        """Whether the next ``get_token`` call would refresh (and block on) the token."""
+        return self._needs_refresh(self._current_token())
 
     def get_token(self) -> OAuth2Token | None:
-        """Get the current token."""
-        if self._token and self._token.is_expired() and self._token.refresh_token:
+        """Get the current token, refreshing it shortly before it expires.
+
+        The token is refreshed once it is within ``refresh_skew`` seconds of
+        expiry. Only one thread refreshes at a time (one process, when the
+        token store is shared); the others wait for its result instead of
+        refreshing again. If the refresh fails while the token is still
+        valid, the current token is returned and the refresh is attempted
+        again on the next call.
+
+        Raises:
+            PCOAuthError: If the token has expired and could not be refreshed
+        """
+        token = self._current_token()
+        if not self._needs_refresh(token):
+            return token
+        with self._refresh_guard():
+            current = self._current_token()
+            if not self._needs_refresh(current):
+                return current
+            try:
+                return self.refresh_access_token()
+            except (httpx.HTTPError, KeyError, ValueError) as e:
+                if self._token is not None and not self._token.is_expired():
+                    return self._token
+                raise _refresh_error(e) from e
+
+    def refresh_after_unauthorized(self, authorization: str | None) -> bool:
+        """Refresh the token after a request was rejected with 401.
+
+        Args:
+            authorization: Authorization header the rejected request was sent with
+
+        Returns:
+            True if a different token is now available and the request should be retried once
+
+        Raises:
+            PCOAuthError: If the refresh failed
+        """
+        with self._refresh_guard():
+            token = self._current_token()
+            if token is None:
+                return False
+            if authorization is not None and token.to_header()["Authorization"] != authorization:
+                return True
+            if not token.refresh_token:
+                return False
             try:
                 self.refresh_access_token()
-            except Exception:
-                pass  # If refresh fails, return expired token
-        return self._token
+            except (httpx.HTTPError, KeyError, ValueError) as e:
+                raise _refresh_error(e) from e
+            return True
 
     def get_authorization_header(self) -> dict[str, str]:
         """Get the authorization header for API requests."""
@@ -145,8 +321,9 @@ class OAuth2Client:
         return token.to_header()
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._http_client.close()
+        """Close the HTTP client if it is owned by this client."""
+        if self._owns_http_client:
+            self._http_client.close()
 
     def __enter__(self) -> "OAuth2Client":
         return self
@@ -0,0 +1,297 @@
+"""Response caching for GET requests to the PCO API."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+from pco import jsonlib
+
+
+def cache_key(endpoint: str, params: dict[str, Any] | None = None) -> str:
+    """Build the cache key for a GET request.
+
+    Parameters are sorted so equivalent requests share a key.
+    """
+    if not params:
+        return endpoint
+    return f"{endpoint}?{urlencode(sorted((str(k), str(v)) for k, v in params.items()))}"
+
+
+def key_endpoint(key: str) -> str:
+    """Get the endpoint part of a cache key."""
+    return key.split("?", 1)[0]
+
+
+def matches_endpoint(key: str, endpoint: str) -> bool:
+    """Check whether a cache key belongs to an endpoint or to a path below it."""
+    path = key_endpoint(key)
+    return path == endpoint or path.startswith(f"{endpoint.rstrip('/')}/")
+
+
+@dataclass
+class CacheEntry:
+    """A cached API response."""
+
+    data: dict[str, Any] | list[Any]
+    expires_at: float
+    etag: str | None = None
+
+    def is_fresh(self, now: float) -> bool:
+        """Check whether the entry can be served without contacting the API."""
+        return now < self.expires_at
+
+
+class CacheBackend(ABC):
+    """Storage for cached GET responses.
+
+    Entries are served without a request while fresh (``ttl`` seconds after
+    they were stored). Stale entries that carry an ETag are revalidated with
+    ``If-None-Match``, so an unchanged resource costs a body-less 304.
+    Cached data is shared between callers and must not be mutated.
+
+    A cache should only be shared by clients authenticated as the same
+    account, since keys do not include credentials.
+    """
+
+    DEFAULT_TTL = 60.0
+
+    def __init__(self, ttl: float = DEFAULT_TTL, clock: Callable[[], float] = time.time):
+        """Initialize cache backend.
+
+        Args:
+            ttl: Seconds a response is served from cache without revalidation
+            clock: Wall clock used for expiry
+        """
+        self.ttl = ttl
+        self._clock = clock
+
+    def entry(self, data: dict[str, Any] | list[Any], etag: str | None = None) -> CacheEntry:
+        """Create a fresh entry for a response."""
+        return CacheEntry(data=data, expires_at=self._clock() + self.ttl, etag=etag)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Check whether an entry can be served without contacting the API."""
+        return entry.is_fresh(self._clock())
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Get the entry stored under a key, fresh or stale."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry under a key."""
+
+    @abstractmethod
+    def invalidate(self, endpoint: str) -> None:
+        """Remove entries for an endpoint and every path below it."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe in-process LRU cache.
+
+    Holds at most ``max_entries`` responses, evicting the least recently used
+    first. Stale entries without an ETag cannot be revalidated and are
+    dropped when next looked up.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = CacheBackend.DEFAULT_TTL,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize in-memory cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            ttl: Seconds a response is served from cache without revalidation
+            clock: Wall clock used for expiry
+        """
+        super().__init__(ttl=ttl, clock=clock)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get the entry stored under a key, fresh or stale."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.etag is None and not self.is_fresh(entry):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry under a key, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str) -> None:
+        """Remove entries for an endpoint and every path below it."""
+        with self._lock:
+            for key in [key for key in self._entries if matches_endpoint(key, endpoint)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(CacheBackend):
+    """Persistent cache stored in a SQLite database file.
+
+    Uses WAL journaling so several processes on one host (cron jobs, web
+    workers) can read and write the same cache concurrently, and responses
+    survive restarts. Each thread uses its own connection. When more than
+    ``max_entries`` responses are stored, the least recently stored are
+    removed.
+    """
+
+    DEFAULT_MAX_ENTRIES = 100_000
+    DEFAULT_BUSY_TIMEOUT = 30.0
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS pco_responses (
+            key TEXT PRIMARY KEY,
+            endpoint TEXT NOT NULL,
+            data TEXT NOT NULL,
+            etag TEXT,
+            expires_at REAL NOT NULL,
+            stored_at REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS pco_responses_endpoint ON pco_responses (endpoint)",
+        "CREATE INDEX IF NOT EXISTS pco_responses_stored_at ON pco_responses (stored_at)",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        ttl: float = CacheBackend.DEFAULT_TTL,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize SQLite cache.
+
+        Args:
+            path: Path of the database file (created if missing)
+            max_entries: Maximum number of cached responses, or None for no limit
+            ttl: Seconds a response is served from cache without revalidation
+            busy_timeout: Seconds to wait for another process's write lock
+            clock: Wall clock used for expiry
+        """
+        super().__init__(ttl=ttl, clock=clock)
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        conn = self._connection()
+        for statement in self._SCHEMA:
+            conn.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.busy_timeout, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get the entry stored under a key, fresh or stale."""
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT data, etag, expires_at FROM pco_responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        data, etag, expires_at = row
+        entry = CacheEntry(data=jsonlib.loads(data), expires_at=expires_at, etag=etag)
+        if etag is None and not self.is_fresh(entry):
+            conn.execute("DELETE FROM pco_responses WHERE key = ? AND etag IS NULL", (key,))
+            return None
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry under a key, evicting the oldest entries over the limit."""
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO pco_responses "
+            "(key, endpoint, data, etag, expires_at, stored_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                key_endpoint(key),
+                json.dumps(entry.data),
+                entry.etag,
+                entry.expires_at,
+                self._clock(),
+            ),
+        )
+        if self.max_entries is not None:
+            (count,) = conn.execute("SELECT COUNT(*) FROM pco_responses").fetchone()
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM pco_responses WHERE key IN "
+                    "(SELECT key FROM pco_responses ORDER BY stored_at LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def invalidate(self, endpoint: str) -> None:
+        """Remove entries for an endpoint and every path below it."""
+        prefix = f"{endpoint.rstrip('/')}/"
+        self._connection().execute(
+            "DELETE FROM pco_responses WHERE endpoint = ? OR substr(endpoint, 1, ?) = ?",
+            (endpoint, len(prefix), prefix),
+        )
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._connection().execute("DELETE FROM pco_responses")
+
+    def close(self) -> None:
+        """Close every connection opened by this cache."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM pco_responses").fetchone()
+        return count
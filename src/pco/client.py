@@ -1,12 +1,54 @@
 """Main API client for PCO API."""
 
+from __future__ import annotations
+
+import asyncio
+import logging
 import time
+from collections.abc import Iterable
 from typing import Any
 
 import httpx
 
+from pco import jsonlib
 from pco.auth import OAuth2Client, OAuth2Token
-from pco.exceptions import PCOAPIError, PCONotFoundError, PCORateLimitError, PCOValidationError
+from pco.cache import CacheBackend, CacheEntry, cache_key
+from pco.exceptions import (
+    PCOAPIError,
+    PCOCircuitOpenError,
+    PCONotFoundError,
+    PCORateLimitError,
+    PCOValidationError,
+)
+from pco.hooks import (
+    ERROR,
+    RATE_LIMIT_WAIT,
+    REQUEST,
+    RESPONSE,
+    RETRY,
+    Hook,
+    RequestEvent,
+    endpoint_module,
+    endpoint_template,
+)
+from pco.jsonlib import JSONLoads
+from pco.modules import (
+    AsyncCheckInsModule,
+    AsyncGivingModule,
+    AsyncPeopleModule,
+    AsyncResourcesModule,
+    AsyncServicesModule,
+    CheckInsModule,
+    GivingModule,
+    PeopleModule,
+    ResourcesModule,
+    ServicesModule,
+)
+from pco.ratelimit import RateLimiter
+from pco.retry import CircuitBreaker, RetryPolicy, parse_retry_after
+from pco.singleflight import AsyncSingleFlight, SingleFlight
+
+logger = logging.getLogger(__name__)
 
 
 class PCOClient:
@@ -14,8 +56,10 @@ class PCOClient:
 
     BASE_URL = "https://api.planningcenteronline.com"
     DEFAULT_TIMEOUT = 30.0
-    DEFAULT_RETRY_DELAY = 1.0
-    MAX_RETRIES = 3
+    DEFAULT_LIMITS = httpx.Limits(
+        max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0
+    )
+    SINGLE_FLIGHT_CLASS: type[SingleFlight] | type[AsyncSingleFlight] = SingleFlight
 
     def __init__(
         self,
@@ -23,7 +67,16 @@ class PCOClient:
         token: OAuth2Token | None = None,
         base_url: str | None = None,
         timeout: float | None = None,
-        http_client: httpx.Client | None = None,
+        http_client: httpx.Client | httpx.AsyncClient | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        cache: CacheBackend | None = None,
+        coalesce_requests: bool = False,
+        json_loads: JSONLoads | None = None,
+        hooks: Iterable[Hook] | None = None,
     ):
         """Initialize PCO client.
 
@@ -32,7 +85,23 @@ class PCOClient:
             token: OAuth2Token instance (alternative to oauth_client)
             base_url: Base URL for API (defaults to official PCO API)
             timeout: Request timeout in seconds
-            http_client: Custom httpx.Client instance
+            http_client: Custom httpx.Client instance (httpx.AsyncClient for
+                AsyncPCOClient)
+            limits: Connection pool size and keep-alive settings (ignored when
+                http_client is given)
+            http2: Enable HTTP/2 multiplexing; requires the ``http2`` extra
+                (ignored when http_client is given)
+            rate_limiter: RateLimiter pacing requests (share one instance between
+                clients using the same credentials)
+            retry_policy: RetryPolicy deciding which failures are retried and when
+            circuit_breaker: CircuitBreaker failing requests fast while the API is down
+            cache: CacheBackend for GET responses (e.g. MemoryCache); disabled by default
+            coalesce_requests: Share one in-flight request between concurrent
+                identical GETs (callers receive the same object)
+            json_loads: Function decoding raw response bytes (defaults to orjson
+                when installed, the standard library otherwise)
+            hooks: Callables receiving a RequestEvent at every step of a request
+                (e.g. a MetricsCollector)
         """
         if oauth_client and token:
             raise ValueError("Cannot provide both oauth_client and token")
@@ -41,7 +110,18 @@ class PCOClient:
         self._token = token
         self.base_url = base_url or self.BASE_URL
         self.timeout = timeout or self.DEFAULT_TIMEOUT
-        self._http_client = http_client or httpx.Client(timeout=self.timeout)
+        self._http_client = http_client or self._create_http_client(
+            limits or self.DEFAULT_LIMITS, http2
+        )
+        if oauth_client is not None:
+            self._share_connections(oauth_client)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.cache = cache
+        self._single_flight = self.SINGLE_FLIGHT_CLASS() if coalesce_requests else None
+        self.json_loads = json_loads or jsonlib.loads
+        self._hooks: list[Hook] = list(hooks or ())
 
         # Initialize modules
         self._people: PeopleModule | None = None
@@ -50,6 +130,15 @@ class PCOClient:
         self._giving: GivingModule | None = None
         self._resources: ResourcesModule | None = None
 
+    def _create_http_client(self, limits: httpx.Limits, http2: bool) -> httpx.Client:
+        """Create the HTTP client used when none is given."""
+        return httpx.Client(timeout=self.timeout, limits=limits, http2=http2)
+
+    def _share_connections(self, oauth_client: OAuth2Client) -> None:
+        """Let the OAuth client send token requests over this client's pool."""
+        # Token requests go to the same host, so reuse this client's connections
+        oauth_client.share_http_client(self._http_client)
+
     def _get_headers(self) -> dict[str, str]:
         """Get headers for API requests."""
         headers = {"Content-Type": "application/json", "Accept": "application/json"}
@@ -63,60 +152,309 @@ class PCOClient:
 
         return headers
 
+    def _decode(self, response: httpx.Response) -> Any:
+        """Decode the JSON body of a response, or None if it has no body."""
+        if not response.content:
+            return None
+        return self.json_loads(response.content)
+
+    def _decode_error(self, response: httpx.Response) -> Any:
+        """Decode the body of an error response, or None if it is not JSON."""
+        try:
+            return self._decode(response)
+        except ValueError:
+            return None
+
     def _handle_response(self, response: httpx.Response) -> dict[str, Any] | list[Any]:
-        """Handle API response and raise appropriate exceptions."""
+        """Handle API response and raise appropriate exceptions.
+
+        The body is decoded exactly once, from the raw bytes.
+        """
         if response.status_code == 404:
-            raise PCONotFoundError("Resource not found", response_data=response.json() if response.content else None)
+            raise PCONotFoundError("Resource not found", response_data=self._decode_error(response))
         elif response.status_code == 429:
-            raise PCORateLimitError("Rate limit exceeded", response_data=response.json() if response.content else None)
+            raise PCORateLimitError(
+                "Rate limit exceeded", response_data=self._decode_error(response)
+            )
         elif response.status_code == 400:
-            error_data = response.json() if response.content else None
+            error_data = self._decode_error(response)
             message = "Validation error"
             if error_data and isinstance(error_data, dict):
                 message = error_data.get("error", message)
             raise PCOValidationError(message, response_data=error_data)
         elif not response.is_success:
-            error_data = response.json() if response.content else None
+            error_data = self._decode_error(response)
             message = f"API error: {response.status_code}"
             if error_data and isinstance(error_data, dict):
                 message = error_data.get("error", message)
             raise PCOAPIError(message, status_code=response.status_code, response_data=error_data)
 
-        if not response.content:
+        data = self._decode(response)
+        if data is None:
             return {}
+        return data
 
-        return response.json()
+    def add_hook(self, hook: Hook) -> None:
+        """Register a callable receiving a RequestEvent at every step of a request.
 
-    def _request(
+        Hooks run synchronously in the requesting thread, so keep them fast.
+        Exceptions raised by a hook are logged and otherwise ignored.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Hook) -> None:
+        """Unregister a hook."""
+        self._hooks.remove(hook)
+
+    def _emit(
+        self, kind: str, method: str, endpoint: str, started: float, attempt: int, **fields: Any
+    ) -> None:
+        """Send a request event to every hook."""
+        event = RequestEvent(
+            kind=kind,
+            method=method,
+            endpoint=endpoint,
+            template=endpoint_template(endpoint),
+            module=endpoint_module(endpoint),
+            attempt=attempt,
+            elapsed=time.monotonic() - started,
+            rate_limit_remaining=self.rate_limiter.remaining(),
+            **fields,
+        )
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception:
+                # Instrumentation must never change the outcome of a request
+                logger.exception("Request hook %r failed on %s event", hook, kind)
+
+    def _is_unauthorized(self, response: httpx.Response) -> bool:
+        """Whether a response is a 401 that refreshing the OAuth token could fix."""
+        return response.status_code == 401 and self.oauth_client is not None
+
+    def _reauthorize(self, response: httpx.Response, request_headers: dict[str, str]) -> bool:
+        """Refresh the OAuth token after a 401 so the request can be retried once."""
+        if not self._is_unauthorized(response):
+            return False
+        return self.oauth_client.refresh_after_unauthorized(request_headers.get("Authorization"))
+
+    def _record_outcome(self, status_code: int | None) -> None:
+        """Report the outcome of an attempt to the circuit breaker."""
+        if status_code is None or status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+    def _before_attempt(self, method: str, endpoint: str, started: float, attempt: int) -> bool:
+        """Ask the circuit breaker to admit an attempt; True for a half-open trial."""
+        try:
+            return self.circuit_breaker.before_request()
+        except PCOCircuitOpenError as e:
+            if self._hooks:
+                self._emit(ERROR, method, endpoint, started, attempt, error=e)
+            raise
+
+    def _attempt_delay(
+        self, method: str, endpoint: str, started: float, attempt: int, backoff: float
+    ) -> float:
+        """Reserve a rate limit slot and return how long to wait before sending."""
+        wait = self.rate_limiter.reserve()
+        if wait > backoff and self._hooks:
+            self._emit(RATE_LIMIT_WAIT, method, endpoint, started, attempt, wait=wait)
+        return max(backoff, wait)
+
+    def _prepare_attempt(
+        self,
+        request_headers: dict[str, str],
+        headers: dict[str, str] | None,
+        method: str,
+        endpoint: str,
+        started: float,
+        attempt: int,
+    ) -> dict[str, str]:
+        """Merge per-request headers into the auth headers and announce the attempt."""
+        if headers:
+            request_headers.update(headers)
+        if self._hooks:
+            self._emit(REQUEST, method, endpoint, started, attempt)
+        return request_headers
+
+    def _transport_error_delay(
+        self, error: httpx.TransportError, method: str, endpoint: str, started: float, attempt: int
+    ) -> float:
+        """Record a network failure and return the delay before retrying it.
+
+        Raises:
+            PCOAPIError: If the retry policy gives up
+        """
+        self._record_outcome(None)
+        retry_delay = self.retry_policy.get_delay(
+            method, attempt, time.monotonic() - started, error=error
+        )
+        if retry_delay is None:
+            if self._hooks:
+                self._emit(ERROR, method, endpoint, started, attempt, error=error)
+            raise PCOAPIError(f"Network error: {error}") from error
+        if self._hooks:
+            self._emit(RETRY, method, endpoint, started, attempt, wait=retry_delay, error=error)
+        return retry_delay
+
+    def _record_response(
+        self,
+        response: httpx.Response,
+        method: str,
+        endpoint: str,
+        started: float,
+        attempt: int,
+        sent: float,
+    ) -> None:
+        """Feed a response to the rate limiter and circuit breaker and announce it."""
+        self.rate_limiter.update(response.headers, response.status_code)
+        self._record_outcome(response.status_code)
+        if self._hooks:
+            self._emit(
+                RESPONSE,
+                method,
+                endpoint,
+                started,
+                attempt,
+                duration=time.monotonic() - sent,
+                status_code=response.status_code,
+                bytes=len(response.content),
+            )
+
+    def _response_delay(
+        self, response: httpx.Response, method: str, endpoint: str, started: float, attempt: int
+    ) -> float | None:
+        """Return the delay before retrying a response, or None to return it as is."""
+        retry_delay = self.retry_policy.get_delay(
+            method,
+            attempt,
+            time.monotonic() - started,
+            status_code=response.status_code,
+            retry_after=parse_retry_after(response.headers),
+        )
+        if retry_delay is None:
+            if self._hooks and response.status_code >= 400:
+                self._emit(
+                    ERROR, method, endpoint, started, attempt, status_code=response.status_code
+                )
+            return None
+        if self._hooks:
+            self._emit(
+                RETRY,
+                method,
+                endpoint,
+                started,
+                attempt,
+                wait=retry_delay,
+                status_code=response.status_code,
+            )
+        return retry_delay
+
+    def _cache_response(
+        self, key: str, entry: CacheEntry | None, response: httpx.Response
+    ) -> dict[str, Any] | list[Any]:
+        """Decode a GET response and store it in the cache.
+
+        A 304 answering an If-None-Match revalidation reuses the cached data
+        without reading a body.
+        """
+        if response.status_code == 304 and entry is not None:
+            data = entry.data
+            etag = response.headers.get("ETag") or entry.etag
+        else:
+            data = self._handle_response(response)
+            etag = response.headers.get("ETag")
+        self.cache.set(key, self.cache.entry(data, etag=etag))
+        return data
+
+    def _send(
         self,
         method: str,
         endpoint: str,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
-        retries: int = 0,
-    ) -> dict[str, Any] | list[Any]:
-        """Make HTTP request to PCO API with retry logic."""
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send HTTP request to PCO API, retrying according to the retry policy."""
         url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
+        started = time.monotonic()
+        backoff = 0.0
+        attempt = 0
+        reauthorized = False
 
-        try:
-            response = self._http_client.request(method, url, headers=headers, params=params, json=json)
-            return self._handle_response(response)
-        except PCORateLimitError as e:
-            if retries < self.MAX_RETRIES:
-                # Wait before retrying on rate limit
-                time.sleep(self.DEFAULT_RETRY_DELAY * (retries + 1))
-                return self._request(method, endpoint, params=params, json=json, retries=retries + 1)
-            raise e
-        except (httpx.TimeoutException, httpx.NetworkError) as e:
-            if retries < self.MAX_RETRIES:
-                time.sleep(self.DEFAULT_RETRY_DELAY * (retries + 1))
-                return self._request(method, endpoint, params=params, json=json, retries=retries + 1)
-            raise PCOAPIError(f"Network error: {e}") from e
+        while True:
+            trial = self._before_attempt(method, endpoint, started, attempt)
+            try:
+                delay = self._attempt_delay(method, endpoint, started, attempt, backoff)
+                if delay > 0:
+                    time.sleep(delay)
+                request_headers = self._prepare_attempt(
+                    self._get_headers(), headers, method, endpoint, started, attempt
+                )
+                sent = time.monotonic()
+                response = self._http_client.request(
+                    method, url, headers=request_headers, params=params, json=json
+                )
+            except httpx.TransportError as e:
+                retry_delay = self._transport_error_delay(e, method, endpoint, started, attempt)
+            except BaseException:
+                # Cancelled, or failed before reaching the API: free the trial slot
+                if trial:
+                    self.circuit_breaker.release_trial()
+                raise
+            else:
+                self._record_response(response, method, endpoint, started, attempt, sent)
+                if not reauthorized and self._reauthorize(response, request_headers):
+                    reauthorized = True
+                    continue
+                retry_delay = self._response_delay(response, method, endpoint, started, attempt)
+                if retry_delay is None:
+                    return response
+
+            backoff = retry_delay
+            attempt += 1
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """Make HTTP request to PCO API and decode the response."""
+        response = self._send(method, endpoint, params=params, json=json)
+        if self.cache is not None and method != "GET":
+            self.cache.invalidate(endpoint)
+        return self._handle_response(response)
 
     def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
-        """Make GET request."""
-        return self._request("GET", endpoint, params=params)
+        """Make GET request.
+
+        Served from the response cache when one is configured. With request
+        coalescing enabled, concurrent identical GETs share one request.
+        """
+        if self._single_flight is None:
+            return self._get(endpoint, params)
+        return self._single_flight.do(
+            cache_key(endpoint, params), lambda: self._get(endpoint, params)
+        )
+
+    def _get(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any] | list[Any]:
+        """Make GET request, served from the response cache when one is configured."""
+        if self.cache is None:
+            return self._request("GET", endpoint, params=params)
+
+        key = cache_key(endpoint, params)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            return entry.data
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        response = self._send("GET", endpoint, params=params, headers=headers)
+        return self._cache_response(key, entry, response)
 
     def post(self, endpoint: str, json: dict[str, Any] | None = None, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
         """Make POST request."""
@@ -175,8 +513,230 @@ class PCOClient:
         if self.oauth_client:
             self.oauth_client.close()
 
-    def __enter__(self) -> "PCOClient":
+    def __enter__(self) -> PCOClient:
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         self.close()
+
+
+class AsyncPCOClient(PCOClient):
+    """Asyncio client for interacting with Planning Center Online API.
+
+    Mirrors PCOClient, but every request method is a coroutine and the
+    module properties return async modules, so many requests can be kept
+    in flight from a single event loop. Takes the same arguments as
+    PCOClient; a custom ``http_client`` must be an httpx.AsyncClient.
+    """
+
+    SINGLE_FLIGHT_CLASS = AsyncSingleFlight
+
+    _people: AsyncPeopleModule | None
+    _services: AsyncServicesModule | None
+    _checkins: AsyncCheckInsModule | None
+    _giving: AsyncGivingModule | None
+    _resources: AsyncResourcesModule | None
+
+    def _create_http_client(self, limits: httpx.Limits, http2: bool) -> httpx.AsyncClient:
+        """Create the HTTP client used when none is given."""
+        return httpx.AsyncClient(timeout=self.timeout, limits=limits, http2=http2)
+
+    def _share_connections(self, oauth_client: OAuth2Client) -> None:
+        """Keep token requests on the OAuth client's own pool.
+
+        Token refreshes are blocking, so they cannot use an httpx.AsyncClient.
+        """
+
+    async def _get_headers_async(self) -> dict[str, str]:
+        """Get headers for API requests without blocking the event loop.
+
+        Token refreshes make a blocking HTTP request and may wait on the
+        token store's lock, so they run in a worker thread.
+        """
+        if self.oauth_client is not None and self.oauth_client.needs_refresh():
+            return await asyncio.to_thread(self._get_headers)
+        return self._get_headers()
+
+    async def _reauthorize_async(
+        self, response: httpx.Response, request_headers: dict[str, str]
+    ) -> bool:
+        """Refresh the OAuth token after a 401 in a worker thread (see ``_reauthorize``)."""
+        if not self._is_unauthorized(response):
+            return False
+        return await asyncio.to_thread(self._reauthorize, response, request_headers)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send HTTP request to PCO API, retrying according to the retry policy."""
+        url = f"{self.base_url}{endpoint}"
+        started = time.monotonic()
+        backoff = 0.0
+        attempt = 0
+        reauthorized = False
+
+        while True:
+            trial = self._before_attempt(method, endpoint, started, attempt)
+            try:
+                delay = self._attempt_delay(method, endpoint, started, attempt, backoff)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                request_headers = self._prepare_attempt(
+                    await self._get_headers_async(), headers, method, endpoint, started, attempt
+                )
+                sent = time.monotonic()
+                response = await self._http_client.request(
+                    method, url, headers=request_headers, params=params, json=json
+                )
+            except httpx.TransportError as e:
+                retry_delay = self._transport_error_delay(e, method, endpoint, started, attempt)
+            except BaseException:
+                # Cancelled, or failed before reaching the API: free the trial slot
+                if trial:
+                    self.circuit_breaker.release_trial()
+                raise
+            else:
+                self._record_response(response, method, endpoint, started, attempt, sent)
+                if not reauthorized and await self._reauthorize_async(response, request_headers):
+                    reauthorized = True
+                    continue
+                retry_delay = self._response_delay(response, method, endpoint, started, attempt)
+                if retry_delay is None:
+                    return response
+
+            backoff = retry_delay
+            attempt += 1
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """Make HTTP request to PCO API and decode the response."""
+        response = await self._send(method, endpoint, params=params, json=json)
+        if self.cache is not None and method != "GET":
+            self.cache.invalidate(endpoint)
+        return self._handle_response(response)
+
+    async def get(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any] | list[Any]:
+        """Make GET request.
+
+        Served from the response cache when one is configured. With request
+        coalescing enabled, concurrent identical GETs share one request.
+        """
+        if self._single_flight is None:
+            return await self._get(endpoint, params)
+        return await self._single_flight.do(
+            cache_key(endpoint, params), lambda: self._get(endpoint, params)
+        )
+
+    async def _get(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any] | list[Any]:
+        """Make GET request, served from the response cache when one is configured."""
+        if self.cache is None:
+            return await self._request("GET", endpoint, params=params)
+
+        key = cache_key(endpoint, params)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            return entry.data
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        response = await self._send("GET", endpoint, params=params, headers=headers)
+        return self._cache_response(key, entry, response)
+
+    async def post(
+        self,
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """Make POST request."""
+        return await self._request("POST", endpoint, params=params, json=json)
+
+    async def put(
+        self,
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """Make PUT request."""
+        return await self._request("PUT", endpoint, params=params, json=json)
+
+    async def patch(
+        self,
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """Make PATCH request."""
+        return await self._request("PATCH", endpoint, params=params, json=json)
+
+    async def delete(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any] | list[Any]:
+        """Make DELETE request."""
+        return await self._request("DELETE", endpoint, params=params)
+
+    @property
+    def people(self) -> AsyncPeopleModule:
+        """Access People API module."""
+        if self._people is None:
+            self._people = AsyncPeopleModule(self)
+        return self._people
+
+    @property
+    def services(self) -> AsyncServicesModule:
+        """Access Services API module."""
+        if self._services is None:
+            self._services = AsyncServicesModule(self)
+        return self._services
+
+    @property
+    def checkins(self) -> AsyncCheckInsModule:
+        """Access Check-Ins API module."""
+        if self._checkins is None:
+            self._checkins = AsyncCheckInsModule(self)
+        return self._checkins
+
+    @property
+    def giving(self) -> AsyncGivingModule:
+        """Access Giving API module."""
+        if self._giving is None:
+            self._giving = AsyncGivingModule(self)
+        return self._giving
+
+    @property
+    def resources(self) -> AsyncResourcesModule:
+        """Access Resources API module."""
+        if self._resources is None:
+            self._resources = AsyncResourcesModule(self)
+        return self._resources
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._http_client.aclose()
+        if self.oauth_client:
+            self.oauth_client.close()
+
+    def close(self) -> None:
+        """Not supported on the async client; use ``await aclose()``."""
+        raise TypeError("AsyncPCOClient must be closed with 'await client.aclose()'")
+
+    def __enter__(self) -> AsyncPCOClient:
+        raise TypeError("Use 'async with' with AsyncPCOClient")
+
+    async def __aenter__(self) -> AsyncPCOClient:
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
@@ -43,3 +43,19 @@ class PCOValidationError(PCOAPIError):
 
     def __init__(self, message: str, response_data: dict | None = None):
         super().__init__(message, status_code=400, response_data=response_data)
+
+
+class PCOCircuitOpenError(PCOAPIError):
+    """Exception raised when requests are short-circuited because the API is failing."""
+
+    def __init__(self, message: str = "Circuit breaker is open", retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class PCOWebhookError(PCOError):
+    """Exception raised for webhook deliveries that fail verification or parsing."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
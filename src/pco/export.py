@@ -0,0 +1,208 @@
+"""Streaming export of PCO records to JSONL and CSV files."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from typing import IO, Any, Union
+
+from pco.models import PCORecord
+
+ExportTarget = Union[str, "os.PathLike[str]", IO[str]]
+RecordLike = Union[dict[str, Any], PCORecord]
+
+
+def _raw(record: RecordLike) -> dict[str, Any]:
+    """Get the resource dict behind a record."""
+    return record.raw if isinstance(record, PCORecord) else record
+
+
+class _ExportWriter(ABC):
+    """Base class for writers that stream records to a text file."""
+
+    def __init__(self, target: ExportTarget, compress: bool | None = None):
+        """Initialize writer.
+
+        Args:
+            target: File path, or an open text file (left open on close)
+            compress: Gzip the output; defaults to True for paths ending in ``.gz``
+        """
+        self.count = 0
+        if isinstance(target, (str, os.PathLike)):
+            path = os.fspath(target)
+            if compress is None:
+                compress = path.endswith(".gz")
+            if compress:
+                self._file: IO[str] = gzip.open(path, "wt", encoding="utf-8", newline="")
+            else:
+                self._file = open(path, "w", encoding="utf-8", newline="")
+            self._owns_file = True
+        else:
+            if compress:
+                raise ValueError("compress is only supported when exporting to a path")
+            self._file = target
+            self._owns_file = False
+
+    @abstractmethod
+    def write(self, record: RecordLike) -> None:
+        """Write one record."""
+
+    def write_all(self, records: Iterable[RecordLike]) -> int:
+        """Write every record of an iterable as it is produced.
+
+        Returns:
+            Number of records written
+        """
+        for record in records:
+            self.write(record)
+        return self.count
+
+    def close(self) -> None:
+        """Flush the output and close it if it was opened by the writer."""
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> _ExportWriter:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+class JSONLWriter(_ExportWriter):
+    """Writes records as JSON lines, one resource object per line."""
+
+    def __init__(
+        self,
+        target: ExportTarget,
+        fields: Sequence[str] | None = None,
+        compress: bool | None = None,
+    ):
+        """Initialize JSONL writer.
+
+        Args:
+            target: File path, or an open text file (left open on close)
+            fields: Attributes to keep; all attributes are kept by default
+            compress: Gzip the output; defaults to True for paths ending in ``.gz``
+        """
+        super().__init__(target, compress=compress)
+        self.fields = list(fields) if fields is not None else None
+
+    def write(self, record: RecordLike) -> None:
+        """Write one record."""
+        raw = _raw(record)
+        if self.fields is not None:
+            attributes = raw.get("attributes") or {}
+            raw = {
+                "id": raw.get("id"),
+                "type": raw.get("type"),
+                "attributes": {name: attributes.get(name) for name in self.fields},
+            }
+        self._file.write(json.dumps(raw, separators=(",", ":"), default=str))
+        self._file.write("\n")
+        self.count += 1
+
+
+class CSVWriter(_ExportWriter):
+    """Writes records as CSV rows of ``id`` followed by selected attributes.
+
+    Nested values (lists and objects) are written as JSON.
+    """
+
+    def __init__(
+        self,
+        target: ExportTarget,
+        columns: Sequence[str] | None = None,
+        compress: bool | None = None,
+    ):
+        """Initialize CSV writer.
+
+        Args:
+            target: File path, or an open text file (left open on close)
+            columns: Attributes to write; defaults to the attributes of the first record
+            compress: Gzip the output; defaults to True for paths ending in ``.gz``
+        """
+        super().__init__(target, compress=compress)
+        self.columns = list(columns) if columns is not None else None
+        self._writer = csv.writer(self._file)
+        self._header_written = False
+
+    def _write_header(self, raw: dict[str, Any]) -> None:
+        if self.columns is None:
+            self.columns = list(raw.get("attributes") or {})
+        self._writer.writerow(["id", *(column for column in self.columns if column != "id")])
+        self._header_written = True
+
+    def write(self, record: RecordLike) -> None:
+        """Write one record."""
+        raw = _raw(record)
+        if not self._header_written:
+            self._write_header(raw)
+        attributes = raw.get("attributes") or {}
+        row = [raw.get("id")]
+        for column in self.columns:
+            if column == "id":
+                continue
+            value = raw.get("type") if column == "type" else attributes.get(column)
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value, separators=(",", ":"), default=str)
+            row.append(value)
+        self._writer.writerow(row)
+        self.count += 1
+
+    def close(self) -> None:
+        """Write the header if no records were written, then close."""
+        if not self._header_written and self.columns is not None:
+            self._write_header({})
+        super().close()
+
+
+def export_jsonl(
+    records: Iterable[RecordLike],
+    target: ExportTarget,
+    fields: Sequence[str] | None = None,
+    compress: bool | None = None,
+) -> int:
+    """Stream records to a JSON lines file.
+
+    Records are written as they are produced, so passing an ``iter_*``
+    generator exports a whole collection with one page in memory.
+
+    Args:
+        records: Records to export (e.g., ``client.people.iter_people(per_page=100)``)
+        target: File path, or an open text file
+        fields: Attributes to keep; all attributes are kept by default
+        compress: Gzip the output; defaults to True for paths ending in ``.gz``
+
+    Returns:
+        Number of records written
+    """
+    with JSONLWriter(target, fields=fields, compress=compress) as writer:
+        return writer.write_all(records)
+
+
+def export_csv(
+    records: Iterable[RecordLike],
+    target: ExportTarget,
+    columns: Sequence[str] | None = None,
+    compress: bool | None = None,
+) -> int:
+    """Stream records to a CSV file.
+
+    Args:
+        records: Records to export (e.g., ``client.giving.iter_donations(per_page=100)``)
+        target: File path, or an open text file
+        columns: Attributes to write; defaults to the attributes of the first record
+        compress: Gzip the output; defaults to True for paths ending in ``.gz``
+
+    Returns:
+        Number of records written
+    """
+    with CSVWriter(target, columns=columns, compress=compress) as writer:
+        return writer.write_all(records)
@@ -0,0 +1,70 @@
+"""Request lifecycle events for instrumenting PCO clients."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+
+REQUEST = "request"
+RESPONSE = "response"
+RETRY = "retry"
+RATE_LIMIT_WAIT = "rate_limit_wait"
+ERROR = "error"
+
+EVENT_KINDS = (REQUEST, RESPONSE, RETRY, RATE_LIMIT_WAIT, ERROR)
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F-]{27})$")
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """Replace the resource IDs of an endpoint path with ``{id}``.
+
+    Example:
+        ``/people/v2/people/123/emails`` becomes ``/people/v2/people/{id}/emails``
+    """
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in endpoint.split("/")
+    )
+
+
+def endpoint_module(endpoint: str) -> str:
+    """Name of the PCO product an endpoint belongs to (e.g., 'people', 'giving')."""
+    return endpoint.lstrip("/").split("/", 1)[0]
+
+
+@dataclass
+class RequestEvent:
+    """Something that happened while a client sent a request.
+
+    ``kind`` is one of:
+
+    - ``request``: an attempt is about to be sent
+    - ``response``: an attempt got a response (``status_code``, ``bytes``, ``duration``)
+    - ``retry``: the attempt will be retried after ``wait`` seconds
+    - ``rate_limit_wait``: the rate limiter delays the attempt by ``wait`` seconds
+    - ``error``: the request failed for good (``status_code`` or ``error``)
+
+    ``elapsed`` is measured from the start of the first attempt and
+    ``rate_limit_remaining`` is the client's rate limit budget when the
+    event fired.
+    """
+
+    kind: str
+    method: str
+    endpoint: str
+    template: str
+    module: str
+    attempt: int
+    elapsed: float
+    rate_limit_remaining: int
+    duration: float | None = None
+    status_code: int | None = None
+    bytes: int | None = None
+    wait: float | None = None
+    error: BaseException | None = None
+
+
+Hook = Callable[[RequestEvent], None]
@@ -0,0 +1,30 @@
+"""JSON decoding for PCO API responses.
+
+``orjson`` is used when it is installed and the standard library otherwise.
+Any callable taking the raw response bytes can be plugged into the clients
+instead.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JSONLoads = Callable[[bytes], Any]
+
+
+def stdlib_loads(content: bytes) -> Any:
+    """Decode JSON bytes with the standard library."""
+    return json.loads(content)
+
+
+if orjson is not None:
+    loads: JSONLoads = orjson.loads
+else:  # pragma: no cover - depends on the environment
+    loads = stdlib_loads
@@ -0,0 +1,118 @@
+"""In-process metrics for PCO clients."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import defaultdict, deque
+from typing import Any
+
+from pco.hooks import ERROR, RATE_LIMIT_WAIT, REQUEST, RESPONSE, RETRY, RequestEvent
+
+
+def percentile(samples: list[float], q: float) -> float | None:
+    """Nearest-rank percentile of sorted samples, or None if there are none."""
+    if not samples:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(samples)))
+    return samples[rank - 1]
+
+
+COUNTERS = (
+    "requests",
+    "responses",
+    "retries",
+    "rate_limit_waits",
+    "rate_limit_wait_seconds",
+    "errors",
+    "bytes",
+)
+
+
+class _ModuleMetrics:
+    """Counters and recent latencies of one module."""
+
+    def __init__(self, max_samples: int):
+        self.counters: dict[str, float] = dict.fromkeys(COUNTERS, 0)
+        self.statuses: dict[str, int] = defaultdict(int)
+        self.latencies: deque[float] = deque(maxlen=max_samples)
+
+    def snapshot(self) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+        return {
+            **self.counters,
+            "statuses": dict(self.statuses),
+            "latency": {
+                "count": len(latencies),
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+            },
+        }
+
+
+class MetricsCollector:
+    """Hook aggregating request events into per-module metrics.
+
+    Counts requests, responses by status class, retries, rate limit waits
+    (and the seconds spent in them), errors and response bytes, and keeps
+    the latencies of the most recent ``max_samples`` responses of every
+    module for p50/p95/p99. Register it with ``PCOClient(hooks=[collector])``
+    or ``client.add_hook(collector)``; one collector can serve many clients.
+    """
+
+    DEFAULT_MAX_SAMPLES = 10_000
+
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES):
+        """Initialize metrics collector.
+
+        Args:
+            max_samples: Number of recent latencies kept per module
+        """
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._modules: dict[str, _ModuleMetrics] = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._modules.get(event.module)
+            if metrics is None:
+                metrics = self._modules[event.module] = _ModuleMetrics(self.max_samples)
+            counters = metrics.counters
+            if event.kind == REQUEST:
+                counters["requests"] += 1
+            elif event.kind == RESPONSE:
+                counters["responses"] += 1
+                counters["bytes"] += event.bytes or 0
+                metrics.statuses[f"{event.status_code // 100}xx"] += 1
+                if event.duration is not None:
+                    metrics.latencies.append(event.duration)
+            elif event.kind == RETRY:
+                counters["retries"] += 1
+            elif event.kind == RATE_LIMIT_WAIT:
+                counters["rate_limit_waits"] += 1
+                counters["rate_limit_wait_seconds"] += event.wait or 0.0
+            elif event.kind == ERROR:
+                counters["errors"] += 1
+
+    def latency_percentile(self, module: str, q: float) -> float | None:
+        """Percentile of a module's recent response latencies, in seconds."""
+        with self._lock:
+            metrics = self._modules.get(module)
+            return percentile(sorted(metrics.latencies), q) if metrics else None
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Current metrics keyed by module.
+
+        Returns:
+            Per module: counters (requests, responses, retries, rate_limit_waits,
+            rate_limit_wait_seconds, errors, bytes), response counts by status
+            class, and latency count and p50/p95/p99 in seconds
+        """
+        with self._lock:
+            return {module: metrics.snapshot() for module, metrics in self._modules.items()}
+
+    def reset(self) -> None:
+        """Discard all metrics."""
+        with self._lock:
+            self._modules.clear()
@@ -0,0 +1,311 @@
+"""Local SQLite mirror of PCO collections for fast reporting queries."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from pco.pagination import MAX_PER_PAGE, page_records
+
+if TYPE_CHECKING:
+    from pco.client import PCOClient
+
+
+@dataclass(frozen=True)
+class MirrorTable:
+    """Layout of one mirrored resource type.
+
+    Every table stores the resource ``id`` and its full ``attributes`` as
+    JSON. ``columns`` are attributes copied into their own indexed columns,
+    and ``foreign_keys`` maps to-one relationship names to indexed ID
+    columns (e.g., ``{"person": "person_id"}``).
+
+    Tables with a ``module`` and ``resource`` are filled by paginating that
+    collection; the others are filled from the ``included`` resources of
+    other tables (see ``include``).
+    """
+
+    name: str
+    resource_type: str
+    module: str | None = None
+    resource: str | None = None
+    columns: tuple[str, ...] = ()
+    foreign_keys: dict[str, str] = field(default_factory=dict)
+    include: tuple[str, ...] = ()
+
+    def schema(self) -> list[str]:
+        """SQL statements creating the table and its indexes."""
+        definitions = ["id TEXT PRIMARY KEY", "attributes TEXT NOT NULL"]
+        definitions += list(self.columns)
+        definitions += [f"{column} TEXT" for column in self.foreign_keys.values()]
+        statements = [f"CREATE TABLE IF NOT EXISTS {self.name} ({', '.join(definitions)})"]
+        for column in (*self.columns, *self.foreign_keys.values()):
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {self.name}_{column} ON {self.name} ({column})"
+            )
+        return statements
+
+    def row(self, record: dict[str, Any]) -> tuple[Any, ...]:
+        """Convert a resource object into a row of the table."""
+        attributes = record.get("attributes") or {}
+        relationships = record.get("relationships") or {}
+        values: list[Any] = [str(record["id"]), json.dumps(attributes)]
+        for column in self.columns:
+            value = attributes.get(column)
+            values.append(json.dumps(value) if isinstance(value, (dict, list)) else value)
+        for relationship in self.foreign_keys:
+            linkage = (relationships.get(relationship) or {}).get("data")
+            values.append(
+                str(linkage["id"])
+                if isinstance(linkage, dict) and linkage.get("id") is not None
+                else None
+            )
+        return tuple(values)
+
+    def upsert_sql(self) -> str:
+        """SQL statement inserting or replacing one row."""
+        columns = ["id", "attributes", *self.columns, *self.foreign_keys.values()]
+        placeholders = ", ".join("?" for _ in columns)
+        return f"INSERT OR REPLACE INTO {self.name} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+DEFAULT_TABLES: tuple[MirrorTable, ...] = (
+    MirrorTable(
+        "people",
+        "Person",
+        module="people",
+        resource="people",
+        columns=("first_name", "last_name", "status", "created_at", "updated_at"),
+        foreign_keys={"primary_campus": "primary_campus_id"},
+        include=("households",),
+    ),
+    MirrorTable(
+        "households",
+        "Household",
+        module="people",
+        resource="households",
+        columns=("name", "member_count", "created_at", "updated_at"),
+        foreign_keys={"primary_contact": "primary_contact_id"},
+    ),
+    MirrorTable(
+        "plans",
+        "Plan",
+        module="services",
+        resource="plans",
+        columns=("title", "series_title", "sort_date", "created_at", "updated_at"),
+        foreign_keys={"service_type": "service_type_id"},
+    ),
+    MirrorTable(
+        "funds",
+        "Fund",
+        module="giving",
+        resource="funds",
+        columns=("name", "created_at", "updated_at"),
+    ),
+    MirrorTable(
+        "donations",
+        "Donation",
+        module="giving",
+        resource="donations",
+        columns=("amount_cents", "payment_method", "received_at", "created_at", "updated_at"),
+        foreign_keys={"person": "person_id", "batch": "batch_id"},
+        include=("designations",),
+    ),
+    MirrorTable(
+        "designations",
+        "Designation",
+        columns=("amount_cents",),
+        foreign_keys={"fund": "fund_id"},
+    ),
+    MirrorTable(
+        "resource_items",
+        "Resource",
+        module="resources",
+        resource="items",
+        columns=("name", "kind", "created_at", "updated_at"),
+    ),
+)
+
+
+class Mirror:
+    """Materializes PCO collections into a local SQLite database.
+
+    Besides the per-type tables, every relationship linkage (to-one and
+    to-many) is stored in the ``links`` table, indexed in both directions,
+    so reports can join across resources without calling the API:
+
+        mirror = Mirror("pco.db")
+        mirror.refresh(client)
+        mirror.query(
+            "SELECT d.person_id, SUM(g.amount_cents) FROM donations d "
+            "JOIN links l ON l.source_table = 'donations' AND l.source_id = d.id "
+            "AND l.relationship = 'designations' "
+            "JOIN designations g ON g.id = l.target_id "
+            "WHERE g.fund_id = ? AND d.received_at >= ? GROUP BY d.person_id",
+            ("42", "2024-01-01"),
+        )
+    """
+
+    _LINKS_SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS links (
+            source_table TEXT NOT NULL,
+            source_id TEXT NOT NULL,
+            relationship TEXT NOT NULL,
+            target_type TEXT NOT NULL,
+            target_id TEXT NOT NULL,
+            PRIMARY KEY (source_table, source_id, relationship, target_type, target_id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS links_target ON links (target_type, target_id, relationship)",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = ":memory:",
+        tables: Iterable[MirrorTable] = DEFAULT_TABLES,
+    ):
+        """Initialize mirror.
+
+        Args:
+            path: Path of the database file (created if missing), or ':memory:'
+            tables: Layout of the mirrored resource types
+        """
+        self.path = os.fspath(path)
+        self.tables = {table.name: table for table in tables}
+        self._by_type = {table.resource_type: table for table in self.tables.values()}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        for statement in self._LINKS_SCHEMA:
+            self._conn.execute(statement)
+        for table in self.tables.values():
+            for statement in table.schema():
+                self._conn.execute(statement)
+
+    def _write(self, table: MirrorTable, record: dict[str, Any]) -> None:
+        """Insert or replace one record and its relationship links."""
+        record_id = str(record["id"])
+        self._conn.execute(table.upsert_sql(), table.row(record))
+        self._conn.execute(
+            "DELETE FROM links WHERE source_table = ? AND source_id = ?", (table.name, record_id)
+        )
+        links = []
+        for name, relationship in (record.get("relationships") or {}).items():
+            linkage = relationship.get("data") if isinstance(relationship, dict) else None
+            refs = (
+                linkage
+                if isinstance(linkage, list)
+                else [linkage]
+                if isinstance(linkage, dict)
+                else []
+            )
+            links.extend(
+                (table.name, record_id, name, ref.get("type"), str(ref.get("id")))
+                for ref in refs
+                if ref.get("id") is not None
+            )
+        if links:
+            self._conn.executemany("INSERT OR IGNORE INTO links VALUES (?, ?, ?, ?, ?)", links)
+
+    def upsert(
+        self, table: str, records: Iterable[dict[str, Any]], included: Iterable[dict[str, Any]] = ()
+    ) -> int:
+        """Insert or replace records in one transaction.
+
+        Args:
+            table: Table the records belong to
+            records: Resource objects
+            included: Included resources, stored in the table of their type if mirrored
+
+        Returns:
+            Number of records written to ``table``
+        """
+        layout = self.tables[table]
+        count = 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for record in records:
+                    self._write(layout, record)
+                    count += 1
+                for resource in included:
+                    included_layout = self._by_type.get(resource.get("type"))
+                    if included_layout is not None:
+                        self._write(included_layout, resource)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return count
+
+    def upsert_page(self, table: str, page: dict[str, Any] | list[Any]) -> int:
+        """Insert or replace the records and included resources of a response page."""
+        included = (page.get("included") or []) if isinstance(page, dict) else []
+        return self.upsert(table, page_records(page), included)
+
+    def refresh(
+        self,
+        client: PCOClient,
+        tables: Iterable[str] | None = None,
+        per_page: int = MAX_PER_PAGE,
+        concurrency: int = 1,
+    ) -> dict[str, int]:
+        """Pull collections from the API into the mirror.
+
+        Each page is written in its own transaction as it arrives.
+
+        Args:
+            client: Synchronous client to read with
+            tables: Tables to refresh (defaults to every table with a source collection)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight per collection
+
+        Returns:
+            Number of records written per table
+        """
+        names = (
+            list(tables)
+            if tables is not None
+            else [name for name, table in self.tables.items() if table.module]
+        )
+        counts: dict[str, int] = {}
+        for name in names:
+            table = self.tables[name]
+            if not table.module or not table.resource:
+                raise ValueError(f"Table {name!r} has no source collection")
+            module = getattr(client, table.module)
+            params = {"include": ",".join(table.include)} if table.include else None
+            counts[name] = 0
+            for page in module.iter_pages(
+                table.resource, params=params, per_page=per_page, concurrency=concurrency
+            ):
+                counts[name] += self.upsert_page(name, page)
+        return counts
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> list[sqlite3.Row]:
+        """Run a read query against the mirror."""
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def count(self, table: str) -> int:
+        """Number of records in a table."""
+        (count,) = self.query(f"SELECT COUNT(*) FROM {self.tables[table].name}")[0]
+        return count
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> Mirror:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -1,38 +1,117 @@
 """Pydantic models for PCO API requests and responses."""
 
+from __future__ import annotations
+
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Any
+from functools import cache
+from typing import Any, TypeVar, Union
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
 
-from pydantic import BaseModel, Field
+from pco.pagination import page_records
 
 
 class PCOData(BaseModel):
     """Base model for PCO API data objects."""
 
+    model_config = ConfigDict(extra="allow")
+
     id: str
     type: str
     attributes: dict[str, Any] = Field(default_factory=dict)
     relationships: dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        extra = "allow"
+
+RelatedData = Union[PCOData, list[PCOData], None]
+
+
+class IncludedIndex:
+    """Index of JSON:API included resources keyed by ``(type, id)``.
+
+    Built once per response, so resolving relationships costs one dict
+    lookup per linkage instead of a scan of ``included``.
+    """
+
+    def __init__(self, included: Iterable[PCOData]):
+        self._resources: dict[tuple[str, str], PCOData] = {
+            (item.type, item.id): item for item in included
+        }
+
+    def get(self, resource_type: str, resource_id: str) -> PCOData | None:
+        """Get an included resource by type and ID."""
+        return self._resources.get((resource_type, resource_id))
+
+    def resolve(self, record: PCOData) -> dict[str, RelatedData]:
+        """Materialize the related objects of a record.
+
+        To-one relationships resolve to the included object (or None if it
+        was not included); to-many relationships resolve to the list of
+        included objects.
+        """
+        related: dict[str, RelatedData] = {}
+        for name, relationship in record.relationships.items():
+            linkage = relationship.get("data") if isinstance(relationship, dict) else None
+            if isinstance(linkage, list):
+                items = (self._resources.get((ref.get("type"), ref.get("id"))) for ref in linkage)
+                related[name] = [item for item in items if item is not None]
+            elif isinstance(linkage, dict):
+                related[name] = self._resources.get((linkage.get("type"), linkage.get("id")))
+            else:
+                related[name] = None
+        return related
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._resources
 
 
 class PCOResponse(BaseModel):
     """Base model for PCO API responses."""
 
+    model_config = ConfigDict(extra="allow")
+
     data: PCOData | list[PCOData] | None = None
     included: list[PCOData] = Field(default_factory=list)
     meta: dict[str, Any] = Field(default_factory=dict)
     links: dict[str, str] = Field(default_factory=dict)
 
-    class Config:
-        extra = "allow"
+    _included_index: IncludedIndex | None = PrivateAttr(default=None)
+
+    @property
+    def records(self) -> list[PCOData]:
+        """Primary data as a list."""
+        if self.data is None:
+            return []
+        if isinstance(self.data, list):
+            return self.data
+        return [self.data]
+
+    @property
+    def included_index(self) -> IncludedIndex:
+        """Index of the included resources, built on first access."""
+        if self._included_index is None:
+            self._included_index = IncludedIndex(self.included)
+        return self._included_index
+
+    def resolve_relationships(self) -> list[dict[str, RelatedData]]:
+        """Materialize the related objects of every record in the response.
+
+        Returns:
+            One mapping of relationship name to related object(s) per record,
+            in the order of ``records``
+        """
+        index = self.included_index
+        return [index.resolve(record) for record in self.records]
 
 
 class PCOPerson(BaseModel):
     """Model for PCO Person resource."""
 
+    model_config = ConfigDict(extra="allow")
+
     id: str
     first_name: str | None = None
     last_name: str | None = None
@@ -45,25 +124,23 @@ class PCOPerson(BaseModel):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    class Config:
-        extra = "allow"
-
 
 class PCOHousehold(BaseModel):
     """Model for PCO Household resource."""
 
+    model_config = ConfigDict(extra="allow")
+
     id: str
     name: str | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    class Config:
-        extra = "allow"
-
 
 class PCOServicePlan(BaseModel):
     """Model for PCO Service Plan resource."""
 
+    model_config = ConfigDict(extra="allow")
+
     id: str
     series_title: str | None = None
     title: str | None = None
@@ -71,13 +148,12 @@ class PCOServicePlan(BaseModel):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    class Config:
-        extra = "allow"
-
 
 class PCOCheckInEvent(BaseModel):
     """Model for PCO Check-In Event resource."""
 
+    model_config = ConfigDict(extra="allow")
+
     id: str
     name: str | None = None
     starts_at: datetime | None = None
@@ -85,32 +161,188 @@ class PCOCheckInEvent(BaseModel):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    class Config:
-        extra = "allow"
-
 
 class PCOGivingFund(BaseModel):
     """Model for PCO Giving Fund resource."""
 
+    model_config = ConfigDict(extra="allow")
+
     id: str
     name: str | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    class Config:
-        extra = "allow"
-
 
 class PCOResourceItem(BaseModel):
     """Model for PCO Resource Item resource."""
 
+    model_config = ConfigDict(extra="allow")
+
     id: str
     name: str | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    class Config:
-        extra = "allow"
+
+@cache
+def type_adapter(tp: Any) -> TypeAdapter:
+    """Get a TypeAdapter for a type, built once per type."""
+    return TypeAdapter(tp)
+
+
+class PCORecord:
+    """Lightweight read-only view over a raw JSON:API resource object.
+
+    Wraps the decoded dict without copying or validating it. Attributes are
+    looked up on access (``record.first_name`` or ``record.get("first_name")``),
+    so reading a couple of fields from a large page costs almost nothing.
+
+    Without a model, attribute access returns the raw, unvalidated JSON value
+    and only ``get(..., as_type=...)`` converts it. Given a model (e.g.
+    PCOPerson), each attribute that is a field of the model is validated
+    against the field's annotation when it is read.
+    """
+
+    __slots__ = ("raw", "model")
+
+    def __init__(self, raw: dict[str, Any], model: type[BaseModel] | None = None):
+        """Initialize record view.
+
+        Args:
+            raw: Decoded resource object
+            model: Model whose field annotations validate attributes on access
+        """
+        self.raw = raw
+        self.model = model
+
+    @property
+    def id(self) -> str:
+        """Resource ID."""
+        value = self.raw.get("id")
+        if value is None:
+            raise ValueError("Resource object has no id")
+        return str(value)
+
+    @property
+    def type(self) -> str:
+        """Resource type."""
+        value = self.raw.get("type")
+        if value is None:
+            raise ValueError("Resource object has no type")
+        return str(value)
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Raw attributes of the resource."""
+        return self.raw.get("attributes") or {}
+
+    @property
+    def relationships(self) -> dict[str, Any]:
+        """Raw relationships of the resource."""
+        return self.raw.get("relationships") or {}
+
+    def get(self, name: str, default: Any = None, as_type: Any = None) -> Any:
+        """Get an attribute, optionally validated as a type.
+
+        Args:
+            name: Attribute name
+            default: Value returned when the attribute is absent
+            as_type: Type to validate the value as (e.g., datetime); defaults
+                to the model's annotation for the attribute, if any
+
+        Returns:
+            The attribute value
+        """
+        attributes = self.attributes
+        if name not in attributes:
+            return default
+        return self._validate(name, attributes[name], as_type)
+
+    def _validate(self, name: str, value: Any, as_type: Any) -> Any:
+        """Validate an attribute value as a type or the model's annotation for it."""
+        if as_type is None and self.model is not None:
+            field = self.model.model_fields.get(name)
+            as_type = field.annotation if field is not None else None
+        if as_type is None or value is None:
+            return value
+        return type_adapter(as_type).validate_python(value)
+
+    def related(self, name: str) -> dict[str, Any] | list[dict[str, Any]] | None:
+        """Get the resource linkage (type and id) of a relationship."""
+        relationship = self.relationships.get(name)
+        if not isinstance(relationship, dict):
+            return None
+        return relationship.get("data")
+
+    def to_data(self) -> PCOData:
+        """Validate the full resource object into a PCOData model."""
+        return PCOData.model_validate(self.raw)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name in self.__slots__:
+            raise AttributeError(name)
+        attributes = self.raw.get("attributes")
+        if attributes and name in attributes:
+            return self._validate(name, attributes[name], None)
+        raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PCORecord):
+            return self.raw == other.raw
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PCORecord(type={self.raw.get('type')!r}, id={self.raw.get('id')!r})"
+
+
+def parse_records(
+    response: dict[str, Any] | list[Any], model: type[BaseModel] | None = None
+) -> list[PCORecord]:
+    """Wrap the primary data of a decoded response in lazy record views.
+
+    Args:
+        response: Decoded response
+        model: Model validating attributes on access (see PCORecord)
+
+    Returns:
+        One record view per resource object
+    """
+    return [PCORecord(record, model) for record in page_records(response)]
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def flatten_record(record: dict[str, Any] | PCOData | PCORecord) -> dict[str, Any]:
+    """Flatten a resource object into its attributes plus ``id``."""
+    if isinstance(record, PCORecord):
+        record = record.raw
+    elif isinstance(record, PCOData):
+        return {**record.attributes, "id": record.id}
+    return {**(record.get("attributes") or {}), "id": record.get("id")}
+
+
+def to_models(
+    records: dict[str, Any] | Iterable[dict[str, Any] | PCOData | PCORecord],
+    model: type[ModelT],
+) -> list[ModelT]:
+    """Convert a page of resource objects into typed models.
+
+    The whole page is validated in one call through a ``list[model]``
+    TypeAdapter that is built once per model.
+
+    Args:
+        records: A decoded response, or resource objects (dicts, PCOData or PCORecord)
+        model: Model to convert to (e.g., PCOPerson)
+
+    Returns:
+        One model instance per record
+    """
+    if isinstance(records, dict):
+        records = page_records(records)
+    return type_adapter(list[model]).validate_python([flatten_record(record) for record in records])
 
 
 def parse_pco_response(response: dict[str, Any] | list[Any]) -> PCOResponse:
@@ -1,13 +1,22 @@
 """PCO API modules."""
 
-from pco.modules.checkins import CheckInsModule
-from pco.modules.giving import GivingModule
-from pco.modules.people import PeopleModule
-from pco.modules.resources import ResourcesModule
-from pco.modules.services import ServicesModule
+from pco.modules.base import BulkItemResult, BulkResult, GetManyResult
+from pco.modules.checkins import AsyncCheckInsModule, CheckInsModule
+from pco.modules.giving import AsyncGivingModule, GivingModule
+from pco.modules.people import AsyncPeopleModule, PeopleModule
+from pco.modules.resources import AsyncResourcesModule, ResourcesModule
+from pco.modules.services import AsyncServicesModule, ServicesModule
 
 __all__ = [
+    "AsyncCheckInsModule",
+    "AsyncGivingModule",
+    "AsyncPeopleModule",
+    "AsyncResourcesModule",
+    "AsyncServicesModule",
     "CheckInsModule",
+    "BulkItemResult",
+    "BulkResult",
+    "GetManyResult",
     "GivingModule",
     "PeopleModule",
     "ResourcesModule",
@@ -1,12 +1,194 @@
 """Base module class for PCO API modules."""
 
-from typing import Any
+from __future__ import annotations
 
-from pco.client import PCOClient
+import asyncio
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from pco.exceptions import PCOAPIError, PCOValidationError
+from pco.pagination import (
+    MAX_PER_PAGE,
+    next_page_params,
+    page_params,
+    page_records,
+    remaining_page_params,
+)
+from pco.query import Query
+from pco.schema import Fields, ResourceSchema, query_params
+
+if TYPE_CHECKING:
+    from pco.client import AsyncPCOClient, PCOClient
+
+
+@dataclass
+class GetManyResult:
+    """Records fetched by ID with ``get_many``."""
+
+    found: dict[str, dict[str, Any]] = field(default_factory=dict)
+    missing: list[str] = field(default_factory=list)
+
+
+def _id_chunks(ids: Iterable[str | int], chunk_size: int) -> tuple[list[str], list[list[str]]]:
+    """Deduplicate IDs, preserving order, and split them into chunks."""
+    if not 1 <= chunk_size <= MAX_PER_PAGE:
+        raise ValueError(f"chunk_size must be between 1 and {MAX_PER_PAGE}")
+    unique = list(dict.fromkeys(str(resource_id) for resource_id in ids))
+    return unique, [unique[i : i + chunk_size] for i in range(0, len(unique), chunk_size)]
+
+
+def _collect_many(
+    unique: list[str], chunk_records: Iterable[list[dict[str, Any]]]
+) -> GetManyResult:
+    """Key fetched records by ID and report the requested IDs that were not returned."""
+    requested = set(unique)
+    found = {
+        record["id"]: record
+        for records in chunk_records
+        for record in records
+        if isinstance(record, dict) and record.get("id") in requested
+    }
+    return GetManyResult(
+        found=found, missing=[resource_id for resource_id in unique if resource_id not in found]
+    )
+
+
+@dataclass
+class BulkItemResult:
+    """Outcome of one item of a bulk operation."""
+
+    index: int
+    item: Any
+    response: dict[str, Any] | None = None
+    error: PCOAPIError | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item's request succeeded."""
+        return self.error is None
+
+
+@dataclass
+class BulkResult:
+    """Report of a bulk create, update or delete.
+
+    ``succeeded`` and ``failed`` are ordered by the item's position in the
+    input. ``skipped`` holds the items that were not sent because the error
+    threshold was reached (``stopped``).
+    """
+
+    succeeded: list[BulkItemResult] = field(default_factory=list)
+    failed: list[BulkItemResult] = field(default_factory=list)
+    skipped: list[Any] = field(default_factory=list)
+    stopped: bool = False
+
+    @property
+    def validation_errors(self) -> list[BulkItemResult]:
+        """Failed items the API rejected as invalid."""
+        return [result for result in self.failed if isinstance(result.error, PCOValidationError)]
+
+    def _record(self, result: BulkItemResult, max_errors: int | None) -> None:
+        if result.ok:
+            self.succeeded.append(result)
+            return
+        self.failed.append(result)
+        if max_errors is not None and len(self.failed) >= max_errors:
+            self.stopped = True
+
+    def _finish(self, remaining: Iterator[tuple[int, Any]]) -> BulkResult:
+        self.skipped = [item for _, item in remaining]
+        self.succeeded.sort(key=lambda result: result.index)
+        self.failed.sort(key=lambda result: result.index)
+        return self
+
+
+def _run_bulk(
+    items: Iterable[Any],
+    operation: Callable[[Any], dict[str, Any] | None],
+    concurrency: int,
+    max_errors: int | None,
+) -> BulkResult:
+    """Run ``operation`` over items on a pool of ``concurrency`` worker threads.
+
+    API errors are recorded per item; once ``max_errors`` items failed, the
+    workers finish their current request and no further items are sent.
+    Any other exception stops the workers and is raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    result = BulkResult()
+    pending = enumerate(items)
+    lock = threading.Lock()
+
+    def worker() -> None:
+        while True:
+            with lock:
+                if result.stopped:
+                    return
+                try:
+                    index, item = next(pending)
+                except StopIteration:
+                    return
+            try:
+                outcome = BulkItemResult(index, item, response=operation(item))
+            except PCOAPIError as e:
+                outcome = BulkItemResult(index, item, error=e)
+            except BaseException:
+                with lock:
+                    result.stopped = True
+                raise
+            with lock:
+                result._record(outcome, max_errors)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        workers = [executor.submit(worker) for _ in range(concurrency)]
+    for future in workers:
+        future.result()
+    return result._finish(pending)
+
+
+async def _run_bulk_async(
+    items: Iterable[Any],
+    operation: Callable[[Any], Awaitable[dict[str, Any] | None]],
+    concurrency: int,
+    max_errors: int | None,
+) -> BulkResult:
+    """Run ``operation`` over items with ``concurrency`` worker tasks (see ``_run_bulk``)."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    result = BulkResult()
+    pending = enumerate(items)
+
+    async def worker() -> None:
+        for index, item in pending:
+            try:
+                outcome = BulkItemResult(index, item, response=await operation(item))
+            except PCOAPIError as e:
+                outcome = BulkItemResult(index, item, error=e)
+            except BaseException:
+                result.stopped = True
+                raise
+            result._record(outcome, max_errors)
+            if result.stopped:
+                return
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return result._finish(pending)
 
 
 class BaseModule:
-    """Base class for PCO API modules."""
+    """Base class for PCO API modules.
+
+    ``RESOURCES`` is the module's schema table: the resource type of each
+    collection and the relationships it can include. ``fields`` and
+    ``include`` arguments are validated against it.
+    """
+
+    RESOURCES: ClassVar[dict[str, ResourceSchema]] = {}
 
     def __init__(self, client: PCOClient, base_path: str):
         """Initialize base module.
@@ -18,6 +200,18 @@ class BaseModule:
         self.client = client
         self.base_path = base_path.rstrip("/")
 
+    def _query(
+        self,
+        resource: str,
+        params: dict[str, Any] | None,
+        fields: Fields | None,
+        include: Iterable[str] | str | None,
+    ) -> dict[str, Any] | None:
+        """Add sparse fieldset and include parameters, validated against ``RESOURCES``."""
+        return query_params(
+            self.RESOURCES, resource.rstrip("/").rsplit("/", 1)[-1], params, fields, include
+        )
+
     def _build_path(self, *parts: str) -> str:
         """Build API path from parts."""
         path = self.base_path
@@ -26,31 +220,61 @@ class BaseModule:
                 path = f"{path}/{part.lstrip('/')}"
         return path
 
-    def list(self, resource: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+    def query(self, resource: str) -> Query:
+        """Start building a query over a collection of this module.
+
+        Args:
+            resource: Collection name (e.g., 'people')
+
+        Returns:
+            An empty query; refine it with ``where``, ``order``, ``per_page``, etc.
+        """
+        return Query(self, resource)
+
+    def list(
+        self,
+        resource: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List resources.
 
         Args:
             resource: Resource name (e.g., 'people', 'households')
             params: Query parameters
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
 
         Returns:
             API response
         """
         endpoint = self._build_path(resource)
+        params = self._query(resource, params, fields, include)
         return self.client.get(endpoint, params=params)
 
-    def get(self, resource: str, resource_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    def get(
+        self,
+        resource: str,
+        resource_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single resource.
 
         Args:
             resource: Resource name (e.g., 'people', 'households')
             resource_id: Resource ID
             params: Query parameters
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
 
         Returns:
             API response
         """
         endpoint = self._build_path(resource, resource_id)
+        params = self._query(resource, params, fields, include)
         response = self.client.get(endpoint, params=params)
         if isinstance(response, dict):
             return response
@@ -102,7 +326,15 @@ class BaseModule:
         endpoint = self._build_path(resource, resource_id)
         self.client.delete(endpoint, params=params)
 
-    def get_related(self, resource: str, resource_id: str, related: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+    def get_related(
+        self,
+        resource: str,
+        resource_id: str,
+        related: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """Get related resources.
 
         Args:
@@ -110,9 +342,623 @@ class BaseModule:
             resource_id: Resource ID
             related: Related resource name
             params: Query parameters
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
 
         Returns:
             API response
         """
         endpoint = self._build_path(resource, resource_id, related)
+        params = self._query(related, params, fields, include)
         return self.client.get(endpoint, params=params)
+
+    def iter_pages(
+        self,
+        resource: str,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any] | list[Any]]:
+        """Iterate over every page of a resource collection.
+
+        Pages are requested lazily by following the pagination links of
+        each response. With ``concurrency`` above 1, the offsets of the
+        remaining pages are derived from the first page's
+        ``meta.total_count`` and up to ``concurrency`` pages are fetched at
+        once on a thread pool; pages are still yielded in order.
+
+        Args:
+            resource: Resource path relative to the module (e.g., 'people')
+            params: Query parameters
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
+
+        Yields:
+            API responses, one per page
+        """
+        endpoint = self._build_path(resource)
+        params = self._query(resource, params, fields, include)
+        query: dict[str, Any] | None = page_params(params, per_page)
+        remaining = None
+        while query is not None:
+            page = self.client.get(endpoint, params=query)
+            yield page
+            if concurrency > 1 and remaining is None:
+                remaining = remaining_page_params(page, query)
+                if remaining is not None:
+                    yield from self._fetch_pages_concurrently(endpoint, remaining, concurrency)
+                    return
+            query = next_page_params(page, query)
+
+    def _fetch_pages_concurrently(
+        self, endpoint: str, queries: list[dict[str, Any]], concurrency: int
+    ) -> Iterator[dict[str, Any] | list[Any]]:
+        """Fetch pages on a thread pool, keeping at most ``concurrency`` in flight."""
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending: deque = deque()
+        try:
+            for query in queries:
+                pending.append(executor.submit(self.client.get, endpoint, params=query))
+                if len(pending) >= concurrency:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def iter(
+        self,
+        resource: str,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every record of a resource collection.
+
+        Only the pages currently in flight are held in memory.
+
+        Args:
+            resource: Resource path relative to the module (e.g., 'people')
+            params: Query parameters
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
+
+        Yields:
+            Resource objects from the ``data`` member of each page
+        """
+        for page in self.iter_pages(
+            resource,
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        ):
+            yield from page_records(page)
+
+    def iter_related(
+        self,
+        resource: str,
+        resource_id: str,
+        related: str,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every related record of a resource.
+
+        Args:
+            resource: Resource name
+            resource_id: Resource ID
+            related: Related resource name
+            params: Query parameters
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
+
+        Yields:
+            Related resource objects
+        """
+        return self.iter(
+            f"{resource}/{resource_id}/{related}",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_many(
+        self,
+        resource: str,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+        chunk_size: int = MAX_PER_PAGE,
+        concurrency: int = 4,
+    ) -> GetManyResult:
+        """Get many resources by ID with a few filtered list requests.
+
+        IDs are sent in chunks as ``where[id]`` filters, one page per chunk,
+        with up to ``concurrency`` chunks fetched at once on a thread pool.
+
+        Args:
+            resource: Resource name (e.g., 'people')
+            ids: Resource IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
+            chunk_size: IDs per request (at most the maximum page size)
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Records keyed by ID, and the IDs that were not found
+
+        Raises:
+            ValueError: If chunk_size or concurrency is out of range
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        params = self._query(resource, params, fields, include)
+        unique, chunks = _id_chunks(ids, chunk_size)
+        if not chunks:
+            return GetManyResult()
+
+        def fetch(chunk: list[str]) -> list[dict[str, Any]]:
+            query = {**(params or {}), "where[id]": ",".join(chunk)}
+            return list(self.iter(resource, params=query, per_page=len(chunk)))
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as executor:
+            return _collect_many(unique, executor.map(fetch, chunks))
+
+    def bulk_create(
+        self,
+        resource: str,
+        items: Iterable[dict[str, Any]],
+        params: dict[str, Any] | None = None,
+        concurrency: int = 4,
+        max_errors: int | None = None,
+    ) -> BulkResult:
+        """Create many resources, up to ``concurrency`` requests at a time.
+
+        Every request goes through the client's rate limiter and retries, so
+        the workers share the rate limit instead of tripping it. Items the
+        API rejects are reported instead of raised.
+
+        Args:
+            resource: Resource name (e.g., 'households')
+            items: Request body of each resource to create
+            params: Query parameters sent with every request
+            concurrency: Maximum number of requests in flight
+            max_errors: Stop sending items once this many have failed
+
+        Returns:
+            Created resources, per-item errors, and the items not sent
+        """
+        return _run_bulk(
+            items, lambda data: self.create(resource, data, params=params), concurrency, max_errors
+        )
+
+    def bulk_update(
+        self,
+        resource: str,
+        updates: Mapping[str | int, dict[str, Any]] | Iterable[tuple[str | int, dict[str, Any]]],
+        params: dict[str, Any] | None = None,
+        concurrency: int = 4,
+        max_errors: int | None = None,
+    ) -> BulkResult:
+        """Update many resources, up to ``concurrency`` requests at a time.
+
+        Args:
+            resource: Resource name (e.g., 'households')
+            updates: Updated data keyed by resource ID, or ``(id, data)`` pairs
+            params: Query parameters sent with every request
+            concurrency: Maximum number of requests in flight
+            max_errors: Stop sending items once this many have failed
+
+        Returns:
+            Updated resources, per-item errors, and the ``(id, data)`` pairs not sent
+        """
+        pairs = updates.items() if isinstance(updates, Mapping) else updates
+        return _run_bulk(
+            pairs,
+            lambda pair: self.update(resource, str(pair[0]), pair[1], params=params),
+            concurrency,
+            max_errors,
+        )
+
+    def bulk_delete(
+        self,
+        resource: str,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        concurrency: int = 4,
+        max_errors: int | None = None,
+    ) -> BulkResult:
+        """Delete many resources, up to ``concurrency`` requests at a time.
+
+        Args:
+            resource: Resource name (e.g., 'households')
+            ids: IDs of the resources to delete
+            params: Query parameters sent with every request
+            concurrency: Maximum number of requests in flight
+            max_errors: Stop sending items once this many have failed
+
+        Returns:
+            Deleted IDs, per-item errors, and the IDs not sent
+        """
+        return _run_bulk(
+            ids,
+            lambda resource_id: self.delete(resource, str(resource_id), params=params),
+            concurrency,
+            max_errors,
+        )
+
+
+class AsyncBaseModule(BaseModule):
+    """Base class for PCO API modules bound to an AsyncPCOClient.
+
+    The request primitives are coroutines here. The resource wrappers on the
+    concrete modules return whatever these primitives return, so the async
+    module classes simply combine this class with the sync module and every
+    wrapper (e.g. ``get_person``) becomes awaitable.
+    """
+
+    client: AsyncPCOClient
+
+    async def list(
+        self,
+        resource: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """List resources.
+
+        Args:
+            resource: Resource name (e.g., 'people', 'households')
+            params: Query parameters
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
+
+        Returns:
+            API response
+        """
+        endpoint = self._build_path(resource)
+        params = self._query(resource, params, fields, include)
+        return await self.client.get(endpoint, params=params)
+
+    async def get(
+        self,
+        resource: str,
+        resource_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
+        """Get a single resource.
+
+        Args:
+            resource: Resource name (e.g., 'people', 'households')
+            resource_id: Resource ID
+            params: Query parameters
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
+
+        Returns:
+            API response
+        """
+        endpoint = self._build_path(resource, resource_id)
+        params = self._query(resource, params, fields, include)
+        response = await self.client.get(endpoint, params=params)
+        if isinstance(response, dict):
+            return response
+        raise ValueError(f"Expected dict response, got {type(response)}")
+
+    async def create(
+        self, resource: str, data: dict[str, Any], params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Create a new resource.
+
+        Args:
+            resource: Resource name
+            data: Resource data
+            params: Query parameters
+
+        Returns:
+            Created resource
+        """
+        endpoint = self._build_path(resource)
+        response = await self.client.post(endpoint, json=data, params=params)
+        if isinstance(response, dict):
+            return response
+        raise ValueError(f"Expected dict response, got {type(response)}")
+
+    async def update(
+        self,
+        resource: str,
+        resource_id: str,
+        data: dict[str, Any],
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Update a resource.
+
+        Args:
+            resource: Resource name
+            resource_id: Resource ID
+            data: Updated data
+            params: Query parameters
+
+        Returns:
+            Updated resource
+        """
+        endpoint = self._build_path(resource, resource_id)
+        response = await self.client.patch(endpoint, json=data, params=params)
+        if isinstance(response, dict):
+            return response
+        raise ValueError(f"Expected dict response, got {type(response)}")
+
+    async def delete(
+        self, resource: str, resource_id: str, params: dict[str, Any] | None = None
+    ) -> None:
+        """Delete a resource.
+
+        Args:
+            resource: Resource name
+            resource_id: Resource ID
+            params: Query parameters
+        """
+        endpoint = self._build_path(resource, resource_id)
+        await self.client.delete(endpoint, params=params)
+
+    async def get_related(
+        self,
+        resource: str,
+        resource_id: str,
+        related: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """Get related resources.
+
+        Args:
+            resource: Resource name
+            resource_id: Resource ID
+            related: Related resource name
+            params: Query parameters
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
+
+        Returns:
+            API response
+        """
+        endpoint = self._build_path(resource, resource_id, related)
+        params = self._query(related, params, fields, include)
+        return await self.client.get(endpoint, params=params)
+
+    async def iter_pages(
+        self,
+        resource: str,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> AsyncIterator[dict[str, Any] | list[Any]]:
+        """Iterate over every page of a resource collection.
+
+        With ``concurrency`` above 1, the remaining pages are fetched as
+        concurrent tasks once the first page reports ``meta.total_count``;
+        pages are still yielded in order.
+
+        Args:
+            resource: Resource path relative to the module (e.g., 'people')
+            params: Query parameters
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
+
+        Yields:
+            API responses, one per page
+        """
+        endpoint = self._build_path(resource)
+        params = self._query(resource, params, fields, include)
+        query: dict[str, Any] | None = page_params(params, per_page)
+        remaining = None
+        while query is not None:
+            page = await self.client.get(endpoint, params=query)
+            yield page
+            if concurrency > 1 and remaining is None:
+                remaining = remaining_page_params(page, query)
+                if remaining is not None:
+                    async for fetched in self._fetch_pages_concurrently(
+                        endpoint, remaining, concurrency
+                    ):
+                        yield fetched
+                    return
+            query = next_page_params(page, query)
+
+    async def _fetch_pages_concurrently(
+        self, endpoint: str, queries: list[dict[str, Any]], concurrency: int
+    ) -> AsyncIterator[dict[str, Any] | list[Any]]:
+        """Fetch pages as tasks, keeping at most ``concurrency`` in flight."""
+        pending: deque = deque()
+        try:
+            for query in queries:
+                pending.append(asyncio.ensure_future(self.client.get(endpoint, params=query)))
+                if len(pending) >= concurrency:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def iter(
+        self,
+        resource: str,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over every record of a resource collection.
+
+        Args:
+            resource: Resource path relative to the module (e.g., 'people')
+            params: Query parameters
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
+
+        Yields:
+            Resource objects from the ``data`` member of each page
+        """
+        async for page in self.iter_pages(
+            resource,
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        ):
+            for record in page_records(page):
+                yield record
+
+    async def get_many(
+        self,
+        resource: str,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+        chunk_size: int = MAX_PER_PAGE,
+        concurrency: int = 4,
+    ) -> GetManyResult:
+        """Get many resources by ID with a few filtered list requests.
+
+        Args:
+            resource: Resource name (e.g., 'people')
+            ids: Resource IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type (e.g., {"Person": ["first_name"]})
+            include: Related resources to include (e.g., ["emails"])
+            chunk_size: IDs per request (at most the maximum page size)
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Records keyed by ID, and the IDs that were not found
+
+        Raises:
+            ValueError: If chunk_size or concurrency is out of range
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        params = self._query(resource, params, fields, include)
+        unique, chunks = _id_chunks(ids, chunk_size)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(chunk: list[str]) -> list[dict[str, Any]]:
+            query = {**(params or {}), "where[id]": ",".join(chunk)}
+            async with semaphore:
+                return [
+                    record
+                    async for record in self.iter(resource, params=query, per_page=len(chunk))
+                ]
+
+        return _collect_many(unique, await asyncio.gather(*(fetch(chunk) for chunk in chunks)))
+
+    async def bulk_create(
+        self,
+        resource: str,
+        items: Iterable[dict[str, Any]],
+        params: dict[str, Any] | None = None,
+        concurrency: int = 4,
+        max_errors: int | None = None,
+    ) -> BulkResult:
+        """Create many resources, up to ``concurrency`` requests at a time.
+
+        Args:
+            resource: Resource name (e.g., 'households')
+            items: Request body of each resource to create
+            params: Query parameters sent with every request
+            concurrency: Maximum number of requests in flight
+            max_errors: Stop sending items once this many have failed
+
+        Returns:
+            Created resources, per-item errors, and the items not sent
+        """
+        return await _run_bulk_async(
+            items, lambda data: self.create(resource, data, params=params), concurrency, max_errors
+        )
+
+    async def bulk_update(
+        self,
+        resource: str,
+        updates: Mapping[str | int, dict[str, Any]] | Iterable[tuple[str | int, dict[str, Any]]],
+        params: dict[str, Any] | None = None,
+        concurrency: int = 4,
+        max_errors: int | None = None,
+    ) -> BulkResult:
+        """Update many resources, up to ``concurrency`` requests at a time.
+
+        Args:
+            resource: Resource name (e.g., 'households')
+            updates: Updated data keyed by resource ID, or ``(id, data)`` pairs
+            params: Query parameters sent with every request
+            concurrency: Maximum number of requests in flight
+            max_errors: Stop sending items once this many have failed
+
+        Returns:
+            Updated resources, per-item errors, and the ``(id, data)`` pairs not sent
+        """
+        pairs = updates.items() if isinstance(updates, Mapping) else updates
+        return await _run_bulk_async(
+            pairs,
+            lambda pair: self.update(resource, str(pair[0]), pair[1], params=params),
+            concurrency,
+            max_errors,
+        )
+
+    async def bulk_delete(
+        self,
+        resource: str,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        concurrency: int = 4,
+        max_errors: int | None = None,
+    ) -> BulkResult:
+        """Delete many resources, up to ``concurrency`` requests at a time.
+
+        Args:
+            resource: Resource name (e.g., 'households')
+            ids: IDs of the resources to delete
+            params: Query parameters sent with every request
+            concurrency: Maximum number of requests in flight
+            max_errors: Stop sending items once this many have failed
+
+        Returns:
+            Deleted IDs, per-item errors, and the IDs not sent
+        """
+        return await _run_bulk_async(
+            ids,
+            lambda resource_id: self.delete(resource, str(resource_id), params=params),
+            concurrency,
+            max_errors,
+        )
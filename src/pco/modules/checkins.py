@@ -1,38 +1,109 @@
 """Check-Ins API module for PCO."""
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
-from pco.modules.base import BaseModule
+from pco.modules.base import AsyncBaseModule, BaseModule, GetManyResult
+from pco.schema import Fields, ResourceSchema
 
 
 class CheckInsModule(BaseModule):
     """Module for interacting with PCO Check-Ins API."""
 
+    RESOURCES = {
+        "events": ResourceSchema("Event", {"attendance_types": "AttendanceType"}),
+        "locations": ResourceSchema("Location", {"event": "Event", "parent": "Location"}),
+    }
+
     def __init__(self, client):
         super().__init__(client, "/check_ins/v2")
 
-    def list_events(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+    def list_events(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all check-in events.
 
         Args:
             params: Query parameters (e.g., per_page, offset, where, order)
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of events
         """
-        return self.list("events", params=params)
+        return self.list("events", params=params, fields=fields, include=include)
+
+    def iter_events(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all check-in events, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Iterator of check-in events
+        """
+        return self.iter(
+            "events",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_events_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many events by ID in batched requests.
 
-    def get_event(self, event_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Events keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("events", ids, params=params, fields=fields, include=include)
+
+    def get_event(
+        self,
+        event_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single check-in event.
 
         Args:
             event_id: Event ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Event data
         """
-        return self.get("events", event_id, params=params)
+        return self.get("events", event_id, params=params, fields=fields, include=include)
 
     def create_event(self, data: dict[str, Any], params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Create a new check-in event.
@@ -66,30 +137,94 @@ class CheckInsModule(BaseModule):
             event_id: Event ID
             params: Query parameters
         """
-        self.delete("events", event_id, params=params)
-
-    def list_locations(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.delete("events", event_id, params=params)
+
+    def list_locations(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all check-in locations.
 
         Args:
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of locations
         """
-        return self.list("locations", params=params)
+        return self.list("locations", params=params, fields=fields, include=include)
+
+    def iter_locations(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all check-in locations, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Iterator of check-in locations
+        """
+        return self.iter(
+            "locations",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_locations_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many locations by ID in batched requests.
+
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
-    def get_location(self, location_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Returns:
+            Locations keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("locations", ids, params=params, fields=fields, include=include)
+
+    def get_location(
+        self,
+        location_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single check-in location.
 
         Args:
             location_id: Location ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Location data
         """
-        return self.get("locations", location_id, params=params)
+        return self.get("locations", location_id, params=params, fields=fields, include=include)
 
     def create_location(self, data: dict[str, Any], params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Create a new check-in location.
@@ -123,16 +258,33 @@ class CheckInsModule(BaseModule):
             location_id: Location ID
             params: Query parameters
         """
-        self.delete("locations", location_id, params=params)
-
-    def get_event_locations(self, event_id: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.delete("locations", location_id, params=params)
+
+    def get_event_locations(
+        self,
+        event_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """Get locations for an event.
 
         Args:
             event_id: Event ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of locations
         """
-        return self.get_related("events", event_id, "locations", params=params)
+        return self.get_related(
+            "events", event_id, "locations", params=params, fields=fields, include=include
+        )
+
+
+class AsyncCheckInsModule(AsyncBaseModule, CheckInsModule):
+    """Module for interacting with PCO Check-Ins API through an AsyncPCOClient.
+
+    Exposes the same methods as CheckInsModule; each one returns an awaitable.
+    """
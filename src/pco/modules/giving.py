@@ -1,38 +1,113 @@
 """Giving API module for PCO."""
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
-from pco.modules.base import BaseModule
+from pco.modules.base import AsyncBaseModule, BaseModule, GetManyResult
+from pco.schema import Fields, ResourceSchema
 
 
 class GivingModule(BaseModule):
     """Module for interacting with PCO Giving API."""
 
+    RESOURCES = {
+        "funds": ResourceSchema("Fund"),
+        "batches": ResourceSchema("Batch", {"batch_group": "BatchGroup", "owner": "Person"}),
+        "donations": ResourceSchema(
+            "Donation",
+            {"designations": "Designation", "labels": "Label", "note": "Note", "refund": "Refund"},
+        ),
+    }
+
     def __init__(self, client):
         super().__init__(client, "/giving/v2")
 
-    def list_funds(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+    def list_funds(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all giving funds.
 
         Args:
             params: Query parameters (e.g., per_page, offset, where, order)
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of funds
         """
-        return self.list("funds", params=params)
+        return self.list("funds", params=params, fields=fields, include=include)
+
+    def iter_funds(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all giving funds, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
-    def get_fund(self, fund_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Returns:
+            Iterator of giving funds
+        """
+        return self.iter(
+            "funds",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_funds_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many funds by ID in batched requests.
+
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Funds keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("funds", ids, params=params, fields=fields, include=include)
+
+    def get_fund(
+        self,
+        fund_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single giving fund.
 
         Args:
             fund_id: Fund ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Fund data
         """
-        return self.get("funds", fund_id, params=params)
+        return self.get("funds", fund_id, params=params, fields=fields, include=include)
 
     def create_fund(self, data: dict[str, Any], params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Create a new giving fund.
@@ -66,30 +141,94 @@ class GivingModule(BaseModule):
             fund_id: Fund ID
             params: Query parameters
         """
-        self.delete("funds", fund_id, params=params)
-
-    def list_batches(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.delete("funds", fund_id, params=params)
+
+    def list_batches(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all giving batches.
 
         Args:
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of batches
         """
-        return self.list("batches", params=params)
+        return self.list("batches", params=params, fields=fields, include=include)
+
+    def iter_batches(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all giving batches, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Iterator of giving batches
+        """
+        return self.iter(
+            "batches",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_batches_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many batches by ID in batched requests.
+
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
-    def get_batch(self, batch_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Returns:
+            Batches keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("batches", ids, params=params, fields=fields, include=include)
+
+    def get_batch(
+        self,
+        batch_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single giving batch.
 
         Args:
             batch_id: Batch ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Batch data
         """
-        return self.get("batches", batch_id, params=params)
+        return self.get("batches", batch_id, params=params, fields=fields, include=include)
 
     def create_batch(self, data: dict[str, Any], params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Create a new giving batch.
@@ -123,39 +262,120 @@ class GivingModule(BaseModule):
             batch_id: Batch ID
             params: Query parameters
         """
-        self.delete("batches", batch_id, params=params)
-
-    def list_donations(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.delete("batches", batch_id, params=params)
+
+    def list_donations(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all donations.
 
         Args:
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of donations
         """
-        return self.list("donations", params=params)
+        return self.list("donations", params=params, fields=fields, include=include)
+
+    def iter_donations(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all donations, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Iterator of donations
+        """
+        return self.iter(
+            "donations",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_donations_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many donations by ID in batched requests.
 
-    def get_donation(self, donation_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Donations keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("donations", ids, params=params, fields=fields, include=include)
+
+    def get_donation(
+        self,
+        donation_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single donation.
 
         Args:
             donation_id: Donation ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Donation data
         """
-        return self.get("donations", donation_id, params=params)
-
-    def get_batch_donations(self, batch_id: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.get("donations", donation_id, params=params, fields=fields, include=include)
+
+    def get_batch_donations(
+        self,
+        batch_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """Get donations for a batch.
 
         Args:
             batch_id: Batch ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of donations
         """
-        return self.get_related("batches", batch_id, "donations", params=params)
+        return self.get_related(
+            "batches", batch_id, "donations", params=params, fields=fields, include=include
+        )
+
+
+class AsyncGivingModule(AsyncBaseModule, GivingModule):
+    """Module for interacting with PCO Giving API through an AsyncPCOClient.
+
+    Exposes the same methods as GivingModule; each one returns an awaitable.
+    """
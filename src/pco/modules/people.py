@@ -1,38 +1,127 @@
 """People API module for PCO."""
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
-from pco.modules.base import BaseModule
+from pco.modules.base import AsyncBaseModule, BaseModule, GetManyResult
+from pco.schema import Fields, ResourceSchema
 
 
 class PeopleModule(BaseModule):
     """Module for interacting with PCO People API."""
 
+    RESOURCES = {
+        "people": ResourceSchema(
+            "Person",
+            {
+                "addresses": "Address",
+                "emails": "Email",
+                "field_data": "FieldDatum",
+                "households": "Household",
+                "inactive_reason": "InactiveReason",
+                "marital_status": "MaritalStatus",
+                "name_prefix": "NamePrefix",
+                "name_suffix": "NameSuffix",
+                "organization": "Organization",
+                "person_apps": "PersonApp",
+                "phone_numbers": "PhoneNumber",
+                "primary_campus": "Campus",
+                "school": "SchoolOption",
+                "social_profiles": "SocialProfile",
+            },
+        ),
+        "households": ResourceSchema("Household", {"people": "Person"}),
+    }
+
     def __init__(self, client):
         super().__init__(client, "/people/v2")
 
-    def list_people(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+    def list_people(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all people.
 
         Args:
             params: Query parameters (e.g., per_page, offset, where, order)
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of people
         """
-        return self.list("people", params=params)
+        return self.list("people", params=params, fields=fields, include=include)
+
+    def iter_people(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all people, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
-    def get_person(self, person_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Returns:
+            Iterator of people
+        """
+        return self.iter(
+            "people",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_people_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many people by ID in batched requests.
+
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            People keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("people", ids, params=params, fields=fields, include=include)
+
+    def get_person(
+        self,
+        person_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single person.
 
         Args:
             person_id: Person ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Person data
         """
-        return self.get("people", person_id, params=params)
+        return self.get("people", person_id, params=params, fields=fields, include=include)
 
     def create_person(self, data: dict[str, Any], params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Create a new person.
@@ -66,30 +155,94 @@ class PeopleModule(BaseModule):
             person_id: Person ID
             params: Query parameters
         """
-        self.delete("people", person_id, params=params)
-
-    def list_households(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.delete("people", person_id, params=params)
+
+    def list_households(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all households.
 
         Args:
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of households
         """
-        return self.list("households", params=params)
+        return self.list("households", params=params, fields=fields, include=include)
+
+    def iter_households(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all households, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
-    def get_household(self, household_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Returns:
+            Iterator of households
+        """
+        return self.iter(
+            "households",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_households_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many households by ID in batched requests.
+
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Households keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("households", ids, params=params, fields=fields, include=include)
+
+    def get_household(
+        self,
+        household_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single household.
 
         Args:
             household_id: Household ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Household data
         """
-        return self.get("households", household_id, params=params)
+        return self.get("households", household_id, params=params, fields=fields, include=include)
 
     def create_household(self, data: dict[str, Any], params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Create a new household.
@@ -123,28 +276,55 @@ class PeopleModule(BaseModule):
             household_id: Household ID
             params: Query parameters
         """
-        self.delete("households", household_id, params=params)
-
-    def get_person_households(self, person_id: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.delete("households", household_id, params=params)
+
+    def get_person_households(
+        self,
+        person_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """Get households for a person.
 
         Args:
             person_id: Person ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of households
         """
-        return self.get_related("people", person_id, "households", params=params)
-
-    def get_household_people(self, household_id: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.get_related(
+            "people", person_id, "households", params=params, fields=fields, include=include
+        )
+
+    def get_household_people(
+        self,
+        household_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """Get people in a household.
 
         Args:
             household_id: Household ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of people
         """
-        return self.get_related("households", household_id, "people", params=params)
+        return self.get_related(
+            "households", household_id, "people", params=params, fields=fields, include=include
+        )
+
+
+class AsyncPeopleModule(AsyncBaseModule, PeopleModule):
+    """Module for interacting with PCO People API through an AsyncPCOClient.
+
+    Exposes the same methods as PeopleModule; each one returns an awaitable.
+    """
@@ -1,38 +1,115 @@
 """Resources API module for PCO."""
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
-from pco.modules.base import BaseModule
+from pco.modules.base import AsyncBaseModule, BaseModule, GetManyResult
+from pco.schema import Fields, ResourceSchema
 
 
 class ResourcesModule(BaseModule):
     """Module for interacting with PCO Resources API."""
 
+    RESOURCES = {
+        "items": ResourceSchema(
+            "Resource",
+            {
+                "resource_approval_groups": "ResourceApprovalGroup",
+                "resource_questions": "ResourceQuestion",
+                "room_setups": "RoomSetup",
+            },
+        ),
+    }
+
     def __init__(self, client):
         super().__init__(client, "/resources/v2")
 
-    def list_items(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+    def list_items(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all resource items.
 
         Args:
             params: Query parameters (e.g., per_page, offset, where, order)
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of items
         """
-        return self.list("items", params=params)
+        return self.list("items", params=params, fields=fields, include=include)
+
+    def iter_items(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all resource items, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Iterator of resource items
+        """
+        return self.iter(
+            "items",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_items_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many items by ID in batched requests.
 
-    def get_item(self, item_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Items keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("items", ids, params=params, fields=fields, include=include)
+
+    def get_item(
+        self,
+        item_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single resource item.
 
         Args:
             item_id: Item ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Item data
         """
-        return self.get("items", item_id, params=params)
+        return self.get("items", item_id, params=params, fields=fields, include=include)
 
     def create_item(self, data: dict[str, Any], params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Create a new resource item.
@@ -66,30 +143,94 @@ class ResourcesModule(BaseModule):
             item_id: Item ID
             params: Query parameters
         """
-        self.delete("items", item_id, params=params)
-
-    def list_checkouts(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.delete("items", item_id, params=params)
+
+    def list_checkouts(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all checkouts.
 
         Args:
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of checkouts
         """
-        return self.list("checkouts", params=params)
+        return self.list("checkouts", params=params, fields=fields, include=include)
+
+    def iter_checkouts(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all checkouts, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Iterator of checkouts
+        """
+        return self.iter(
+            "checkouts",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_checkouts_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many checkouts by ID in batched requests.
+
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
-    def get_checkout(self, checkout_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Returns:
+            Checkouts keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("checkouts", ids, params=params, fields=fields, include=include)
+
+    def get_checkout(
+        self,
+        checkout_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single checkout.
 
         Args:
             checkout_id: Checkout ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Checkout data
         """
-        return self.get("checkouts", checkout_id, params=params)
+        return self.get("checkouts", checkout_id, params=params, fields=fields, include=include)
 
     def create_checkout(self, data: dict[str, Any], params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Create a new checkout.
@@ -123,16 +264,33 @@ class ResourcesModule(BaseModule):
             checkout_id: Checkout ID
             params: Query parameters
         """
-        self.delete("checkouts", checkout_id, params=params)
-
-    def get_item_checkouts(self, item_id: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.delete("checkouts", checkout_id, params=params)
+
+    def get_item_checkouts(
+        self,
+        item_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """Get checkouts for an item.
 
         Args:
             item_id: Item ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of checkouts
         """
-        return self.get_related("items", item_id, "checkouts", params=params)
+        return self.get_related(
+            "items", item_id, "checkouts", params=params, fields=fields, include=include
+        )
+
+
+class AsyncResourcesModule(AsyncBaseModule, ResourcesModule):
+    """Module for interacting with PCO Resources API through an AsyncPCOClient.
+
+    Exposes the same methods as ResourcesModule; each one returns an awaitable.
+    """
@@ -1,38 +1,140 @@
 """Services API module for PCO."""
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
-from pco.modules.base import BaseModule
+from pco.modules.base import AsyncBaseModule, BaseModule, GetManyResult
+from pco.schema import Fields, ResourceSchema
 
 
 class ServicesModule(BaseModule):
     """Module for interacting with PCO Services API."""
 
+    RESOURCES = {
+        "plans": ResourceSchema(
+            "Plan",
+            {
+                "contributors": "Contributor",
+                "my_schedules": "Schedule",
+                "plan_times": "PlanTime",
+                "series": "Series",
+            },
+        ),
+        "items": ResourceSchema(
+            "Item",
+            {
+                "arrangement": "Arrangement",
+                "item_notes": "ItemNote",
+                "item_times": "ItemTime",
+                "key": "Key",
+                "media": "Media",
+                "selected_attachments": "Attachment",
+                "selected_background": "Attachment",
+                "song": "Song",
+            },
+        ),
+        "teams": ResourceSchema(
+            "Team",
+            {
+                "people": "Person",
+                "person_team_position_assignments": "PersonTeamPositionAssignment",
+                "service_type": "ServiceType",
+                "team_leaders": "TeamLeader",
+                "team_positions": "TeamPosition",
+            },
+        ),
+        "times": ResourceSchema("PlanTime"),
+    }
+
     def __init__(self, client):
         super().__init__(client, "/services/v2")
 
-    def list_plans(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+    def list_plans(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all service plans.
 
         Args:
             params: Query parameters (e.g., per_page, offset, where, order)
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of service plans
         """
-        return self.list("plans", params=params)
+        return self.list("plans", params=params, fields=fields, include=include)
+
+    def iter_plans(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all service plans, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
-    def get_plan(self, plan_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Returns:
+            Iterator of service plans
+        """
+        return self.iter(
+            "plans",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_plans_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many plans by ID in batched requests.
+
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Plans keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("plans", ids, params=params, fields=fields, include=include)
+
+    def get_plan(
+        self,
+        plan_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single service plan.
 
         Args:
             plan_id: Plan ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Plan data
         """
-        return self.get("plans", plan_id, params=params)
+        return self.get("plans", plan_id, params=params, fields=fields, include=include)
 
     def create_plan(self, data: dict[str, Any], params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Create a new service plan.
@@ -66,30 +168,94 @@ class ServicesModule(BaseModule):
             plan_id: Plan ID
             params: Query parameters
         """
-        self.delete("plans", plan_id, params=params)
-
-    def list_teams(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.delete("plans", plan_id, params=params)
+
+    def list_teams(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all teams.
 
         Args:
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of teams
         """
-        return self.list("teams", params=params)
+        return self.list("teams", params=params, fields=fields, include=include)
+
+    def iter_teams(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all teams, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Iterator of teams
+        """
+        return self.iter(
+            "teams",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_teams_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many teams by ID in batched requests.
+
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
-    def get_team(self, team_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Returns:
+            Teams keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("teams", ids, params=params, fields=fields, include=include)
+
+    def get_team(
+        self,
+        team_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single team.
 
         Args:
             team_id: Team ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Team data
         """
-        return self.get("teams", team_id, params=params)
+        return self.get("teams", team_id, params=params, fields=fields, include=include)
 
     def create_team(self, data: dict[str, Any], params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Create a new team.
@@ -123,51 +289,142 @@ class ServicesModule(BaseModule):
             team_id: Team ID
             params: Query parameters
         """
-        self.delete("teams", team_id, params=params)
-
-    def list_times(self, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.delete("teams", team_id, params=params)
+
+    def list_times(
+        self,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """List all times.
 
         Args:
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of times
         """
-        return self.list("times", params=params)
+        return self.list("times", params=params, fields=fields, include=include)
+
+    def iter_times(
+        self,
+        params: dict[str, Any] | None = None,
+        per_page: int | None = None,
+        concurrency: int = 1,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all times, following pagination.
+
+        Args:
+            params: Query parameters (e.g., where, order)
+            per_page: Page size to request
+            concurrency: Maximum number of pages in flight
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
-    def get_time(self, time_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        Returns:
+            Iterator of times
+        """
+        return self.iter(
+            "times",
+            params=params,
+            per_page=per_page,
+            concurrency=concurrency,
+            fields=fields,
+            include=include,
+        )
+
+    def get_times_by_ids(
+        self,
+        ids: Iterable[str | int],
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> GetManyResult:
+        """Get many times by ID in batched requests.
+
+        Args:
+            ids: IDs to fetch
+            params: Additional query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
+
+        Returns:
+            Times keyed by ID, and the IDs that were not found
+        """
+        return self.get_many("times", ids, params=params, fields=fields, include=include)
+
+    def get_time(
+        self,
+        time_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get a single time.
 
         Args:
             time_id: Time ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             Time data
         """
-        return self.get("times", time_id, params=params)
-
-    def get_plan_items(self, plan_id: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.get("times", time_id, params=params, fields=fields, include=include)
+
+    def get_plan_items(
+        self,
+        plan_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """Get items for a plan.
 
         Args:
             plan_id: Plan ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of items
         """
-        return self.get_related("plans", plan_id, "items", params=params)
-
-    def get_plan_teams(self, plan_id: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list[Any]:
+        return self.get_related(
+            "plans", plan_id, "items", params=params, fields=fields, include=include
+        )
+
+    def get_plan_teams(
+        self,
+        plan_id: str,
+        params: dict[str, Any] | None = None,
+        fields: Fields | None = None,
+        include: Iterable[str] | str | None = None,
+    ) -> dict[str, Any] | list[Any]:
         """Get teams for a plan.
 
         Args:
             plan_id: Plan ID
             params: Query parameters
+            fields: Attribute names to return per resource type
+            include: Related resources to include
 
         Returns:
             List of teams
         """
-        return self.get_related("plans", plan_id, "teams", params=params)
+        return self.get_related(
+            "plans", plan_id, "teams", params=params, fields=fields, include=include
+        )
+
+
+class AsyncServicesModule(AsyncBaseModule, ServicesModule):
+    """Module for interacting with PCO Services API through an AsyncPCOClient.
+
+    Exposes the same methods as ServicesModule; each one returns an awaitable.
+    """
@@ -0,0 +1,100 @@
+"""Helpers for following PCO JSON:API pagination."""
+
+from __future__ import annotations
+
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+# Largest page size the PCO API accepts
+MAX_PER_PAGE = 100
+
+
+def page_params(params: dict[str, Any] | None, per_page: int | None = None) -> dict[str, Any]:
+    """Build the query parameters for the first page of a paginated request."""
+    query = dict(params or {})
+    if per_page is not None:
+        query["per_page"] = per_page
+    return query
+
+
+def next_page_params(
+    page: dict[str, Any] | list[Any], params: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Get the query parameters for the page following ``page``.
+
+    PCO reports the next offset in ``meta.next.offset`` and as a full URL in
+    ``links.next``; either is honoured.
+
+    Args:
+        page: Decoded API response for the current page
+        params: Query parameters used to request the current page
+
+    Returns:
+        Query parameters for the next page, or None if this is the last page
+    """
+    if not isinstance(page, dict):
+        return None
+
+    next_params: dict[str, Any] | None = None
+    meta_next = (page.get("meta") or {}).get("next")
+    if isinstance(meta_next, dict) and meta_next.get("offset") is not None:
+        next_params = {**params, "offset": meta_next["offset"]}
+    else:
+        next_link = (page.get("links") or {}).get("next")
+        if next_link:
+            next_params = {**params, **dict(parse_qsl(urlsplit(next_link).query))}
+
+    if next_params is None or str(next_params.get("offset")) == str(params.get("offset")):
+        return None
+    return next_params
+
+
+def page_records(page: dict[str, Any] | list[Any]) -> list[Any]:
+    """Get the list of records contained in a page."""
+    if isinstance(page, list):
+        return page
+    data = page.get("data")
+    if data is None:
+        return []
+    if isinstance(data, list):
+        return data
+    return [data]
+
+
+def remaining_page_params(
+    first_page: dict[str, Any] | list[Any], params: dict[str, Any]
+) -> list[dict[str, Any]] | None:
+    """Get the query parameters of every page after ``first_page``.
+
+    Uses ``meta.total_count`` so all remaining offsets are known up front and
+    can be requested concurrently.
+
+    Args:
+        first_page: Decoded API response for the first requested page
+        params: Query parameters used to request that page
+
+    Returns:
+        Query parameters for each remaining page in order, or None if the
+        response does not report a total count
+    """
+    if not isinstance(first_page, dict):
+        return None
+    total_count = (first_page.get("meta") or {}).get("total_count")
+    if total_count is None:
+        return None
+    next_params = next_page_params(first_page, params)
+    if next_params is None:
+        return []
+
+    # Step by the page size the server actually used, which can be smaller
+    # than the requested per_page (PCO caps pages at MAX_PER_PAGE).
+    offset = int(params.get("offset") or 0)
+    try:
+        step = int(next_params["offset"]) - offset
+    except (KeyError, TypeError, ValueError):
+        step = len(page_records(first_page)) or min(
+            int(params.get("per_page") or MAX_PER_PAGE), MAX_PER_PAGE
+        )
+    if step <= 0:
+        return []
+    return [{**params, "offset": start} for start in range(offset + step, int(total_count), step)]
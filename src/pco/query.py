@@ -0,0 +1,174 @@
+"""Composable queries compiled to PCO list parameters."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from pco.cache import cache_key
+from pco.pagination import MAX_PER_PAGE
+
+if TYPE_CHECKING:
+    from pco.modules.base import BaseModule
+
+WHERE_OPERATORS = ("gt", "gte", "lt", "lte")
+
+
+def format_value(value: Any) -> str:
+    """Format a filter value the way PCO expects it in a query string."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            return f"{value.isoformat()}Z"
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ",".join(format_value(item) for item in value)
+    return str(value)
+
+
+def where_param(condition: str, value: Any) -> tuple[str, str]:
+    """Compile a ``name`` or ``name__operator`` condition into a ``where`` parameter.
+
+    Example:
+        ``where_param("updated_at__gte", "2024-01-01")`` gives
+        ``("where[updated_at][gte]", "2024-01-01")``
+    """
+    name, _, operator = condition.partition("__")
+    if not name:
+        raise ValueError(f"Invalid where condition: {condition!r}")
+    if not operator:
+        return f"where[{name}]", format_value(value)
+    if operator not in WHERE_OPERATORS:
+        raise ValueError(
+            f"Unsupported where operator {operator!r} (supported: {', '.join(WHERE_OPERATORS)})"
+        )
+    return f"where[{name}][{operator}]", format_value(value)
+
+
+@dataclass(frozen=True, eq=False)
+class Query:
+    """An immutable, reusable query over one collection of a module.
+
+    Every builder method returns a new query, so a base query can be
+    shared and refined. ``params()`` compiles the query to PCO parameters;
+    ``key`` is the response cache key of its first page, and queries with
+    the same key are equal and hash alike, so a query can be used as a
+    dictionary key. Running it goes through the module's regular list and
+    pagination methods:
+
+        people = client.people.query("people")
+        recent = people.where(updated_at__gte="2024-01-01").order("-updated_at")
+        for person in recent.per_page(100).iter():
+            ...
+    """
+
+    module: BaseModule = field(repr=False)
+    resource: str
+    conditions: tuple[tuple[str, str], ...] = ()
+    ordering: tuple[str, ...] = ()
+    filters: tuple[str, ...] = ()
+    page_size: int | None = None
+    fieldsets: tuple[tuple[str, tuple[str, ...]], ...] = ()
+    includes: tuple[str, ...] = ()
+
+    @property
+    def endpoint(self) -> str:
+        """API path of the queried collection."""
+        return self.module._build_path(self.resource)
+
+    def where(self, **conditions: Any) -> Query:
+        """Add ``where`` conditions, e.g. ``first_name="Ann"`` or ``updated_at__gte=since``.
+
+        Operators (``gt``, ``gte``, ``lt``, ``lte``) follow a double
+        underscore; lists are sent comma-separated and datetimes in ISO 8601.
+        """
+        compiled = dict(self.conditions)
+        compiled.update(where_param(condition, value) for condition, value in conditions.items())
+        return replace(self, conditions=tuple(compiled.items()))
+
+    def order(self, *attributes: str) -> Query:
+        """Set the sort order; prefix an attribute with ``-`` for descending."""
+        return replace(self, ordering=attributes)
+
+    def filter(self, *names: str) -> Query:
+        """Add named PCO filters (e.g., ``"created_since"``)."""
+        return replace(self, filters=tuple(dict.fromkeys((*self.filters, *names))))
+
+    def per_page(self, size: int) -> Query:
+        """Set the page size."""
+        if not 1 <= size <= MAX_PER_PAGE:
+            raise ValueError(f"per_page must be between 1 and {MAX_PER_PAGE}")
+        return replace(self, page_size=size)
+
+    def fields(self, **fieldsets: Iterable[str] | str) -> Query:
+        """Limit the attributes returned per resource type, e.g. ``Person=["first_name"]``."""
+        compiled = dict(self.fieldsets)
+        for resource_type, attributes in fieldsets.items():
+            compiled[resource_type] = (
+                (attributes,) if isinstance(attributes, str) else tuple(attributes)
+            )
+        return replace(self, fieldsets=tuple(compiled.items()))
+
+    def include(self, *relationships: str) -> Query:
+        """Include related resources in the responses."""
+        return replace(self, includes=tuple(dict.fromkeys((*self.includes, *relationships))))
+
+    def params(self) -> dict[str, Any]:
+        """Compile the query to request parameters.
+
+        Raises:
+            ValueError: If fields or includes are not valid for the collection
+        """
+        params: dict[str, Any] = dict(self.conditions)
+        if self.ordering:
+            params["order"] = ",".join(self.ordering)
+        if self.filters:
+            params["filter"] = ",".join(self.filters)
+        if self.page_size is not None:
+            params["per_page"] = self.page_size
+        fields = dict(self.fieldsets) or None
+        include = self.includes or None
+        return self.module._query(self.resource, params, fields, include) or {}
+
+    @property
+    def key(self) -> str:
+        """Stable key identifying the compiled query."""
+        return cache_key(self.endpoint, self.params())
+
+    def list(self) -> Any:
+        """Fetch the first page of results."""
+        return self.module.list(self.resource, params=self.params())
+
+    def iter_pages(self, concurrency: int = 1) -> Iterator[Any] | AsyncIterator[Any]:
+        """Iterate over every page of results."""
+        return self.module.iter_pages(
+            self.resource, params=self.params(), per_page=self.page_size, concurrency=concurrency
+        )
+
+    def iter(
+        self, concurrency: int = 1
+    ) -> Iterator[dict[str, Any]] | AsyncIterator[dict[str, Any]]:
+        """Iterate over every matching record, following pagination."""
+        return self.module.iter(
+            self.resource, params=self.params(), per_page=self.page_size, concurrency=concurrency
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Query):
+            return self.key == other.key
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self.iter())
+
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        return self.iter().__aiter__()
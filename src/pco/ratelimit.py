@@ -0,0 +1,132 @@
+"""Client-side pacing for the PCO API request rate limit."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+RATE_LIMIT_HEADER = "X-PCO-API-Request-Rate-Limit"
+RATE_PERIOD_HEADER = "X-PCO-API-Request-Rate-Period"
+RATE_COUNT_HEADER = "X-PCO-API-Request-Rate-Count"
+RETRY_AFTER_HEADER = "Retry-After"
+
+
+def _parse_number(value: Any) -> float | None:
+    """Parse a numeric header value, returning None if it is missing or invalid."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Thread-safe limiter that paces requests to PCO's advertised rate limit.
+
+    PCO allows ``limit`` requests per rolling ``period`` seconds. Each request
+    takes a token which is returned ``period`` seconds after the request was
+    sent, so a full bucket of ``limit`` requests can go out immediately and
+    further requests are spaced so that no window ever exceeds the limit.
+
+    The limit and period are updated from the ``X-PCO-API-Request-Rate-*``
+    headers of every response, the server-side request count accounts for
+    requests made by other clients sharing the same credentials, and a
+    ``Retry-After`` header blocks all callers until it has elapsed.
+
+    A single instance can be shared by every thread (and every client) that
+    uses the same credentials.
+    """
+
+    DEFAULT_LIMIT = 100
+    DEFAULT_PERIOD = 20.0
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        period: float = DEFAULT_PERIOD,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            limit: Requests allowed per period until the API reports otherwise
+            period: Length of the rate limit period in seconds
+            clock: Monotonic clock used for scheduling
+        """
+        self.limit = limit
+        self.period = period
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sent: list[float] = []
+        self._blocked_until = 0.0
+
+    def _expire(self, now: float) -> None:
+        """Drop send times that have left the current period."""
+        cutoff = bisect.bisect_right(self._sent, now - self.period)
+        if cutoff:
+            del self._sent[:cutoff]
+
+    def reserve(self) -> float:
+        """Reserve a slot for one request.
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            start = max(now, self._blocked_until)
+            if len(self._sent) >= self.limit:
+                start = max(start, self._sent[-self.limit] + self.period)
+            bisect.insort(self._sent, start)
+            return start - now
+
+    def remaining(self) -> int:
+        """Number of requests that can be sent now without waiting."""
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            if self._blocked_until > now:
+                return 0
+            return max(0, self.limit - len(self._sent))
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, headers: Mapping[str, Any], status_code: int | None = None) -> None:
+        """Update the limiter from the rate limit headers of a response.
+
+        Args:
+            headers: Response headers
+            status_code: Response status code
+        """
+        limit = _parse_number(headers.get(RATE_LIMIT_HEADER))
+        period = _parse_number(headers.get(RATE_PERIOD_HEADER))
+        count = _parse_number(headers.get(RATE_COUNT_HEADER))
+        retry_after = _parse_number(headers.get(RETRY_AFTER_HEADER))
+
+        with self._lock:
+            now = self._clock()
+            if limit is not None and limit > 0:
+                self.limit = int(limit)
+            if period is not None and period > 0:
+                self.period = period
+            self._expire(now)
+
+            if count is not None:
+                # Requests made elsewhere with the same credentials count against us too
+                sent = bisect.bisect_right(self._sent, now)
+                for _ in range(int(count) - sent):
+                    bisect.insort(self._sent, now)
+
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            elif status_code == 429:
+                self._blocked_until = max(self._blocked_until, now + self.period / self.limit)
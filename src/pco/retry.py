@@ -0,0 +1,217 @@
+"""Retry policy and circuit breaker for PCO API requests."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable, Collection, Mapping
+from typing import Any
+
+from pco.exceptions import PCOCircuitOpenError
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(headers: Mapping[str, Any]) -> float | None:
+    """Parse the Retry-After header of a response in seconds."""
+    value = headers.get("Retry-After")
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Delays use exponential backoff with full jitter: attempt ``n`` waits a
+    random time between 0 and ``min(max_backoff, backoff_factor * 2 ** n)``
+    seconds, so concurrent workers do not retry in lockstep. A
+    ``Retry-After`` header sets a lower bound on the delay.
+
+    Rate limited (429) responses are retried for every method, since PCO did
+    not process the request. Server errors and network failures are only
+    retried for idempotent methods, so a POST is never sent twice.
+    """
+
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_BACKOFF_FACTOR = 0.5
+    DEFAULT_MAX_BACKOFF = 30.0
+    DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        status_max_retries: Mapping[int, int] | None = None,
+        retry_network_errors: bool = True,
+        retry_methods: Collection[str] = IDEMPOTENT_METHODS,
+        deadline: float | None = None,
+        respect_retry_after: bool = True,
+        random_func: Callable[[], float] = random.random,
+    ):
+        """Initialize retry policy.
+
+        Args:
+            max_retries: Maximum number of retries for a request
+            backoff_factor: Base delay in seconds for the first retry
+            max_backoff: Upper bound for the backoff delay in seconds
+            retry_statuses: Response status codes that are retried
+            status_max_retries: Per-status overrides of ``max_retries``
+            retry_network_errors: Whether timeouts and network errors are retried
+            retry_methods: Methods retried on server and network errors
+            deadline: Total seconds a request may take including retries
+            respect_retry_after: Whether to wait at least the Retry-After delay
+            random_func: Source of jitter in [0, 1)
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.status_max_retries = dict(status_max_retries or {})
+        self.retry_network_errors = retry_network_errors
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.deadline = deadline
+        self.respect_retry_after = respect_retry_after
+        self._random = random_func
+
+    def backoff(self, attempt: int) -> float:
+        """Get a jittered backoff delay for the given retry attempt (0-based)."""
+        return self._random() * min(self.max_backoff, self.backoff_factor * (2**attempt))
+
+    def get_delay(
+        self,
+        method: str,
+        attempt: int,
+        elapsed: float,
+        status_code: int | None = None,
+        error: Exception | None = None,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """Get the delay before retrying a failed attempt.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of retries already made
+            elapsed: Seconds since the first attempt was sent
+            status_code: Response status code, if a response was received
+            error: Network error raised instead of a response
+            retry_after: Retry-After header value in seconds
+
+        Returns:
+            Seconds to wait before retrying, or None if the request should not
+            be retried
+        """
+        if error is not None:
+            if not self.retry_network_errors or method.upper() not in self.retry_methods:
+                return None
+            max_retries = self.max_retries
+        elif status_code in self.retry_statuses:
+            if status_code != 429 and method.upper() not in self.retry_methods:
+                return None
+            max_retries = self.status_max_retries.get(status_code, self.max_retries)
+        else:
+            return None
+
+        if attempt >= max_retries:
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, retry_after)
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+
+class CircuitBreaker:
+    """Fails requests fast while the PCO API is degraded.
+
+    After ``failure_threshold`` consecutive server errors or network failures
+    the circuit opens and requests raise PCOCircuitOpenError without being
+    sent. Once ``recovery_timeout`` seconds have passed a single trial request
+    is let through; its success closes the circuit, its failure re-opens it.
+    The breaker is thread-safe and may be shared between clients.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    DEFAULT_FAILURE_THRESHOLD = 5
+    DEFAULT_RECOVERY_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before a trial request
+            clock: Monotonic clock
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state of the circuit."""
+        return self._state
+
+    def before_request(self) -> bool:
+        """Check that a request may be sent.
+
+        Returns:
+            True if the request is the half-open trial; its outcome must be
+            recorded, or the slot freed with ``release_trial``
+
+        Raises:
+            PCOCircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return False
+            remaining = self._opened_at + self.recovery_timeout - self._clock()
+            if self._state == self.OPEN and remaining <= 0:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            raise PCOCircuitOpenError(retry_after=max(remaining, 0.0))
+
+    def release_trial(self) -> None:
+        """Free the trial slot of a request that ended without an outcome (e.g. cancelled)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy API."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a server error or network failure."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
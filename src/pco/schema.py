@@ -0,0 +1,90 @@
+"""Resource schemas for validating sparse fieldsets and includes."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Union
+
+Fields = Mapping[str, Union[Iterable[str], str]]
+
+
+@dataclass(frozen=True)
+class ResourceSchema:
+    """What a collection returns and which related resources it can include.
+
+    ``includes`` maps each includable relationship to the type of the
+    resources it returns (e.g., ``{"emails": "Email"}``).
+    """
+
+    type: str
+    includes: Mapping[str, str] = field(default_factory=dict)
+
+    @property
+    def types(self) -> set[str]:
+        """Resource types a response of this collection can contain."""
+        return {self.type, *self.includes.values()}
+
+
+def _names(value: Iterable[str] | str) -> list[str]:
+    """Normalize a comma-separated string or iterable of names."""
+    names = value.split(",") if isinstance(value, str) else list(value)
+    names = [name.strip() for name in names]
+    if not all(names):
+        raise ValueError("Field and include names must not be empty")
+    return names
+
+
+def query_params(
+    schemas: Mapping[str, ResourceSchema],
+    resource: str,
+    params: dict[str, Any] | None,
+    fields: Fields | None = None,
+    include: Iterable[str] | str | None = None,
+) -> dict[str, Any] | None:
+    """Add ``fields[Type]`` and ``include`` parameters to a query.
+
+    When ``resource`` is in ``schemas``, includes must be relationships the
+    collection can include and fieldsets must name types its responses can
+    contain. Collections missing from the table are not validated.
+
+    Args:
+        schemas: Schema table of the module
+        resource: Collection name (e.g., 'people')
+        params: Query parameters to extend
+        fields: Attribute names to return per resource type
+        include: Related resources to include
+
+    Returns:
+        The extended query parameters
+
+    Raises:
+        ValueError: If an include or fieldset type is not valid for the collection
+    """
+    if fields is None and include is None:
+        return params
+    schema = schemas.get(resource)
+    query = dict(params or {})
+
+    if include is not None:
+        names = _names(include)
+        if schema is not None:
+            unknown = [name for name in names if name not in schema.includes]
+            if unknown:
+                allowed = ", ".join(sorted(schema.includes)) or "nothing"
+                raise ValueError(
+                    f"Cannot include {', '.join(unknown)} on {resource} (can include: {allowed})"
+                )
+        existing = _names(query["include"]) if query.get("include") else []
+        query["include"] = ",".join(dict.fromkeys([*existing, *names]))
+
+    for resource_type, attributes in (fields or {}).items():
+        if schema is not None and resource_type not in schema.types:
+            allowed = ", ".join(sorted(schema.types))
+            raise ValueError(
+                f"Responses of {resource} do not contain {resource_type} resources "
+                f"(types: {allowed})"
+            )
+        query[f"fields[{resource_type}]"] = ",".join(_names(attributes))
+
+    return query
@@ -0,0 +1,100 @@
+"""Coalescing of identical concurrent calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class _Call:
+    """A call in flight and its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time across threads.
+
+    Threads that ask for a key while a call for it is in flight wait for
+    that call and receive its result (or exception) instead of starting
+    their own. Results are shared, not copied.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """Run ``func`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identity of the call
+            func: Function producing the result
+
+        Returns:
+            The result of the call in flight for ``key``
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """Runs at most one coroutine per key at a time on an event loop.
+
+    Callers that ask for a key while a call for it is in flight await the
+    same task. The task is shielded, so one caller being cancelled does not
+    cancel the request for the others.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Future[Any]] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``func()`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identity of the call
+            func: Coroutine function producing the result
+
+        Returns:
+            The result of the call in flight for ``key``
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
@@ -0,0 +1,127 @@
+"""Token stores shared between OAuth clients and processes."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from pco.auth import OAuth2Token
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+class TokenStore(ABC):
+    """Where an OAuth2Client keeps its token.
+
+    ``lock`` must exclude every other client using the same store while a
+    token is refreshed, so a refresh token is redeemed only once.
+    """
+
+    @abstractmethod
+    def load(self) -> OAuth2Token | None:
+        """Load the stored token, or None if there is none."""
+
+    @abstractmethod
+    def save(self, token: OAuth2Token) -> None:
+        """Store a token."""
+
+    @abstractmethod
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the store."""
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store shared by the clients of one process."""
+
+    def __init__(self) -> None:
+        self._token: OAuth2Token | None = None
+        self._lock = threading.RLock()
+
+    def load(self) -> OAuth2Token | None:
+        """Load the stored token, or None if there is none."""
+        return self._token
+
+    def save(self, token: OAuth2Token) -> None:
+        """Store a token."""
+        self._token = token
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the store."""
+        with self._lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """Token store kept in a JSON file shared by every process on a host.
+
+    Refreshes are serialized with an ``fcntl`` lock on ``<path>.lock``, and
+    the token file is replaced atomically with owner-only permissions, so
+    readers never see a partial write. The parsed token is reused until the
+    file changes. Where ``fcntl`` is unavailable only the threads of one
+    process are serialized.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """Initialize file token store.
+
+        Args:
+            path: Path of the token file (created on first save)
+        """
+        self.path = os.fspath(path)
+        self.lock_path = f"{self.path}.lock"
+        self._thread_lock = threading.RLock()
+        self._cached: tuple[tuple[int, int, int], OAuth2Token] | None = None
+
+    def load(self) -> OAuth2Token | None:
+        """Load the stored token, or None if there is none."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._cached
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                token = OAuth2Token.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        self._cached = (signature, token)
+        return token
+
+    def save(self, token: OAuth2Token) -> None:
+        """Store a token."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".pco-token-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(token.to_dict(), f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the store, across threads and processes."""
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lock_path, "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,338 @@
+"""Receiver for PCO webhook deliveries."""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import hmac
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from pco import jsonlib
+from pco.exceptions import PCOWebhookError
+from pco.models import PCOData, PCOResponse, parse_pco_response
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = "X-PCO-Webhooks-Authenticity"
+
+WebhookHandler = Callable[["WebhookEvent"], Any]
+
+_STATUS_TEXT = {
+    200: "OK",
+    204: "No Content",
+    400: "Bad Request",
+    401: "Unauthorized",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    500: "Internal Server Error",
+}
+
+
+def compute_signature(body: bytes, secret: str) -> str:
+    """Compute the hex HMAC-SHA256 signature PCO sends for a body."""
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(body: bytes, signature: str | None, secrets: str | Iterable[str]) -> bool:
+    """Check a delivery's signature against one or more subscription secrets.
+
+    Args:
+        body: Raw request body
+        signature: Value of the X-PCO-Webhooks-Authenticity header
+        secrets: Authenticity secret(s) of the webhook subscription(s)
+
+    Returns:
+        True if the signature matches any of the secrets
+    """
+    if not signature:
+        return False
+    if isinstance(secrets, str):
+        secrets = [secrets]
+    return any(
+        hmac.compare_digest(compute_signature(body, secret), signature) for secret in secrets
+    )
+
+
+@dataclass
+class WebhookEvent:
+    """A single webhook event delivery.
+
+    ``name`` is the subscribed event, e.g. ``people.v2.events.person.updated``,
+    and ``payload`` is the resource document it carries.
+    """
+
+    id: str
+    name: str
+    attempt: int
+    payload: PCOResponse
+    raw: dict[str, Any]
+
+    @property
+    def action(self) -> str:
+        """Last part of the event name (e.g., 'created', 'updated', 'destroyed')."""
+        return self.name.rsplit(".", 1)[-1]
+
+    @property
+    def record(self) -> PCOData | None:
+        """The resource the event is about."""
+        records = self.payload.records
+        return records[0] if records else None
+
+
+def parse_events(body: bytes | str | Mapping[str, Any]) -> list[WebhookEvent]:
+    """Parse a webhook delivery body into events.
+
+    Raises:
+        PCOWebhookError: If the body is not a valid delivery
+    """
+    try:
+        document = jsonlib.loads(body) if isinstance(body, (bytes, str)) else body
+        deliveries = document["data"]
+        if isinstance(deliveries, dict):
+            deliveries = [deliveries]
+        events = []
+        for delivery in deliveries:
+            attributes = delivery.get("attributes") or {}
+            payload = attributes.get("payload") or {}
+            if isinstance(payload, (bytes, str)):
+                payload = jsonlib.loads(payload)
+            events.append(
+                WebhookEvent(
+                    id=str(delivery["id"]),
+                    name=attributes["name"],
+                    attempt=int(attributes.get("attempt") or 1),
+                    payload=parse_pco_response(payload),
+                    raw=delivery,
+                )
+            )
+    except PCOWebhookError:
+        raise
+    except Exception as e:
+        raise PCOWebhookError(f"Invalid webhook payload: {e}") from e
+    return events
+
+
+class WebhookReceiver:
+    """Verifies, deduplicates and dispatches PCO webhook deliveries.
+
+    The receiver is a WSGI application; ``asgi`` is the ASGI equivalent and
+    ``serve`` runs it on a local development server. Handlers are
+    registered per event name and may use shell-style wildcards:
+
+        receiver = WebhookReceiver(secret="...")
+
+        @receiver.on("people.v2.events.person.*")
+        def person_changed(event):
+            ...
+
+    Deliveries are acknowledged only after every matching handler returned,
+    so a failing handler makes PCO retry the delivery. Deliveries that were
+    already handled (PCO retries and duplicates) are acknowledged without
+    dispatching them again, and a duplicate arriving while the first copy
+    is still being handled is answered with 409 so PCO retries it later.
+    """
+
+    DEFAULT_DEDUPE_SIZE = 10_000
+
+    def __init__(self, secret: str | Iterable[str] | None, dedupe_size: int = DEFAULT_DEDUPE_SIZE):
+        """Initialize webhook receiver.
+
+        Args:
+            secret: Authenticity secret(s) of the subscription(s), or None to skip verification
+            dedupe_size: Number of recent delivery IDs remembered for deduplication
+        """
+        self.secrets = (
+            [secret] if isinstance(secret, str) else list(secret) if secret is not None else None
+        )
+        self.dedupe_size = dedupe_size
+        self._handlers: list[tuple[str, WebhookHandler]] = []
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._in_flight: set[str] = set()
+        self._lock = threading.Lock()
+
+    def on(self, pattern: str = "*") -> Callable[[WebhookHandler], WebhookHandler]:
+        """Register a handler for events whose name matches a pattern (decorator)."""
+
+        def decorator(handler: WebhookHandler) -> WebhookHandler:
+            self.add_handler(pattern, handler)
+            return handler
+
+        return decorator
+
+    def add_handler(self, pattern: str, handler: WebhookHandler) -> None:
+        """Register a handler for events whose name matches a pattern."""
+        self._handlers.append((pattern, handler))
+
+    def handlers_for(self, name: str) -> list[WebhookHandler]:
+        """Handlers registered for an event name, in registration order."""
+        return [
+            handler for pattern, handler in self._handlers if fnmatch.fnmatchcase(name, pattern)
+        ]
+
+    def is_duplicate(self, event_id: str) -> bool:
+        """Check whether a delivery was already handled."""
+        with self._lock:
+            return event_id in self._seen
+
+    def _reserve(self, event: WebhookEvent) -> bool:
+        """Claim an event for dispatch.
+
+        Returns:
+            False if the event was already handled
+
+        Raises:
+            PCOWebhookError: If another copy of the event is being handled (409)
+        """
+        with self._lock:
+            if event.id in self._seen:
+                return False
+            if event.id in self._in_flight:
+                raise PCOWebhookError(
+                    f"Webhook event {event.id} is already being handled", status_code=409
+                )
+            self._in_flight.add(event.id)
+            return True
+
+    def _release(self, event_id: str, handled: bool) -> None:
+        """Release a claimed event, remembering it if its handlers succeeded."""
+        with self._lock:
+            self._in_flight.discard(event_id)
+            if not handled:
+                return
+            self._seen[event_id] = None
+            self._seen.move_to_end(event_id)
+            while len(self._seen) > self.dedupe_size:
+                self._seen.popitem(last=False)
+
+    def verify(self, body: bytes, headers: Mapping[str, str]) -> list[WebhookEvent]:
+        """Verify a delivery's signature and parse its events.
+
+        Args:
+            body: Raw request body
+            headers: Request headers (matched case-insensitively)
+
+        Raises:
+            PCOWebhookError: If the signature is invalid (401) or the body cannot be parsed (400)
+        """
+        if self.secrets is not None:
+            lowered = {key.lower(): value for key, value in headers.items()}
+            if not verify_signature(body, lowered.get(SIGNATURE_HEADER.lower()), self.secrets):
+                raise PCOWebhookError("Invalid webhook signature", status_code=401)
+        return parse_events(body)
+
+    def handle(self, body: bytes, headers: Mapping[str, str]) -> list[WebhookEvent]:
+        """Verify a delivery and dispatch its new events to their handlers.
+
+        Returns:
+            Events that were dispatched (duplicates are left out)
+
+        Raises:
+            PCOWebhookError: If the delivery is invalid, or an event is being
+                handled by a concurrent delivery (409)
+        """
+        dispatched = []
+        for event in self.verify(body, headers):
+            if not self._reserve(event):
+                continue
+            try:
+                for handler in self.handlers_for(event.name):
+                    handler(event)
+            except BaseException:
+                self._release(event.id, handled=False)
+                raise
+            self._release(event.id, handled=True)
+            dispatched.append(event)
+        return dispatched
+
+    async def handle_async(self, body: bytes, headers: Mapping[str, str]) -> list[WebhookEvent]:
+        """Like ``handle``, awaiting handlers that are coroutine functions."""
+        dispatched = []
+        for event in self.verify(body, headers):
+            if not self._reserve(event):
+                continue
+            try:
+                for handler in self.handlers_for(event.name):
+                    result = handler(event)
+                    if inspect.isawaitable(result):
+                        await result
+            except BaseException:
+                self._release(event.id, handled=False)
+                raise
+            self._release(event.id, handled=True)
+            dispatched.append(event)
+        return dispatched
+
+    def __call__(self, environ: dict[str, Any], start_response: Callable[..., Any]) -> list[bytes]:
+        """WSGI entry point."""
+        if environ.get("REQUEST_METHOD") != "POST":
+            status = 405
+        else:
+            try:
+                length = int(environ.get("CONTENT_LENGTH") or 0)
+            except ValueError:
+                length = 0
+            body = environ["wsgi.input"].read(length) if length else b""
+            headers = {
+                key[5:].replace("_", "-"): value
+                for key, value in environ.items()
+                if key.startswith("HTTP_")
+            }
+            try:
+                self.handle(body, headers)
+                status = 204
+            except PCOWebhookError as e:
+                status = e.status_code
+            except Exception:
+                logger.exception("Webhook delivery failed")
+                status = 500
+        start_response(f"{status} {_STATUS_TEXT[status]}", [("Content-Length", "0")])
+        return []
+
+    async def asgi(
+        self, scope: dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]
+    ) -> None:
+        """ASGI entry point."""
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        if scope["method"] != "POST":
+            status = 405
+        else:
+            headers = {
+                key.decode("latin-1"): value.decode("latin-1")
+                for key, value in scope.get("headers", [])
+            }
+            try:
+                await self.handle_async(body, headers)
+                status = 204
+            except PCOWebhookError as e:
+                status = e.status_code
+            except Exception:
+                logger.exception("Webhook delivery failed")
+                status = 500
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-length", b"0")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8000) -> None:
+        """Serve the receiver on a local development server until interrupted."""
+        from wsgiref.simple_server import make_server
+
+        with make_server(host, port, self) as server:
+            server.serve_forever()
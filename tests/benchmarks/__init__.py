@@ -0,0 +1 @@
+"""Performance benchmarks for python-pco."""
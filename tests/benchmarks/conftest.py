@@ -0,0 +1,27 @@
+"""Fixtures for benchmarks."""
+
+import pytest
+
+import pco
+from tests.benchmarks.helpers import BenchmarkResults, latest_results
+
+
+@pytest.fixture(scope="session")
+def bench_results(request):
+    """Collect measurements and save them as ``<benchmark-dir>/<pco version>.json``.
+
+    When results of another release are present, the change of every
+    measurement against the most recent of them is printed.
+    """
+    results = BenchmarkResults()
+    yield results
+    if not results.results:
+        return
+    directory = request.config.getoption("--benchmark-dir")
+    previous = latest_results(directory, exclude=pco.__version__)
+    path = results.save(directory, pco.__version__)
+    print(f"\nbenchmark results saved to {path}")
+    if previous is not None:
+        print(f"compared with {previous['version']}:")
+        for line in results.compare(previous):
+            print(f"  {line}")
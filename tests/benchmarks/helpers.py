@@ -0,0 +1,78 @@
+"""Timing and result-keeping helpers for benchmarks."""
+
+from __future__ import annotations
+
+import json
+import platform
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+REGRESSION_THRESHOLD = 0.10
+
+
+def time_per_call(func: Callable[[], object], number: int = 50, repeat: int = 5) -> float:
+    """Best-of-``repeat`` average seconds per call of ``func``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+class BenchmarkResults:
+    """Benchmark measurements of one run, saved per release for comparison."""
+
+    def __init__(self) -> None:
+        self.results: dict[str, dict[str, object]] = {}
+
+    def record(self, name: str, value: float, unit: str, higher_is_better: bool = False) -> None:
+        """Record a measurement."""
+        self.results[name] = {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+    def save(self, directory: str | Path, version: str) -> Path:
+        """Write the results to ``<directory>/<version>.json``.
+
+        Measurements already saved for the version but not taken in this
+        run (e.g., when only some benchmarks were selected) are kept.
+        """
+        path = Path(directory) / f"{version}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        results = json.loads(path.read_text())["results"] if path.exists() else {}
+        results.update(self.results)
+        document = {
+            "version": version,
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+        return path
+
+    def compare(self, previous: dict) -> list[str]:
+        """Describe the change of every measurement against a previous run."""
+        lines = []
+        for name, result in sorted(self.results.items()):
+            before = previous.get("results", {}).get(name)
+            if not before or not before["value"]:
+                continue
+            change = (result["value"] - before["value"]) / before["value"]
+            worse = change < 0 if result["higher_is_better"] else change > 0
+            marker = "  REGRESSION" if worse and abs(change) >= REGRESSION_THRESHOLD else ""
+            lines.append(
+                f"{name}: {before['value']:.4g} -> {result['value']:.4g} {result['unit']} "
+                f"({change:+.1%}){marker}"
+            )
+        return lines
+
+
+def latest_results(directory: str | Path, exclude: str) -> dict | None:
+    """Load the most recently recorded results other than ``exclude``'s."""
+    paths = [path for path in Path(directory).glob("*.json") if path.stem != exclude]
+    if not paths:
+        return None
+    return json.loads(max(paths, key=lambda path: path.stat().st_mtime).read_text())
@@ -0,0 +1,110 @@
+"""Synthetic JSON:API payloads shaped like real PCO responses."""
+
+from __future__ import annotations
+
+import json
+
+BASE_URL = "https://api.planningcenteronline.com"
+
+
+def person(person_id: int) -> dict:
+    """A People API Person resource with the attributes PCO returns."""
+    return {
+        "type": "Person",
+        "id": str(person_id),
+        "attributes": {
+            "accounting_administrator": False,
+            "anniversary": None,
+            "avatar": f"{BASE_URL}/static/no_photo_thumbnail_man_gray.svg",
+            "birthdate": "1984-03-17",
+            "child": False,
+            "created_at": "2019-06-04T15:21:09Z",
+            "demographic_avatar_url": f"{BASE_URL}/static/no_photo_thumbnail_man_gray.svg",
+            "first_name": f"First{person_id}",
+            "gender": "M",
+            "given_name": None,
+            "grade": None,
+            "graduation_year": None,
+            "inactivated_at": None,
+            "last_name": f"Last{person_id}",
+            "medical_notes": None,
+            "membership": "Member",
+            "middle_name": None,
+            "name": f"First{person_id} Last{person_id}",
+            "nickname": None,
+            "passed_background_check": True,
+            "people_permissions": "Editor",
+            "remote_id": None,
+            "school_type": None,
+            "site_administrator": False,
+            "status": "active",
+            "updated_at": "2024-01-12T18:44:51Z",
+        },
+        "relationships": {
+            "primary_campus": {"data": {"type": "PrimaryCampus", "id": "1"}},
+            "gender": {"data": {"type": "Gender", "id": "2"}},
+            "emails": {"data": [{"type": "Email", "id": str(person_id * 10)}]},
+            "households": {"data": [{"type": "Household", "id": str(person_id // 3)}]},
+        },
+        "links": {"self": f"{BASE_URL}/people/v2/people/{person_id}"},
+    }
+
+
+def email(email_id: int, person_id: int) -> dict:
+    """A People API Email resource."""
+    return {
+        "type": "Email",
+        "id": str(email_id),
+        "attributes": {
+            "address": f"person{person_id}@example.com",
+            "blocked": False,
+            "created_at": "2019-06-04T15:21:09Z",
+            "location": "Home",
+            "primary": True,
+            "updated_at": "2024-01-12T18:44:51Z",
+        },
+        "relationships": {"person": {"data": {"type": "Person", "id": str(person_id)}}},
+        "links": {"self": f"{BASE_URL}/people/v2/emails/{email_id}"},
+    }
+
+
+def people_page(
+    per_page: int = 100,
+    offset: int = 0,
+    total_count: int | None = None,
+    include_emails: bool = False,
+) -> dict:
+    """A page of the People list endpoint."""
+    total_count = per_page if total_count is None else total_count
+    ids = range(offset + 1, min(offset + per_page, total_count) + 1)
+    page = {
+        "links": {"self": f"{BASE_URL}/people/v2/people?offset={offset}&per_page={per_page}"},
+        "data": [person(i) for i in ids],
+        "included": [email(i * 10, i) for i in ids] if include_emails else [],
+        "meta": {
+            "total_count": total_count,
+            "count": len(ids),
+            "can_order_by": [
+                "given_name",
+                "first_name",
+                "last_name",
+                "birthdate",
+                "created_at",
+                "updated_at",
+            ],
+            "can_query_by": ["id", "first_name", "last_name", "updated_at", "status"],
+            "can_include": ["addresses", "emails", "households", "phone_numbers"],
+            "parent": {"id": "1", "type": "Organization"},
+        },
+    }
+    if offset + per_page < total_count:
+        page["links"]["next"] = (
+            f"{BASE_URL}/people/v2/people?offset={offset + per_page}&per_page={per_page}"
+        )
+        page["meta"]["next"] = {"offset": offset + per_page}
+    return page
+
+
+def people_page_bytes(**kwargs) -> bytes:
+    """A People page encoded as it arrives over the wire."""
+    return json.dumps(people_page(**kwargs)).encode()
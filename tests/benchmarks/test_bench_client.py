@@ -0,0 +1,114 @@
+"""Benchmarks for the client hot paths, served offline by httpx.MockTransport."""
+
+import json
+import time
+import tracemalloc
+
+import httpx
+import pytest
+
+from pco.models import parse_pco_response
+from pco.ratelimit import RateLimiter
+from tests.benchmarks.helpers import time_per_call
+from tests.benchmarks.payloads import people_page, people_page_bytes
+
+pytestmark = pytest.mark.benchmark
+
+PER_PAGE = 100
+CRAWL_RECORDS = 5_000
+MEMORY_CRAWL_RECORDS = 20_000
+
+
+def people_handler(total_count):
+    """Serve the People list from pre-encoded pages, keyed by offset."""
+    pages = {
+        offset: people_page_bytes(per_page=PER_PAGE, offset=offset, total_count=total_count)
+        for offset in range(0, total_count, PER_PAGE)
+    }
+
+    def handler(request):
+        return httpx.Response(200, content=pages[int(request.url.params.get("offset", 0))])
+
+    return handler
+
+
+@pytest.fixture
+def make_client(mock_transport_client):
+    """Factory for clients whose rate limiter never throttles the offline crawl."""
+    return lambda handler: mock_transport_client(
+        handler, rate_limiter=RateLimiter(limit=10**9, period=1.0)
+    )
+
+
+def test_bench_request_overhead(make_client, bench_results):
+    """Per-request cost PCOClient adds on top of the HTTP client."""
+    body = b'{"data": {"type": "Person", "id": "1", "attributes": {}}}'
+    client = make_client(lambda request: httpx.Response(200, content=body))
+    http_client = client._http_client
+    url = f"{client.base_url}/people/v2/people/1"
+
+    raw = time_per_call(
+        lambda: http_client.request("GET", url, headers={"Accept": "application/json"}).json(),
+        number=500,
+    )
+    wrapped = time_per_call(lambda: client._request("GET", "/people/v2/people/1"), number=500)
+
+    overhead = wrapped - raw
+    print(
+        f"\nhttpx request + json: {raw * 1e6:.1f} us, PCOClient._request: {wrapped * 1e6:.1f} us, "
+        f"overhead {overhead * 1e6:.1f} us"
+    )
+    bench_results.record("request.raw_httpx", raw * 1e6, "us")
+    bench_results.record("request.pco_request", wrapped * 1e6, "us")
+    bench_results.record("request.overhead", overhead * 1e6, "us")
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_bench_pagination_throughput(make_client, bench_results, concurrency):
+    """Records per second through iter_people over a mocked collection."""
+    client = make_client(people_handler(CRAWL_RECORDS))
+
+    best = 0.0
+    for _ in range(3):
+        start = time.perf_counter()
+        count = sum(
+            1 for _ in client.people.iter_people(per_page=PER_PAGE, concurrency=concurrency)
+        )
+        best = max(best, count / (time.perf_counter() - start))
+    assert count == CRAWL_RECORDS
+
+    print(f"\niter_people, concurrency={concurrency}: {best:,.0f} records/s")
+    bench_results.record(
+        f"pagination.records_per_second.concurrency_{concurrency}",
+        best,
+        "records/s",
+        higher_is_better=True,
+    )
+
+
+def test_bench_parse_pco_response_per_page(bench_results):
+    """Cost of validating a decoded 100-record page into PCOResponse."""
+    page = json.loads(json.dumps(people_page(per_page=PER_PAGE, include_emails=True)))
+    seconds = time_per_call(lambda: parse_pco_response(page))
+    print(f"\nparse_pco_response, 100 records + 100 included: {seconds * 1e3:.3f} ms")
+    bench_results.record("models.parse_pco_response_per_page", seconds * 1e3, "ms")
+
+
+def test_bench_crawl_peak_memory(make_client, bench_results):
+    """Peak memory of streaming a large collection through iter_people."""
+    client = make_client(people_handler(MEMORY_CRAWL_RECORDS))
+    page_size = len(people_page_bytes(per_page=PER_PAGE))
+
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in client.people.iter_people(per_page=PER_PAGE))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert count == MEMORY_CRAWL_RECORDS
+
+    print(
+        f"\niter_people over {count:,} records: peak {peak / 2**20:.2f} MiB "
+        f"({peak / page_size:.1f}x one encoded page)"
+    )
+    bench_results.record("memory.crawl_peak", peak / 2**20, "MiB")
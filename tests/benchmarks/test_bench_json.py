@@ -0,0 +1,43 @@
+"""Benchmarks for response JSON decoding."""
+
+import httpx
+import pytest
+
+from pco import jsonlib
+from pco.client import PCOClient
+from tests.benchmarks.helpers import time_per_call
+from tests.benchmarks.payloads import people_page_bytes
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def page_bytes():
+    """A 100-record People page as raw bytes."""
+    return people_page_bytes(per_page=100, include_emails=True)
+
+
+def test_bench_decode_people_page(page_bytes, bench_results):
+    """Compare per-page decode time of the available JSON decoders."""
+    decoders = {"stdlib": jsonlib.stdlib_loads}
+    if jsonlib.orjson is not None:
+        decoders["orjson"] = jsonlib.orjson.loads
+
+    results = {
+        name: time_per_call(lambda loads=loads: loads(page_bytes))
+        for name, loads in decoders.items()
+    }
+    for name, seconds in results.items():
+        print(f"\ndecode 100-record People page [{name}]: {seconds * 1e3:.3f} ms")
+        bench_results.record(f"json.decode_page.{name}", seconds * 1e3, "ms")
+    assert all(seconds > 0 for seconds in results.values())
+
+
+def test_bench_handle_response(mock_oauth_client, page_bytes, bench_results):
+    """Per-page cost of PCOClient._handle_response with each decoder."""
+    response = httpx.Response(200, content=page_bytes)
+    for name, loads in {"stdlib": jsonlib.stdlib_loads, "default": jsonlib.loads}.items():
+        client = PCOClient(oauth_client=mock_oauth_client, json_loads=loads)
+        seconds = time_per_call(lambda client=client: client._handle_response(response))
+        print(f"\n_handle_response 100-record People page [{name}]: {seconds * 1e3:.3f} ms")
+        bench_results.record(f"json.handle_response.{name}", seconds * 1e3, "ms")
@@ -0,0 +1,56 @@
+"""Benchmarks for parsing pages into models."""
+
+import json
+
+import pytest
+
+from pco.models import PCOPerson, flatten_record, parse_pco_response, parse_records, to_models
+from tests.benchmarks.helpers import time_per_call
+from tests.benchmarks.payloads import people_page
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def page():
+    """A decoded 100-record People page."""
+    return json.loads(json.dumps(people_page(per_page=100, include_emails=True)))
+
+
+def test_bench_lazy_records_vs_pydantic(page, bench_results):
+    """Per-page cost of reading two attributes from every record."""
+
+    def eager():
+        return [
+            (record.attributes["first_name"], record.attributes["status"])
+            for record in parse_pco_response(page).data
+        ]
+
+    def lazy():
+        return [(record.first_name, record.status) for record in parse_records(page)]
+
+    assert eager() == lazy()
+    eager_seconds = time_per_call(eager)
+    lazy_seconds = time_per_call(lazy)
+    print(f"\nparse_pco_response, 2 attributes x 100 records: {eager_seconds * 1e3:.3f} ms")
+    print(f"parse_records, 2 attributes x 100 records: {lazy_seconds * 1e3:.3f} ms")
+    bench_results.record("models.read_two_attributes.parse_pco_response", eager_seconds * 1e3, "ms")
+    bench_results.record("models.read_two_attributes.parse_records", lazy_seconds * 1e3, "ms")
+
+
+def test_bench_batch_model_conversion(page, bench_results):
+    """Per-page cost of converting records into PCOPerson models."""
+
+    def per_record():
+        return [PCOPerson(**flatten_record(record)) for record in page["data"]]
+
+    def batch():
+        return to_models(page, PCOPerson)
+
+    assert per_record() == batch()
+    per_record_seconds = time_per_call(per_record)
+    batch_seconds = time_per_call(batch)
+    print(f"\nPCOPerson per record, 100 records: {per_record_seconds * 1e3:.3f} ms")
+    print(f"to_models(PCOPerson), 100 records: {batch_seconds * 1e3:.3f} ms")
+    bench_results.record("models.to_person.per_record", per_record_seconds * 1e3, "ms")
+    bench_results.record("models.to_person.batch", batch_seconds * 1e3, "ms")
@@ -2,10 +2,33 @@
 
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
 
 from pco.auth import OAuth2Client, OAuth2Token
-from pco.client import PCOClient
+from pco.client import AsyncPCOClient, PCOClient
+
+
+def pytest_addoption(parser):
+    """Add command line options."""
+    parser.addoption(
+        "--run-benchmarks", action="store_true", default=False, help="run performance benchmarks"
+    )
+    parser.addoption(
+        "--benchmark-dir",
+        default=".benchmarks",
+        help="directory where benchmark results are saved per release",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless --run-benchmarks is given."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="use --run-benchmarks to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 @pytest.fixture
@@ -25,6 +48,7 @@ def mock_oauth_client(mock_token):
     client = MagicMock(spec=OAuth2Client)
     client.get_authorization_header.return_value = {"Authorization": "Bearer test_access_token"}
     client.get_token.return_value = mock_token
+    client.needs_refresh.return_value = False
     return client
 
 
@@ -40,6 +64,30 @@ def pco_client(mock_oauth_client):
     return PCOClient(oauth_client=mock_oauth_client)
 
 
+@pytest.fixture
+def mock_transport_client(mock_oauth_client):
+    """Factory for PCOClients whose requests are answered by an httpx.MockTransport handler."""
+
+    def make(handler, **kwargs):
+        kwargs.setdefault("oauth_client", mock_oauth_client)
+        http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        return PCOClient(http_client=http_client, **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def mock_transport_async_client(mock_oauth_client):
+    """Async variant of mock_transport_client, building AsyncPCOClients."""
+
+    def make(handler, **kwargs):
+        kwargs.setdefault("oauth_client", mock_oauth_client)
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncPCOClient(http_client=http_client, **kwargs)
+
+    return make
+
+
 @pytest.fixture
 def sample_person_data():
     """Sample person data for testing."""
@@ -0,0 +1,272 @@
+"""Tests for AsyncPCOClient and the async modules."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from pco.auth import OAuth2Client, OAuth2Token
+from pco.client import AsyncPCOClient
+from pco.exceptions import PCONotFoundError
+from pco.modules import AsyncPeopleModule, AsyncServicesModule
+from pco.retry import CircuitBreaker
+
+
+def test_async_client_initialization_error_both_auth(mock_oauth_client, mock_token):
+    """Test that providing both oauth_client and token raises error."""
+    with pytest.raises(ValueError, match="Cannot provide both"):
+        AsyncPCOClient(oauth_client=mock_oauth_client, token=mock_token)
+
+
+def test_async_client_modules(mock_oauth_client):
+    """Test module properties return async modules."""
+    client = AsyncPCOClient(oauth_client=mock_oauth_client)
+    assert isinstance(client.people, AsyncPeopleModule)
+    assert isinstance(client.services, AsyncServicesModule)
+    assert client.people is client.people
+
+
+@pytest.mark.asyncio
+async def test_async_get_request_success(mock_transport_async_client, sample_person_data):
+    """Test successful async GET request."""
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json=sample_person_data)
+
+    async with mock_transport_async_client(handler) as client:
+        result = await client.people.get_person("123")
+
+    assert result == sample_person_data
+    assert seen[0].url.path == "/people/v2/people/123"
+    assert seen[0].headers["Authorization"] == "Bearer test_access_token"
+
+
+@pytest.mark.asyncio
+async def test_async_create_and_delete(mock_transport_async_client, sample_person_data):
+    """Test async create and delete go through the module wrappers."""
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.url.path, request.content))
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(201, json=sample_person_data)
+
+    data = {"data": {"type": "Person", "attributes": {"first_name": "John"}}}
+    async with mock_transport_async_client(handler) as client:
+        created = await client.people.create_person(data)
+        deleted = await client.people.delete_person("123")
+
+    assert created == sample_person_data
+    assert deleted is None
+    assert seen[0][:2] == ("POST", "/people/v2/people")
+    assert json.loads(seen[0][2]) == data
+    assert seen[1][:2] == ("DELETE", "/people/v2/people/123")
+
+
+@pytest.mark.asyncio
+async def test_async_get_related(mock_transport_async_client):
+    """Test async related resource lookup."""
+    items_data = {"data": [{"id": "1", "type": "Item"}]}
+
+    def handler(request):
+        assert request.url.path == "/services/v2/plans/1/items"
+        return httpx.Response(200, json=items_data)
+
+    async with mock_transport_async_client(handler) as client:
+        assert await client.services.get_plan_items("1") == items_data
+
+
+@pytest.mark.asyncio
+async def test_async_get_request_not_found(mock_transport_async_client):
+    """Test async GET request with 404 error."""
+
+    def handler(request):
+        return httpx.Response(404, json={"error": "Not found"})
+
+    async with mock_transport_async_client(handler) as client:
+        with pytest.raises(PCONotFoundError):
+            await client.get("/people/v2/people/999")
+
+
+@pytest.mark.asyncio
+async def test_async_rate_limit_retry(mock_transport_async_client, sample_people_list):
+    """Test async client retries after a rate limit response."""
+    responses = [httpx.Response(429), httpx.Response(200, json=sample_people_list)]
+
+    def handler(request):
+        return responses.pop(0)
+
+    async with mock_transport_async_client(handler) as client:
+        with patch("pco.client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = await client.people.list_people()
+
+    assert result == sample_people_list
+    mock_sleep.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_context_manager(mock_oauth_client):
+    """Test AsyncPCOClient as async context manager."""
+    client = AsyncPCOClient(oauth_client=mock_oauth_client)
+    with patch.object(client._http_client, "aclose", new=AsyncMock()) as mock_aclose:
+        async with client as c:
+            assert c is client
+        mock_aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_iter_people(mock_transport_async_client):
+    """Test async iteration follows pagination."""
+
+    def handler(request):
+        if request.url.params.get("offset") == "1":
+            return httpx.Response(200, json={"data": [{"id": "2", "type": "Person"}], "meta": {}})
+        return httpx.Response(
+            200, json={"data": [{"id": "1", "type": "Person"}], "meta": {"next": {"offset": 1}}}
+        )
+
+    async with mock_transport_async_client(handler) as client:
+        ids = [person["id"] async for person in client.people.iter_people(per_page=1)]
+
+    assert ids == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_async_iter_people_concurrent(mock_transport_async_client):
+    """Test async concurrent iteration yields pages in order."""
+    requested = []
+
+    def handler(request):
+        offset = int(request.url.params.get("offset", 0))
+        requested.append(offset)
+        body = {
+            "data": [{"id": str(offset), "type": "Person"}],
+            "meta": {"total_count": 5, "next": {"offset": offset + 1} if offset < 4 else None},
+        }
+        return httpx.Response(200, json=body)
+
+    async with mock_transport_async_client(handler) as client:
+        ids = [
+            person["id"] async for person in client.people.iter_people(per_page=1, concurrency=2)
+        ]
+
+    assert ids == ["0", "1", "2", "3", "4"]
+    assert sorted(requested) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_async_get_people_by_ids(mock_transport_async_client):
+    """Test async batched fetch by ID."""
+
+    def handler(request):
+        ids = request.url.params["where[id]"].split(",")
+        return httpx.Response(
+            200, json={"data": [{"id": i, "type": "Person"} for i in ids if i != "9"]}
+        )
+
+    async with mock_transport_async_client(handler) as client:
+        result = await client.people.get_people_by_ids(["1", "2", "9"])
+
+    assert sorted(result.found) == ["1", "2"]
+    assert result.missing == ["9"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kwargs", [{"concurrency": 0}, {"chunk_size": 0}, {"chunk_size": 101}])
+async def test_async_get_many_rejects_bad_limits(mock_transport_async_client, kwargs):
+    """Test out-of-range limits raise instead of waiting forever."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"data": []})
+
+    async with mock_transport_async_client(handler) as client:
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(client.people.get_many("people", ["1"], **kwargs), timeout=1)
+    assert requests == []
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_create(mock_transport_async_client):
+    """Test async bulk create reports validation errors and stops at the threshold."""
+
+    def handler(request):
+        if json.loads(request.content)["n"] % 2:
+            return httpx.Response(400, json={"error": "invalid"})
+        return httpx.Response(201, json={"data": {"id": "1", "type": "Household"}})
+
+    async with mock_transport_async_client(handler) as client:
+        result = await client.people.bulk_create(
+            "households", [{"n": n} for n in range(6)], concurrency=2
+        )
+        stopped = await client.people.bulk_create(
+            "households", [{"n": 1}] * 5, concurrency=1, max_errors=1
+        )
+
+    assert [item.index for item in result.succeeded] == [0, 2, 4]
+    assert [item.index for item in result.validation_errors] == [1, 3, 5]
+    assert stopped.stopped and len(stopped.failed) == 1 and len(stopped.skipped) == 4
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_trial_frees_circuit(mock_transport_async_client):
+    """Test cancelling the half-open trial request lets the next request through."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+    breaker.record_failure()
+    started = asyncio.Event()
+
+    async def handler(request):
+        if not started.is_set():
+            started.set()
+            await asyncio.sleep(10)
+        return httpx.Response(200, json={"data": []})
+
+    client = mock_transport_async_client(handler, circuit_breaker=breaker)
+    async with client:
+        task = asyncio.create_task(client.get("/people/v2/people"))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert await client.get("/people/v2/people") == {"data": []}
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_async_token_refresh_runs_off_the_event_loop(mock_transport_async_client):
+    """Test proactive and 401-triggered refreshes do not block the event loop thread."""
+    refresh_threads = []
+
+    def token_handler(request):
+        refresh_threads.append(threading.get_ident())
+        return httpx.Response(
+            200, json={"access_token": f"token_{len(refresh_threads)}", "expires_in": 3600}
+        )
+
+    oauth_client = OAuth2Client(
+        client_id="test_id",
+        client_secret="test_secret",
+        http_client=httpx.Client(transport=httpx.MockTransport(token_handler)),
+    )
+    oauth_client.set_token(
+        OAuth2Token(access_token="old_token", refresh_token="refresh_token", expires_in=30)
+    )
+
+    def api_handler(request):
+        if request.headers["Authorization"] == "Bearer token_1":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"data": []})
+
+    client = mock_transport_async_client(api_handler, oauth_client=oauth_client)
+    async with client:
+        assert await client.get("/people/v2/people") == {"data": []}
+
+    assert len(refresh_threads) == 2
+    assert threading.get_ident() not in refresh_threads
@@ -140,7 +140,147 @@ def test_get_authorization_header_no_token():
 def test_oauth2_client_context_manager():
     """Test OAuth2Client as context manager."""
     client = OAuth2Client(client_id="test_id", client_secret="test_secret")
-    with client as c:
-        assert c == client
-    # Verify close was called
-    client._http_client.close.assert_called_once()
+    with patch.object(client._http_client, "close") as mock_close:
+        with client as c:
+            assert c == client
+        # Verify close was called
+        mock_close.assert_called_once()
+
+
+def test_share_http_client():
+    """Test sharing another client's pool closes the owned client only."""
+    client = OAuth2Client(client_id="test_id", client_secret="test_secret")
+    owned = client._http_client
+    shared = MagicMock(spec=httpx.Client)
+    client.share_http_client(shared)
+    assert owned.is_closed
+    assert client._http_client is shared
+    client.close()
+    shared.close.assert_not_called()
+
+
+def test_share_http_client_keeps_open_shared_pool():
+    """Test a second pool is only adopted once the shared one is closed."""
+    client = OAuth2Client(client_id="test_id", client_secret="test_secret")
+    first, second = httpx.Client(), httpx.Client()
+    client.share_http_client(first)
+    client.share_http_client(second)
+    assert client._http_client is first
+
+    first.close()
+    client.share_http_client(second)
+    assert client._http_client is second
+    second.close()
+
+
+def token_endpoint(responses, calls):
+    """An HTTP client whose token endpoint returns the given responses in order."""
+
+    def handler(request):
+        calls.append(request)
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_get_token_refreshes_within_skew():
+    """Test the token is refreshed before it actually expires."""
+    calls = []
+    http_client = token_endpoint(
+        [httpx.Response(200, json={"access_token": "new_token", "expires_in": 3600})], calls
+    )
+    client = OAuth2Client(
+        client_id="test_id", client_secret="test_secret", http_client=http_client, refresh_skew=120
+    )
+    client.set_token(
+        OAuth2Token(access_token="old_token", refresh_token="refresh_token", expires_in=60)
+    )
+
+    assert client.get_token().access_token == "new_token"
+    assert client.get_token().access_token == "new_token"
+    assert len(calls) == 1
+
+
+def test_get_token_single_flight_refresh():
+    """Test concurrent callers share one refresh."""
+    import threading
+
+    calls = []
+    http_client = token_endpoint(
+        [httpx.Response(200, json={"access_token": "new_token", "expires_in": 3600})], calls
+    )
+    client = OAuth2Client(client_id="test_id", client_secret="test_secret", http_client=http_client)
+    client.set_token(
+        OAuth2Token(access_token="old_token", refresh_token="refresh_token", expires_in=1)
+    )
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.get_token().access_token))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["new_token"] * 8
+    assert len(calls) == 1
+
+
+def test_get_token_refresh_failure_raises_when_expired():
+    """Test a failed refresh of an expired token raises instead of returning it."""
+    http_client = token_endpoint([httpx.Response(400, json={"error": "invalid_grant"})], [])
+    client = OAuth2Client(client_id="test_id", client_secret="test_secret", http_client=http_client)
+    token = OAuth2Token(access_token="old_token", refresh_token="refresh_token")
+    token._expires_at = 0
+    client.set_token(token)
+
+    with pytest.raises(PCOAuthError) as exc_info:
+        client.get_token()
+    assert exc_info.value.status_code == 400
+
+
+def test_get_token_refresh_failure_keeps_valid_token():
+    """Test a failed proactive refresh keeps the still-valid token and retries later."""
+    calls = []
+    responses = [
+        httpx.Response(503),
+        httpx.Response(200, json={"access_token": "new_token", "expires_in": 3600}),
+    ]
+    client = OAuth2Client(
+        client_id="test_id",
+        client_secret="test_secret",
+        http_client=token_endpoint(responses, calls),
+    )
+    client.set_token(
+        OAuth2Token(access_token="old_token", refresh_token="refresh_token", expires_in=30)
+    )
+
+    assert client.get_token().access_token == "old_token"
+    assert client.get_token().access_token == "new_token"
+    assert len(calls) == 2
+
+
+def test_refresh_after_unauthorized():
+    """Test a 401 refreshes the token unless another caller already did."""
+    calls = []
+    http_client = token_endpoint(
+        [httpx.Response(200, json={"access_token": "new_token", "expires_in": 3600})], calls
+    )
+    client = OAuth2Client(client_id="test_id", client_secret="test_secret", http_client=http_client)
+    client.set_token(
+        OAuth2Token(access_token="old_token", refresh_token="refresh_token", expires_in=3600)
+    )
+
+    assert client.refresh_after_unauthorized("Bearer old_token")
+    assert client.get_token().access_token == "new_token"
+    assert client.refresh_after_unauthorized("Bearer old_token")
+    assert len(calls) == 1
+
+
+def test_refresh_after_unauthorized_without_refresh_token():
+    """Test a 401 is not retried when the token cannot be refreshed."""
+    client = OAuth2Client(client_id="test_id", client_secret="test_secret")
+    client.set_token(OAuth2Token(access_token="token"))
+    assert not client.refresh_after_unauthorized("Bearer token")
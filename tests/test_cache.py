@@ -0,0 +1,233 @@
+"""Tests for response caching."""
+
+import subprocess
+import sys
+import threading
+
+import httpx
+import pytest
+
+from pco.cache import MemoryCache, SQLiteCache, cache_key
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_key_sorts_params():
+    """Test equivalent parameter dicts share a key."""
+    assert cache_key("/people/v2/people", {"b": 2, "a": 1}) == cache_key(
+        "/people/v2/people", {"a": 1, "b": 2}
+    )
+    assert cache_key("/people/v2/people") == "/people/v2/people"
+
+
+def test_memory_cache_lru_eviction():
+    """Test the least recently used entry is evicted first."""
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", cache.entry({"id": "a"}))
+    cache.set("b", cache.entry({"id": "b"}))
+    cache.get("a")
+    cache.set("c", cache.entry({"id": "c"}))
+    assert cache.get("b") is None
+    assert cache.get("a").data == {"id": "a"}
+    assert len(cache) == 2
+
+
+def test_memory_cache_ttl():
+    """Test stale entries without an ETag are dropped, those with one are kept."""
+    clock = FakeClock()
+    cache = MemoryCache(ttl=10.0, clock=clock)
+    cache.set("plain", cache.entry({}))
+    cache.set("tagged", cache.entry({}, etag='"v1"'))
+    assert cache.is_fresh(cache.get("plain"))
+    clock.now += 10.0
+    assert cache.get("plain") is None
+    entry = cache.get("tagged")
+    assert entry is not None and not cache.is_fresh(entry)
+
+
+def test_memory_cache_invalidate():
+    """Test invalidation removes an endpoint and paths below it only."""
+    cache = MemoryCache()
+    for key in [
+        "/people/v2/people/1",
+        "/people/v2/people/1?include=emails",
+        "/people/v2/people/1/emails",
+        "/people/v2/people/10",
+    ]:
+        cache.set(key, cache.entry({}))
+    cache.invalidate("/people/v2/people/1")
+    assert cache.get("/people/v2/people/10") is not None
+    assert len(cache) == 1
+
+
+def test_client_serves_fresh_entries_from_cache(mock_transport_client, sample_person_data):
+    """Test a fresh cached GET sends no request."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=sample_person_data)
+
+    client = mock_transport_client(handler, cache=MemoryCache(ttl=60.0))
+    assert client.giving.get_fund("1") == sample_person_data
+    assert client.giving.get_fund("1") == sample_person_data
+    assert len(requests) == 1
+
+
+def test_client_revalidates_with_etag(mock_transport_client, sample_person_data):
+    """Test stale entries are revalidated with If-None-Match and a 304 reuses the cached data."""
+    clock = FakeClock()
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json=sample_person_data, headers={"ETag": '"v1"'})
+
+    cache = MemoryCache(ttl=5.0, clock=clock)
+    client = mock_transport_client(handler, cache=cache)
+    first = client.services.get_team("1")
+    clock.now += 6.0
+    second = client.services.get_team("1")
+
+    assert second is first
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert cache.is_fresh(cache.get("/services/v2/teams/1"))
+
+
+def test_client_writes_invalidate_cache(mock_transport_client, sample_person_data):
+    """Test a write to a resource invalidates its cached GET."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=sample_person_data)
+
+    client = mock_transport_client(handler, cache=MemoryCache())
+    client.people.get_person("123")
+    client.people.update_person("123", {"data": {"attributes": {"first_name": "Jane"}}})
+    client.people.get_person("123")
+    assert [request.method for request in requests] == ["GET", "PATCH", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_cache(mock_transport_async_client, sample_person_data):
+    """Test the async client serves fresh entries from the cache."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=sample_person_data)
+
+    async with mock_transport_async_client(handler, cache=MemoryCache()) as client:
+        await client.checkins.get_event("1")
+        await client.checkins.get_event("1")
+    assert len(requests) == 1
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    """Create a SQLiteCache in a temporary directory."""
+    cache = SQLiteCache(tmp_path / "cache.db")
+    yield cache
+    cache.close()
+
+
+def test_sqlite_cache_roundtrip(sqlite_cache):
+    """Test entries and their validators survive a round trip."""
+    sqlite_cache.set("/giving/v2/funds/1", sqlite_cache.entry({"data": {"id": "1"}}, etag='"v1"'))
+    entry = sqlite_cache.get("/giving/v2/funds/1")
+    assert entry.data == {"data": {"id": "1"}}
+    assert entry.etag == '"v1"'
+    assert sqlite_cache.is_fresh(entry)
+
+
+def test_sqlite_cache_expiry(tmp_path):
+    """Test stale entries without an ETag are dropped."""
+    clock = FakeClock()
+    cache = SQLiteCache(tmp_path / "cache.db", ttl=1.0, clock=clock)
+    cache.set("a", cache.entry({}))
+    cache.set("b", cache.entry({}, etag='"x"'))
+    clock.now += 2.0
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    cache.close()
+
+
+def test_sqlite_cache_eviction_and_invalidation(tmp_path):
+    """Test size-based eviction and endpoint invalidation."""
+    clock = FakeClock()
+    cache = SQLiteCache(tmp_path / "cache.db", max_entries=2, clock=clock)
+    for key in [
+        "/check_ins/v2/events/1",
+        "/check_ins/v2/events/1/locations",
+        "/check_ins/v2/events/10",
+    ]:
+        clock.now += 1
+        cache.set(key, cache.entry({}))
+    assert len(cache) == 2
+    assert cache.get("/check_ins/v2/events/1") is None
+    cache.invalidate("/check_ins/v2/events/1")
+    assert len(cache) == 1
+    assert cache.get("/check_ins/v2/events/10") is not None
+    cache.close()
+
+
+def test_sqlite_cache_shared_across_processes(tmp_path):
+    """Test an entry written by another process is visible."""
+    path = tmp_path / "cache.db"
+    cache = SQLiteCache(path)
+    script = (
+        "import sys; from pco.cache import SQLiteCache; "
+        "c = SQLiteCache(sys.argv[1]); "
+        "c.set('/people/v2/people/1', c.entry({'id': '1'}, etag='e')); c.close()"
+    )
+    subprocess.run([sys.executable, "-c", script, str(path)], check=True)
+    assert cache.get("/people/v2/people/1").data == {"id": "1"}
+    cache.close()
+
+
+def test_sqlite_cache_thread_safety(sqlite_cache):
+    """Test concurrent writers from several threads."""
+
+    def worker(n):
+        for i in range(20):
+            sqlite_cache.set(f"/people/v2/people/{n}-{i}", sqlite_cache.entry({"n": n}))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(sqlite_cache) == 100
+
+
+def test_client_with_sqlite_cache(mock_transport_client, sample_person_data, tmp_path):
+    """Test a new client reuses responses stored by a previous one."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=sample_person_data)
+
+    path = tmp_path / "cache.db"
+    first = SQLiteCache(path)
+    mock_transport_client(handler, cache=first).people.get_person("123")
+    first.close()
+    second = SQLiteCache(path)
+    assert (
+        mock_transport_client(handler, cache=second).people.get_person("123") == sample_person_data
+    )
+    second.close()
+    assert len(requests) == 1
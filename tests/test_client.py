@@ -1,12 +1,13 @@
 """Tests for PCOClient."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
 from pco.client import PCOClient
-from pco.exceptions import PCONotFoundError, PCORateLimitError, PCOValidationError
+from pco.exceptions import PCONotFoundError, PCORateLimitError
 
 
 def test_client_initialization_with_oauth(mock_oauth_client):
@@ -36,12 +37,12 @@ def test_get_request_success(pco_client, sample_person_data):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.is_success = True
-        mock_response.json.return_value = sample_person_data
-        mock_response.content = b'{"data": {}}'
+        mock_response.content = json.dumps(sample_person_data).encode()
         mock_request.return_value = mock_response
 
         result = pco_client.get("/people/v2/people/123")
         assert result == sample_person_data
+        mock_response.json.assert_not_called()
 
 
 def test_get_request_not_found(pco_client):
@@ -78,8 +79,7 @@ def test_post_request_success(pco_client, sample_person_data):
         mock_response = MagicMock()
         mock_response.status_code = 201
         mock_response.is_success = True
-        mock_response.json.return_value = sample_person_data
-        mock_response.content = b'{"data": {}}'
+        mock_response.content = json.dumps(sample_person_data).encode()
         mock_request.return_value = mock_response
 
         data = {"data": {"type": "Person", "attributes": {"first_name": "John"}}}
@@ -89,7 +89,153 @@ def test_post_request_success(pco_client, sample_person_data):
 
 def test_client_context_manager(pco_client):
     """Test PCOClient as context manager."""
-    with pco_client as client:
-        assert client == pco_client
-    # Verify close was called
-    pco_client._http_client.close.assert_called_once()
+    with patch.object(pco_client._http_client, "close") as mock_close:
+        with pco_client as client:
+            assert client == pco_client
+        # Verify close was called
+        mock_close.assert_called_once()
+
+
+def test_client_connection_pool_settings(mock_oauth_client):
+    """Test pool limits and HTTP/2 are passed to the underlying httpx.Client."""
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=15.0)
+    with patch("pco.client.httpx.Client") as mock_client_cls:
+        PCOClient(oauth_client=mock_oauth_client, limits=limits, http2=True)
+    mock_client_cls.assert_called_once_with(
+        timeout=PCOClient.DEFAULT_TIMEOUT, limits=limits, http2=True
+    )
+
+
+def test_client_default_connection_pool_settings(mock_oauth_client):
+    """Test default pool limits are applied."""
+    with patch("pco.client.httpx.Client") as mock_client_cls:
+        PCOClient(oauth_client=mock_oauth_client)
+    assert mock_client_cls.call_args.kwargs["limits"] is PCOClient.DEFAULT_LIMITS
+    assert mock_client_cls.call_args.kwargs["http2"] is False
+
+
+def test_client_shares_pool_with_oauth_client():
+    """Test an OAuth client with its own default pool is switched to the API client's pool."""
+    from pco.auth import OAuth2Client
+
+    oauth_client = OAuth2Client(client_id="test_id", client_secret="test_secret")
+    client = PCOClient(oauth_client=oauth_client)
+    assert oauth_client._http_client is client._http_client
+    assert not oauth_client.owns_http_client
+
+
+def test_oauth_client_outlives_shared_pool(mock_transport_client):
+    """Test one OAuth client keeps refreshing across two PCOClient lifetimes."""
+    from pco.auth import OAuth2Client, OAuth2Token
+
+    tokens = []
+
+    def handler(request):
+        if request.url.path == "/oauth/token":
+            tokens.append(request)
+            return httpx.Response(
+                200, json={"access_token": f"token_{len(tokens)}", "expires_in": 30}
+            )
+        return httpx.Response(200, json={"data": []})
+
+    oauth_client = OAuth2Client(client_id="test_id", client_secret="test_secret")
+    # Still valid, but within the refresh skew, so every request refreshes proactively
+    oauth_client.set_token(
+        OAuth2Token(access_token="old_token", refresh_token="refresh_token", expires_in=30)
+    )
+
+    with mock_transport_client(handler, oauth_client=oauth_client) as first:
+        first.get("/people/v2/people")
+    with mock_transport_client(handler, oauth_client=oauth_client) as second:
+        assert oauth_client._http_client is second._http_client
+        second.get("/people/v2/people")
+    assert len(tokens) == 2
+
+    fallback = oauth_client._token_http_client()
+    assert fallback is not second._http_client and not fallback.is_closed
+    assert oauth_client.owns_http_client
+    oauth_client.close()
+
+
+def test_client_keeps_custom_oauth_http_client():
+    """Test an OAuth client given an explicit http_client keeps it."""
+    from pco.auth import OAuth2Client
+
+    custom = httpx.Client()
+    oauth_client = OAuth2Client(
+        client_id="test_id", client_secret="test_secret", http_client=custom
+    )
+    PCOClient(oauth_client=oauth_client)
+    assert oauth_client._http_client is custom
+
+
+def test_custom_json_decoder(mock_transport_client):
+    """Test a pluggable decoder receives the raw body bytes exactly once."""
+    calls = []
+
+    def loads(content):
+        calls.append(content)
+        return json.loads(content)
+
+    client = mock_transport_client(
+        lambda request: httpx.Response(200, content=b'{"data": []}'), json_loads=loads
+    )
+    assert client.get("/people/v2/people") == {"data": []}
+    assert calls == [b'{"data": []}']
+
+
+def test_error_with_non_json_body(mock_transport_client, monkeypatch):
+    """Test an error response with a non-JSON body still raises the API error."""
+    monkeypatch.setattr("pco.client.time.sleep", lambda delay: None)
+    client = mock_transport_client(lambda request: httpx.Response(404, content=b"<html>"))
+    with pytest.raises(PCONotFoundError) as exc_info:
+        client.get("/people/v2/people/1")
+    assert exc_info.value.response_data is None
+
+
+def test_unauthorized_retried_once_after_refresh(mock_transport_client):
+    """Test a 401 refreshes the OAuth token and retries the request once."""
+    from pco.auth import OAuth2Client, OAuth2Token
+
+    token_http = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(
+                200, json={"access_token": "new_token", "expires_in": 3600}
+            )
+        )
+    )
+    oauth_client = OAuth2Client(
+        client_id="test_id", client_secret="test_secret", http_client=token_http
+    )
+    oauth_client.set_token(
+        OAuth2Token(access_token="old_token", refresh_token="refresh_token", expires_in=3600)
+    )
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        if request.headers["Authorization"] == "Bearer new_token":
+            return httpx.Response(200, json={"data": []})
+        return httpx.Response(401, json={"error": "expired"})
+
+    client = mock_transport_client(handler, oauth_client=oauth_client)
+    assert client.get("/people/v2/people") == {"data": []}
+    assert seen == ["Bearer old_token", "Bearer new_token"]
+
+
+def test_unauthorized_not_retried_twice(mock_oauth_client, mock_transport_client):
+    """Test a request still rejected after refreshing raises the 401."""
+    from pco.exceptions import PCOAPIError
+
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(401, json={"error": "Unauthorized"})
+
+    mock_oauth_client.refresh_after_unauthorized.return_value = True
+    client = mock_transport_client(handler)
+    with pytest.raises(PCOAPIError) as exc_info:
+        client.get("/people/v2/people")
+    assert exc_info.value.status_code == 401
+    assert len(calls) == 2
@@ -0,0 +1,113 @@
+"""Tests for streaming export."""
+
+import csv
+import gzip
+import io
+import json
+
+import httpx
+import pytest
+
+from pco.export import CSVWriter, JSONLWriter, export_csv, export_jsonl
+from pco.models import PCORecord
+
+
+def people(count):
+    """Generate People resource objects."""
+    for i in range(1, count + 1):
+        yield {
+            "id": str(i),
+            "type": "Person",
+            "attributes": {"first_name": f"First{i}", "last_name": f"Last{i}", "tags": ["a", "b"]},
+        }
+
+
+def test_export_jsonl(tmp_path):
+    """Test records are written one JSON object per line."""
+    path = tmp_path / "people.jsonl"
+    assert export_jsonl(people(3), path) == 3
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["1", "2", "3"]
+
+
+def test_export_jsonl_field_selection_and_gzip(tmp_path):
+    """Test attribute selection and gzip output inferred from the suffix."""
+    path = tmp_path / "people.jsonl.gz"
+    export_jsonl(people(2), path, fields=["first_name"])
+    with gzip.open(path, "rt") as f:
+        first = json.loads(f.readline())
+    assert first == {"id": "1", "type": "Person", "attributes": {"first_name": "First1"}}
+
+
+def test_export_csv_columns(tmp_path):
+    """Test CSV rows contain the id and the selected attributes."""
+    path = tmp_path / "people.csv"
+    assert export_csv(people(2), path, columns=["last_name", "tags"]) == 2
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        ["id", "last_name", "tags"],
+        ["1", "Last1", '["a","b"]'],
+        ["2", "Last2", '["a","b"]'],
+    ]
+
+
+def test_export_csv_default_columns_from_first_record():
+    """Test columns default to the first record's attributes."""
+    buffer = io.StringIO()
+    export_csv(people(1), buffer)
+    assert buffer.getvalue().splitlines()[0] == "id,first_name,last_name,tags"
+
+
+def test_export_csv_empty_with_columns():
+    """Test an empty export still writes the header when columns are known."""
+    buffer = io.StringIO()
+    assert export_csv([], buffer, columns=["name"]) == 0
+    assert buffer.getvalue().strip() == "id,name"
+
+
+def test_export_streams_records_as_they_arrive():
+    """Test each record is written before the next one is produced."""
+    buffer = io.StringIO()
+    writer = JSONLWriter(buffer)
+
+    def produce():
+        for i, record in enumerate(people(5)):
+            assert writer.count == i
+            yield record
+
+    writer.write_all(produce())
+    assert writer.count == 5
+
+
+def test_export_accepts_record_views():
+    """Test PCORecord views can be exported."""
+    buffer = io.StringIO()
+    with CSVWriter(buffer, columns=["first_name"]) as writer:
+        writer.write(PCORecord(next(people(1))))
+    assert buffer.getvalue().splitlines()[1] == "1,First1"
+
+
+def test_compress_requires_path():
+    """Test gzip output is rejected for file objects."""
+    with pytest.raises(ValueError, match="compress"):
+        JSONLWriter(io.StringIO(), compress=True)
+
+
+@pytest.fixture
+def paginated_client(mock_transport_client):
+    """A client whose People list endpoint serves three records over two pages."""
+
+    def handler(request):
+        offset = int(request.url.params.get("offset", 0))
+        records = list(people(3))[offset : offset + 2]
+        meta = {"next": {"offset": offset + 2}} if offset + 2 < 3 else {}
+        return httpx.Response(200, json={"data": records, "meta": meta})
+
+    return mock_transport_client(handler)
+
+
+def test_export_from_iter_people(paginated_client, tmp_path):
+    """Test exporting a paginated iter_* call."""
+    path = tmp_path / "people.jsonl"
+    assert export_jsonl(paginated_client.people.iter_people(per_page=2), path) == 3
@@ -0,0 +1,157 @@
+"""Tests for request lifecycle hooks."""
+
+import httpx
+import pytest
+
+from pco.exceptions import PCOAPIError, PCONotFoundError
+from pco.hooks import endpoint_module, endpoint_template
+from pco.ratelimit import RateLimiter
+from pco.retry import RetryPolicy
+
+
+def test_endpoint_template():
+    """Test IDs are stripped from endpoint paths."""
+    assert endpoint_template("/people/v2/people/123/emails") == "/people/v2/people/{id}/emails"
+    assert endpoint_template("/services/v2/plans") == "/services/v2/plans"
+    assert endpoint_module("/check-ins/v2/events/5") == "check-ins"
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr("pco.client.time.sleep", lambda delay: None)
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+def test_events_for_successful_request(mock_transport_client, events):
+    """Test a request emits request and response events with details."""
+    client = mock_transport_client(
+        lambda request: httpx.Response(200, content=b'{"data": []}'), hooks=[events.append]
+    )
+    client.get("/people/v2/people/42")
+
+    assert [event.kind for event in events] == ["request", "response"]
+    response = events[1]
+    assert response.template == "/people/v2/people/{id}"
+    assert response.module == "people"
+    assert response.status_code == 200
+    assert response.bytes == 12
+    assert response.duration >= 0
+    assert response.rate_limit_remaining == 99
+
+
+def test_events_for_retry_and_error(mock_transport_client, events):
+    """Test retried and finally failed requests emit retry and error events."""
+    client = mock_transport_client(
+        lambda request: httpx.Response(503),
+        retry_policy=RetryPolicy(max_retries=1, random_func=lambda: 1.0),
+        hooks=[events.append],
+    )
+    with pytest.raises(PCOAPIError):
+        client.get("/giving/v2/donations")
+
+    assert [event.kind for event in events] == [
+        "request",
+        "response",
+        "retry",
+        "request",
+        "response",
+        "error",
+    ]
+    assert events[2].wait > 0
+    assert events[-1].status_code == 503
+    assert events[-1].attempt == 1
+
+
+def test_client_errors_emit_error_event(mock_transport_client, events):
+    """Test a 404 is reported as an error without retrying."""
+    client = mock_transport_client(lambda request: httpx.Response(404), hooks=[events.append])
+    with pytest.raises(PCONotFoundError):
+        client.get("/people/v2/people/1")
+    assert [event.kind for event in events] == ["request", "response", "error"]
+
+
+def test_rate_limit_wait_event(mock_transport_client, events):
+    """Test waiting for the rate limiter emits an event."""
+    client = mock_transport_client(
+        lambda request: httpx.Response(200, content=b"{}"),
+        rate_limiter=RateLimiter(limit=1, period=5.0),
+        hooks=[events.append],
+    )
+    client.get("/people/v2/people")
+    client.get("/people/v2/people")
+
+    waits = [event for event in events if event.kind == "rate_limit_wait"]
+    assert len(waits) == 1
+    assert waits[0].wait == pytest.approx(5.0, abs=0.5)
+
+
+def test_network_error_event(mock_transport_client, events):
+    """Test a network failure that is not retried emits an error event."""
+
+    def handler(request):
+        raise httpx.ConnectError("down")
+
+    client = mock_transport_client(
+        handler, retry_policy=RetryPolicy(max_retries=0), hooks=[events.append]
+    )
+    with pytest.raises(PCOAPIError):
+        client.get("/people/v2/people")
+    assert events[-1].kind == "error"
+    assert isinstance(events[-1].error, httpx.ConnectError)
+
+
+def test_add_and_remove_hook(mock_transport_client, events):
+    """Test hooks can be added and removed after construction."""
+    client = mock_transport_client(
+        lambda request: httpx.Response(200, content=b"{}"), hooks=[events.append]
+    )
+    extra = []
+    client.add_hook(extra.append)
+    client.get("/people/v2/people")
+    client.remove_hook(extra.append)
+    client.get("/people/v2/people")
+    assert len(extra) == 2
+    assert len(events) == 4
+
+
+def test_failing_hook_does_not_change_outcome(mock_transport_client, events, caplog):
+    """Test a hook that raises is logged and the request still completes, retries included."""
+    responses = [httpx.Response(503), httpx.Response(201, content=b'{"data": {"id": "1"}}')]
+    client = mock_transport_client(
+        lambda request: responses.pop(0),
+        retry_policy=RetryPolicy(backoff_factor=0, retry_methods=["POST"]),
+        hooks=[events.append],
+    )
+
+    def broken(event):
+        raise RuntimeError("metrics backend down")
+
+    client.add_hook(broken)
+    with caplog.at_level("ERROR", logger="pco.client"):
+        assert client.post("/people/v2/people", json={}) == {"data": {"id": "1"}}
+
+    assert [event.kind for event in events] == [
+        "request",
+        "response",
+        "retry",
+        "request",
+        "response",
+    ]
+    assert "metrics backend down" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_async_client_hooks(mock_transport_async_client, events):
+    """Test the async client emits the same events."""
+    async with mock_transport_async_client(
+        lambda request: httpx.Response(200, content=b"{}"), hooks=[events.append]
+    ) as client:
+        await client.get("/services/v2/plans/7")
+    assert [(event.kind, event.template) for event in events] == [
+        ("request", "/services/v2/plans/{id}"),
+        ("response", "/services/v2/plans/{id}"),
+    ]
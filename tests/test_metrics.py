@@ -0,0 +1,82 @@
+"""Tests for MetricsCollector."""
+
+import httpx
+
+from pco.hooks import RequestEvent
+from pco.metrics import MetricsCollector, percentile
+
+
+def event(kind, module="people", **fields):
+    return RequestEvent(
+        kind=kind,
+        method="GET",
+        endpoint=f"/{module}/v2/x",
+        template=f"/{module}/v2/x",
+        module=module,
+        attempt=0,
+        elapsed=0.0,
+        rate_limit_remaining=100,
+        **fields,
+    )
+
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 50) is None
+
+
+def test_counters_and_latency_per_module():
+    """Test events are aggregated per module."""
+    collector = MetricsCollector()
+    for i in range(1, 101):
+        collector(event("request"))
+        collector(event("response", status_code=200, bytes=10, duration=i / 1000))
+    collector(event("response", module="giving", status_code=429, bytes=0, duration=0.5))
+    collector(event("retry", module="giving", wait=1.0))
+    collector(event("rate_limit_wait", module="giving", wait=2.5))
+    collector(event("error", module="giving", status_code=429))
+
+    snapshot = collector.snapshot()
+    people = snapshot["people"]
+    assert people["requests"] == 100
+    assert people["bytes"] == 1000
+    assert people["statuses"] == {"2xx": 100}
+    assert people["latency"]["p50"] == 0.05
+    assert people["latency"]["p95"] == 0.095
+    assert people["latency"]["p99"] == 0.099
+    giving = snapshot["giving"]
+    assert giving["statuses"] == {"4xx": 1}
+    assert (
+        giving["retries"],
+        giving["rate_limit_waits"],
+        giving["rate_limit_wait_seconds"],
+        giving["errors"],
+    ) == (1, 1, 2.5, 1)
+    assert collector.latency_percentile("giving", 50) == 0.5
+
+
+def test_latency_samples_are_bounded():
+    """Test only the most recent latencies are kept."""
+    collector = MetricsCollector(max_samples=10)
+    for i in range(100):
+        collector(event("response", status_code=200, duration=float(i)))
+    assert collector.snapshot()["people"]["latency"]["count"] == 10
+    assert collector.latency_percentile("people", 50) == 94.0
+
+
+def test_collector_as_client_hook(mock_transport_client):
+    """Test a collector registered on a client."""
+    collector = MetricsCollector()
+    client = mock_transport_client(
+        lambda request: httpx.Response(200, content=b"{}"), hooks=[collector]
+    )
+    client.get("/people/v2/people")
+    client.get("/services/v2/plans")
+    snapshot = collector.snapshot()
+    assert set(snapshot) == {"people", "services"}
+    assert snapshot["people"]["requests"] == 1
+    collector.reset()
+    assert collector.snapshot() == {}
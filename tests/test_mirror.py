@@ -0,0 +1,126 @@
+"""Tests for the local SQLite mirror."""
+
+import httpx
+import pytest
+
+from pco.mirror import Mirror, MirrorTable
+
+
+def donation(donation_id, person_id, designation_id, received_at):
+    """Build a Donation resource object linked to a person and a designation."""
+    return {
+        "id": donation_id,
+        "type": "Donation",
+        "attributes": {"amount_cents": 1000, "payment_method": "card", "received_at": received_at},
+        "relationships": {
+            "person": {"data": {"type": "Person", "id": person_id}},
+            "designations": {"data": [{"type": "Designation", "id": designation_id}]},
+        },
+    }
+
+
+def designation(designation_id, fund_id, amount_cents):
+    """Build a Designation resource object linked to a fund."""
+    return {
+        "id": designation_id,
+        "type": "Designation",
+        "attributes": {"amount_cents": amount_cents},
+        "relationships": {"fund": {"data": {"type": "Fund", "id": fund_id}}},
+    }
+
+
+DONATIONS = [
+    donation("1", "10", "101", "2024-01-05T00:00:00Z"),
+    donation("2", "10", "102", "2024-02-05T00:00:00Z"),
+    donation("3", "20", "103", "2023-12-01T00:00:00Z"),
+]
+DESIGNATIONS = [
+    designation("101", "7", 1000),
+    designation("102", "7", 1500),
+    designation("103", "7", 900),
+]
+
+
+@pytest.fixture
+def client(mock_transport_client):
+    """A client serving donations (with designations included) two per page, and funds."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path.endswith("/funds"):
+            return httpx.Response(
+                200, json={"data": [{"id": "7", "type": "Fund", "attributes": {"name": "General"}}]}
+            )
+        offset = int(request.url.params.get("offset", 0))
+        page = DONATIONS[offset : offset + 2]
+        meta = {"next": {"offset": offset + 2}} if offset + 2 < len(DONATIONS) else {}
+        return httpx.Response(
+            200, json={"data": page, "included": DESIGNATIONS[offset : offset + 2], "meta": meta}
+        )
+
+    client = mock_transport_client(handler)
+    client.requests = requests
+    return client
+
+
+def test_refresh_and_report(client):
+    """Test donations, included designations and links are mirrored and queryable."""
+    with Mirror() as mirror:
+        counts = mirror.refresh(client, tables=["funds", "donations"], per_page=2)
+
+        assert counts == {"funds": 1, "donations": 3}
+        assert mirror.count("designations") == 3
+        assert client.requests[-1].url.params["include"] == "designations"
+
+        rows = mirror.query(
+            "SELECT d.person_id, SUM(g.amount_cents) AS total FROM donations d "
+            "JOIN links l ON l.source_table = 'donations' AND l.source_id = d.id "
+            "AND l.relationship = 'designations' "
+            "JOIN designations g ON g.id = l.target_id "
+            "WHERE g.fund_id = ? AND d.received_at >= ? GROUP BY d.person_id",
+            ("7", "2024-01-01"),
+        )
+        assert [(row["person_id"], row["total"]) for row in rows] == [("10", 2500)]
+
+
+def test_upsert_replaces_rows_and_links():
+    """Test re-upserting a record replaces its columns and relationship links."""
+    with Mirror() as mirror:
+        mirror.upsert("donations", [donation("1", "10", "101", "2024-01-05T00:00:00Z")])
+        changed = donation("1", "20", "102", "2024-01-05T00:00:00Z")
+        mirror.upsert("donations", [changed])
+
+        (row,) = mirror.query("SELECT person_id FROM donations")
+        assert row["person_id"] == "20"
+        links = mirror.query("SELECT target_id FROM links WHERE source_id = '1' ORDER BY target_id")
+        assert [link["target_id"] for link in links] == ["102", "20"]
+
+
+def test_upsert_rolls_back_failed_page():
+    """Test a page is written atomically."""
+    with Mirror() as mirror:
+        with pytest.raises(KeyError):
+            mirror.upsert("funds", [{"id": "1", "type": "Fund"}, {"type": "Fund"}])
+        assert mirror.count("funds") == 0
+
+
+def test_custom_tables_and_indexes(tmp_path):
+    """Test custom layouts create indexed columns in a database file."""
+    table = MirrorTable("teams", "Team", module="services", resource="teams", columns=("name",))
+    path = tmp_path / "pco.db"
+    with Mirror(path, tables=[table]) as mirror:
+        mirror.upsert("teams", [{"id": "1", "type": "Team", "attributes": {"name": "Band"}}])
+        indexes = {
+            row["name"]
+            for row in mirror.query("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        assert "teams_name" in indexes
+    with Mirror(path, tables=[table]) as mirror:
+        assert mirror.query("SELECT name FROM teams WHERE id = '1'")[0]["name"] == "Band"
+
+
+def test_refresh_rejects_table_without_source(client):
+    """Test tables filled from included resources cannot be refreshed directly."""
+    with Mirror() as mirror, pytest.raises(ValueError, match="designations"):
+        mirror.refresh(client, tables=["designations"])
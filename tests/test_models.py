@@ -0,0 +1,208 @@
+"""Tests for PCO models."""
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from pco.models import (
+    IncludedIndex,
+    PCOData,
+    PCOGivingFund,
+    PCOPerson,
+    PCORecord,
+    parse_pco_response,
+    parse_records,
+    to_models,
+    type_adapter,
+)
+
+
+def people_page_with_includes():
+    """A people page with emails and households included."""
+    return {
+        "data": [
+            {
+                "id": "1",
+                "type": "Person",
+                "attributes": {"name": "John Doe"},
+                "relationships": {
+                    "emails": {
+                        "data": [{"type": "Email", "id": "10"}, {"type": "Email", "id": "11"}]
+                    },
+                    "primary_campus": {"data": {"type": "Campus", "id": "5"}},
+                    "households": {"data": [{"type": "Household", "id": "99"}]},
+                },
+            },
+            {
+                "id": "2",
+                "type": "Person",
+                "attributes": {"name": "Jane Smith"},
+                "relationships": {
+                    "emails": {"data": []},
+                    "primary_campus": {"data": None},
+                    "households": {"data": [{"type": "Household", "id": "99"}]},
+                },
+            },
+        ],
+        "included": [
+            {"id": "10", "type": "Email", "attributes": {"address": "john@example.com"}},
+            {"id": "11", "type": "Email", "attributes": {"address": "jd@example.com"}},
+            {"id": "99", "type": "Household", "attributes": {"name": "Doe Household"}},
+        ],
+    }
+
+
+def test_included_index_lookup():
+    """Test included resources are indexed by type and ID."""
+    index = IncludedIndex([PCOData(id="10", type="Email"), PCOData(id="10", type="PhoneNumber")])
+    assert len(index) == 2
+    assert index.get("Email", "10").type == "Email"
+    assert ("PhoneNumber", "10") in index
+    assert index.get("Email", "11") is None
+
+
+def test_resolve_relationships():
+    """Test related objects are materialized for every record in a page."""
+    response = parse_pco_response(people_page_with_includes())
+    resolved = response.resolve_relationships()
+
+    assert [email.attributes["address"] for email in resolved[0]["emails"]] == [
+        "john@example.com",
+        "jd@example.com",
+    ]
+    assert resolved[0]["primary_campus"] is None
+    assert resolved[0]["households"][0].attributes["name"] == "Doe Household"
+    assert resolved[1]["emails"] == []
+    assert resolved[1]["households"][0] is resolved[0]["households"][0]
+
+
+def test_included_index_is_cached():
+    """Test the index is built once per response."""
+    response = parse_pco_response(people_page_with_includes())
+    assert response.included_index is response.included_index
+
+
+def test_records_for_single_resource():
+    """Test records wraps single-resource responses in a list."""
+    response = parse_pco_response({"data": {"id": "1", "type": "Person"}})
+    assert [record.id for record in response.records] == ["1"]
+    assert parse_pco_response({}).records == []
+
+
+def test_record_view_access():
+    """Test a record view exposes id, type, attributes and relationships lazily."""
+    record = parse_records(people_page_with_includes())[0]
+    assert isinstance(record, PCORecord)
+    assert record.id == "1"
+    assert record.type == "Person"
+    assert record.name == "John Doe"
+    assert record.get("name") == "John Doe"
+    assert record.get("missing", "default") == "default"
+    assert record.related("primary_campus") == {"type": "Campus", "id": "5"}
+    assert record.related("nope") is None
+    with pytest.raises(AttributeError):
+        record.missing
+
+
+def test_record_view_has_no_instance_dict():
+    """Test record views are slotted."""
+    record = PCORecord({"id": "1", "type": "Person"})
+    assert not hasattr(record, "__dict__")
+
+
+def test_record_view_validates_on_read():
+    """Test typed reads validate only the requested attribute."""
+    record = PCORecord(
+        {
+            "id": "1",
+            "type": "Person",
+            "attributes": {"updated_at": "2024-01-12T18:44:51Z", "grade": "x"},
+        }
+    )
+    assert record.get("updated_at", as_type=datetime) == datetime(
+        2024, 1, 12, 18, 44, 51, tzinfo=timezone.utc
+    )
+    with pytest.raises(ValidationError):
+        record.get("grade", as_type=int)
+
+
+def test_record_view_returns_raw_values_without_model():
+    """Test attribute access returns unvalidated JSON values when no model is given."""
+    record = PCORecord({"id": "1", "type": "Person", "attributes": {"updated_at": "2024"}})
+    assert record.updated_at == "2024"
+
+
+def test_record_view_validates_against_model():
+    """Test attribute access validates model fields against their annotations."""
+    record = PCORecord(
+        {
+            "id": "1",
+            "type": "Person",
+            "attributes": {
+                "updated_at": "2024-01-12T18:44:51Z",
+                "first_name": ["not", "a", "name"],
+                "grade": "x",
+            },
+        },
+        PCOPerson,
+    )
+    expected = datetime(2024, 1, 12, 18, 44, 51, tzinfo=timezone.utc)
+    assert record.updated_at == expected
+    assert record.get("updated_at") == expected
+    assert record.grade == "x"
+    with pytest.raises(ValidationError):
+        record.first_name
+
+
+def test_parse_records_with_model():
+    """Test parse_records passes the model to every record view."""
+    records = parse_records(people_page_with_includes(), PCOPerson)
+    assert all(record.model is PCOPerson for record in records)
+    assert records[0].name == "John Doe"
+
+
+def test_record_view_missing_id():
+    """Test a resource object without an id fails when the id is read."""
+    record = PCORecord({"type": "Person"})
+    assert record.type == "Person"
+    with pytest.raises(ValueError, match="no id"):
+        record.id
+
+
+def test_record_view_to_data():
+    """Test a record view can be fully validated on demand."""
+    record = PCORecord({"id": "1", "type": "Person", "attributes": {"name": "John"}})
+    assert record.to_data() == PCOData(id="1", type="Person", attributes={"name": "John"})
+
+
+def test_to_models_from_response():
+    """Test a decoded page is converted into typed models."""
+    people = to_models(people_page_with_includes(), PCOPerson)
+    assert [person.id for person in people] == ["1", "2"]
+    assert people[0].name == "John Doe"
+    assert isinstance(people[0], PCOPerson)
+
+
+def test_to_models_accepts_views_and_pydantic_data():
+    """Test records can be raw dicts, PCOData or PCORecord views."""
+    raw = {
+        "id": "7",
+        "type": "Fund",
+        "attributes": {"name": "General", "updated_at": "2024-01-12T18:44:51Z"},
+    }
+    funds = to_models([raw, PCOData.model_validate(raw), PCORecord(raw)], PCOGivingFund)
+    assert [fund.name for fund in funds] == ["General"] * 3
+    assert all(isinstance(fund.updated_at, datetime) for fund in funds)
+
+
+def test_to_models_caches_type_adapter():
+    """Test the list adapter is built once per model."""
+    to_models([], PCOPerson)
+    assert type_adapter(list[PCOPerson]) is type_adapter(list[PCOPerson])
+
+
+def test_models_use_v2_config():
+    """Test models allow extra fields through model_config."""
+    assert PCOPerson.model_config["extra"] == "allow"
+    assert PCOPerson(id="1", favorite_color="blue").favorite_color == "blue"
@@ -1,10 +1,14 @@
 """Tests for PeopleModule."""
 
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from unittest.mock import patch
 
+import httpx
 import pytest
 
 from pco.client import PCOClient
+from pco.exceptions import PCONotFoundError, PCOValidationError
 from pco.modules.people import PeopleModule
 
 
@@ -78,3 +82,257 @@ def test_get_person_households(people_module):
         result = people_module.get_person_households("123")
         assert result == households_data
         mock_get.assert_called_once_with("/people/v2/people/123/households", params=None)
+
+
+def test_iter_people(people_module):
+    """Test iterating people follows pagination lazily."""
+    pages = [
+        {
+            "data": [{"id": "1", "type": "Person"}, {"id": "2", "type": "Person"}],
+            "meta": {"next": {"offset": 2}},
+        },
+        {"data": [{"id": "3", "type": "Person"}], "meta": {}},
+    ]
+    with patch.object(people_module.client, "get") as mock_get:
+        mock_get.side_effect = pages
+        iterator = people_module.iter_people(per_page=2)
+        mock_get.assert_not_called()
+        assert [person["id"] for person in iterator] == ["1", "2", "3"]
+        assert mock_get.call_args_list[0].kwargs["params"] == {"per_page": 2}
+        assert mock_get.call_args_list[1].kwargs["params"] == {"per_page": 2, "offset": 2}
+
+
+def test_iter_people_concurrent(mock_transport_client):
+    """Test concurrent iteration fetches remaining pages in parallel, in order."""
+    lock = threading.Lock()
+    in_flight = {"current": 0, "max": 0}
+
+    def handler(request):
+        offset = int(request.url.params.get("offset", 0))
+        with lock:
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        # Later pages answer faster, so out-of-order completion is exercised
+        time.sleep(0.005 * (10 - offset))
+        with lock:
+            in_flight["current"] -= 1
+        body = {
+            "data": [
+                {"id": str(offset + i), "type": "Person"} for i in range(2) if offset + i < 10
+            ],
+            "meta": {
+                "total_count": 10,
+                "next": {"offset": offset + 2} if offset + 2 < 10 else None,
+            },
+        }
+        return httpx.Response(200, json=body)
+
+    client = mock_transport_client(handler)
+    ids = [person["id"] for person in PeopleModule(client).iter_people(per_page=2, concurrency=3)]
+
+    assert ids == [str(i) for i in range(10)]
+    assert 1 < in_flight["max"] <= 3
+
+
+def test_iter_people_concurrent_per_page_above_server_cap(mock_transport_client):
+    """Test concurrent iteration steps by the server's page size when per_page exceeds the cap."""
+
+    def handler(request):
+        offset = int(request.url.params.get("offset", 0))
+        size = min(int(request.url.params["per_page"]), 100)
+        end = min(offset + size, 450)
+        body = {
+            "data": [{"id": str(i), "type": "Person"} for i in range(offset, end)],
+            "meta": {"total_count": 450, "next": {"offset": end} if end < 450 else None},
+        }
+        return httpx.Response(200, json=body)
+
+    client = mock_transport_client(handler)
+    people = PeopleModule(client)
+
+    assert len(list(people.iter_people(per_page=200))) == 450
+    assert [person["id"] for person in people.iter_people(per_page=200, concurrency=4)] == [
+        str(i) for i in range(450)
+    ]
+
+
+def test_get_people_by_ids(people_module):
+    """Test fetching people by ID batches IDs into where[id] filters."""
+
+    def fake_get(endpoint, params=None):
+        ids = params["where[id]"].split(",")
+        return {"data": [{"id": i, "type": "Person"} for i in ids if i != "404"], "meta": {}}
+
+    with patch.object(people_module.client, "get", side_effect=fake_get) as mock_get:
+        result = people_module.get_people_by_ids(["1", 2, "404", "1"])
+
+    mock_get.assert_called_once_with(
+        "/people/v2/people", params={"where[id]": "1,2,404", "per_page": 3}
+    )
+    assert sorted(result.found) == ["1", "2"]
+    assert result.missing == ["404"]
+
+
+def test_get_many_chunks_requests(people_module):
+    """Test IDs are split into chunks of the requested size."""
+    requested = []
+
+    def fake_get(endpoint, params=None):
+        ids = params["where[id]"].split(",")
+        requested.append(ids)
+        return {"data": [{"id": i, "type": "Person"} for i in ids], "meta": {}}
+
+    with patch.object(people_module.client, "get", side_effect=fake_get):
+        result = people_module.get_many("people", [str(i) for i in range(250)], chunk_size=100)
+
+    assert sorted(len(ids) for ids in requested) == [50, 100, 100]
+    assert len(result.found) == 250
+    assert result.missing == []
+
+
+def test_get_many_empty(people_module):
+    """Test no requests are made for an empty ID list."""
+    with patch.object(people_module.client, "get") as mock_get:
+        result = people_module.get_many("people", [])
+    mock_get.assert_not_called()
+    assert result.found == {} and result.missing == []
+
+
+@pytest.mark.parametrize("kwargs", [{"concurrency": 0}, {"chunk_size": 0}, {"chunk_size": 101}])
+def test_get_many_rejects_bad_limits(people_module, kwargs):
+    """Test out-of-range concurrency and chunk sizes fail before any request."""
+    with patch.object(people_module.client, "get") as mock_get:
+        with pytest.raises(ValueError):
+            people_module.get_many("people", ["1"], **kwargs)
+    mock_get.assert_not_called()
+
+
+def test_list_people_fields_and_include(people_module, sample_people_list):
+    """Test sparse fieldsets and includes are added to the query."""
+    with patch.object(people_module.client, "get") as mock_get:
+        mock_get.return_value = sample_people_list
+        people_module.list_people(
+            params={"per_page": 25},
+            fields={"Person": ["first_name", "last_name"], "Email": "address"},
+            include=["emails"],
+        )
+        mock_get.assert_called_once_with(
+            "/people/v2/people",
+            params={
+                "per_page": 25,
+                "fields[Person]": "first_name,last_name",
+                "fields[Email]": "address",
+                "include": "emails",
+            },
+        )
+
+
+def test_get_person_rejects_unknown_include(people_module):
+    """Test includes are validated against the module's schema table."""
+    with patch.object(people_module.client, "get") as mock_get:
+        with pytest.raises(ValueError, match="Cannot include donations on people"):
+            people_module.get_person("123", include="donations")
+        with pytest.raises(ValueError, match="do not contain Plan"):
+            people_module.get_person("123", fields={"Plan": ["title"]})
+        mock_get.assert_not_called()
+
+
+def test_related_include_validated_against_related_resource(people_module, sample_people_list):
+    """Test includes on a related collection use that collection's schema."""
+    with patch.object(people_module.client, "get") as mock_get:
+        mock_get.return_value = sample_people_list
+        people_module.get_household_people("1", include="emails")
+        mock_get.assert_called_once_with(
+            "/people/v2/households/1/people", params={"include": "emails"}
+        )
+
+
+def test_bulk_create_reports_validation_errors(people_module):
+    """Test bulk create collects per-item successes and validation errors."""
+
+    def fake_post(endpoint, json=None, params=None):
+        name = json["data"]["attributes"]["name"]
+        if not name:
+            raise PCOValidationError("Name can't be blank")
+        return {"data": {"id": name, "type": "Household"}}
+
+    rows = [
+        {"data": {"type": "Household", "attributes": {"name": name}}}
+        for name in ["a", "", "b", "", "c"]
+    ]
+    with patch.object(people_module.client, "post", side_effect=fake_post) as mock_post:
+        result = people_module.bulk_create("households", rows, concurrency=3)
+
+    assert mock_post.call_count == 5
+    assert [item.response["data"]["id"] for item in result.succeeded] == ["a", "b", "c"]
+    assert [item.index for item in result.failed] == [1, 3]
+    assert [item.index for item in result.validation_errors] == [1, 3]
+    assert result.failed[0].item is rows[1]
+    assert result.skipped == [] and not result.stopped
+
+
+def test_bulk_create_stops_after_max_errors(people_module):
+    """Test no further items are sent once the error threshold is reached."""
+    with patch.object(
+        people_module.client, "post", side_effect=PCOValidationError("invalid")
+    ) as mock_post:
+        result = people_module.bulk_create(
+            "households", [{"n": i} for i in range(10)], concurrency=1, max_errors=2
+        )
+
+    assert mock_post.call_count == 2
+    assert result.stopped
+    assert len(result.failed) == 2
+    assert result.skipped == [{"n": i} for i in range(2, 10)]
+
+
+def test_bulk_create_bounds_requests_in_flight(people_module):
+    """Test at most ``concurrency`` requests run at once."""
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def fake_post(endpoint, json=None, params=None):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return {"data": json}
+
+    with patch.object(people_module.client, "post", side_effect=fake_post):
+        result = people_module.bulk_create(
+            "households", ({"n": i} for i in range(20)), concurrency=4
+        )
+
+    assert len(result.succeeded) == 20
+    assert 1 < peak <= 4
+
+
+def test_bulk_update_and_delete(people_module):
+    """Test bulk update takes data keyed by ID and bulk delete reports missing records."""
+    with patch.object(people_module.client, "patch", return_value={"data": {}}) as mock_patch:
+        updated = people_module.bulk_update("households", {1: {"data": {}}, "2": {"data": {}}})
+    assert sorted(call.args[0] for call in mock_patch.call_args_list) == [
+        "/people/v2/households/1",
+        "/people/v2/households/2",
+    ]
+    assert [item.item[0] for item in updated.succeeded] == [1, "2"]
+
+    def fake_delete(endpoint, params=None):
+        if endpoint.endswith("/404"):
+            raise PCONotFoundError("Resource not found")
+
+    with patch.object(people_module.client, "delete", side_effect=fake_delete):
+        deleted = people_module.bulk_delete("households", ["1", "404"])
+    assert [item.item for item in deleted.succeeded] == ["1"]
+    assert [item.item for item in deleted.failed] == ["404"]
+    assert deleted.validation_errors == []
+
+
+def test_bulk_create_raises_unexpected_errors(people_module):
+    """Test errors other than API errors are raised."""
+    with patch.object(people_module.client, "post", side_effect=httpx.ConnectError("down")):
+        with pytest.raises(httpx.ConnectError):
+            people_module.bulk_create("households", [{}, {}, {}], concurrency=2)
@@ -0,0 +1,83 @@
+"""Tests for pagination helpers."""
+
+from pco.pagination import next_page_params, page_params, page_records, remaining_page_params
+
+
+def test_page_params_sets_per_page():
+    """Test first-page params include per_page without mutating input."""
+    params = {"order": "name"}
+    assert page_params(params, per_page=100) == {"order": "name", "per_page": 100}
+    assert params == {"order": "name"}
+    assert page_params(None) == {}
+
+
+def test_next_page_params_from_meta():
+    """Test next offset is read from meta.next."""
+    page = {"data": [], "meta": {"next": {"offset": 25}}}
+    assert next_page_params(page, {"per_page": 25}) == {"per_page": 25, "offset": 25}
+
+
+def test_next_page_params_from_links():
+    """Test next page is read from links.next when meta.next is missing."""
+    page = {"data": [], "links": {"next": "https://api.planningcenteronline.com/people/v2/people?offset=50&per_page=25"}}
+    assert next_page_params(page, {"per_page": 25, "offset": 25}) == {
+        "per_page": "25",
+        "offset": "50",
+    }
+
+
+def test_next_page_params_last_page():
+    """Test None is returned on the last page."""
+    assert next_page_params({"data": [], "meta": {}, "links": {}}, {}) is None
+    assert next_page_params([], {}) is None
+
+
+def test_next_page_params_stops_on_repeated_offset():
+    """Test a next link pointing at the current offset ends pagination."""
+    page = {"data": [], "meta": {"next": {"offset": 25}}}
+    assert next_page_params(page, {"offset": 25}) is None
+
+
+def test_page_records():
+    """Test records are extracted from list, single and empty pages."""
+    assert page_records({"data": [{"id": "1"}]}) == [{"id": "1"}]
+    assert page_records({"data": {"id": "1"}}) == [{"id": "1"}]
+    assert page_records({}) == []
+    assert page_records([{"id": "1"}]) == [{"id": "1"}]
+
+
+def test_remaining_page_params_from_total_count():
+    """Test every remaining offset is derived from meta.total_count."""
+    page = {"data": [{}, {}], "meta": {"total_count": 7, "next": {"offset": 2}}}
+    assert remaining_page_params(page, {"per_page": 2}) == [
+        {"per_page": 2, "offset": 2},
+        {"per_page": 2, "offset": 4},
+        {"per_page": 2, "offset": 6},
+    ]
+
+
+def test_remaining_page_params_uses_page_size_when_per_page_unset():
+    """Test the first page's length is used as page size by default."""
+    page = {"data": [{}] * 25, "meta": {"total_count": 60, "next": {"offset": 25}}}
+    assert [query["offset"] for query in remaining_page_params(page, {})] == [25, 50]
+
+
+def test_remaining_page_params_steps_by_server_page_size():
+    """Test offsets follow the server's page size when it caps the requested per_page."""
+    page = {"data": [{}] * 100, "meta": {"total_count": 450, "next": {"offset": 100}}}
+    assert [query["offset"] for query in remaining_page_params(page, {"per_page": 200})] == [
+        100,
+        200,
+        300,
+        400,
+    ]
+
+
+def test_remaining_page_params_without_total_count():
+    """Test None is returned when the total count is unknown."""
+    assert remaining_page_params({"data": [], "meta": {"next": {"offset": 2}}}, {}) is None
+
+
+def test_remaining_page_params_single_page():
+    """Test an empty list is returned when there is no next page."""
+    assert remaining_page_params({"data": [{}], "meta": {"total_count": 1}}, {}) == []
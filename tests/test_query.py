@@ -0,0 +1,106 @@
+"""Tests for the query builder."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from pco.query import format_value, where_param
+
+
+def test_where_param():
+    """Test conditions compile to where parameters."""
+    assert where_param("first_name", "Ann") == ("where[first_name]", "Ann")
+    assert where_param("updated_at__gte", date(2024, 1, 1)) == (
+        "where[updated_at][gte]",
+        "2024-01-01",
+    )
+    with pytest.raises(ValueError, match="Unsupported where operator"):
+        where_param("name__like", "A%")
+
+
+def test_format_value():
+    """Test values are formatted for the query string."""
+    eastern = timezone(timedelta(hours=-5))
+    assert format_value(datetime(2024, 1, 1, 7, 0, tzinfo=eastern)) == "2024-01-01T12:00:00Z"
+    assert format_value([1, 2, 3]) == "1,2,3"
+    assert format_value(True) == "true"
+
+
+def test_compiles_params(pco_client):
+    client = pco_client
+    """Test a full query compiles to PCO parameters."""
+    query = (
+        client.people.query("people")
+        .where(updated_at__gte="2024-01-01", status="active")
+        .order("-updated_at", "last_name")
+        .filter("created_since")
+        .per_page(50)
+        .fields(Person=["first_name", "last_name"])
+        .include("emails")
+    )
+    assert query.params() == {
+        "where[updated_at][gte]": "2024-01-01",
+        "where[status]": "active",
+        "order": "-updated_at,last_name",
+        "filter": "created_since",
+        "per_page": 50,
+        "fields[Person]": "first_name,last_name",
+        "include": "emails",
+    }
+
+
+def test_queries_are_immutable_and_keyed(pco_client):
+    client = pco_client
+    """Test refining a query leaves the base query untouched and equal queries share a key."""
+    base = client.people.query("people").where(status="active")
+    recent = base.order("-updated_at")
+    assert base.params() == {"where[status]": "active"}
+    assert recent != base
+    assert recent == client.people.query("people").order("-updated_at").where(status="active")
+    assert (
+        len({recent, client.people.query("people").where(status="active").order("-updated_at")})
+        == 1
+    )
+    assert client.services.query("items") != client.resources.query("items")
+    assert base.key == "/people/v2/people?where%5Bstatus%5D=active"
+
+
+def test_validation(pco_client):
+    client = pco_client
+    """Test invalid page sizes and includes are rejected."""
+    with pytest.raises(ValueError, match="per_page"):
+        client.people.query("people").per_page(500)
+    with pytest.raises(ValueError, match="Cannot include"):
+        client.people.query("people").include("donations").params()
+
+
+def test_iter_follows_pagination(mock_transport_client):
+    """Test a query runs server-side through the module's pagination."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        offset = int(request.url.params.get("offset", 0))
+        meta = {"next": {"offset": offset + 2}} if offset == 0 else {}
+        records = [{"id": str(offset + i), "type": "Person"} for i in range(2)]
+        return httpx.Response(200, json={"data": records, "meta": meta})
+
+    client = mock_transport_client(handler)
+    query = client.people.query("people").where(updated_at__gte="2024-01-01").per_page(2)
+
+    assert [record["id"] for record in query] == ["0", "1", "2", "3"]
+    assert requests[0].url.params["where[updated_at][gte]"] == "2024-01-01"
+    assert requests[1].url.params["offset"] == "2"
+    assert requests[1].url.params["per_page"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_async_query(mock_transport_async_client):
+    """Test queries on async modules run asynchronously."""
+    async with mock_transport_async_client(
+        lambda request: httpx.Response(200, json={"data": [{"id": "1", "type": "Fund"}]})
+    ) as client:
+        query = client.giving.query("funds").order("name")
+        assert [record["id"] async for record in query] == ["1"]
+        assert (await query.list())["data"][0]["id"] == "1"
@@ -0,0 +1,118 @@
+"""Tests for RateLimiter."""
+
+import threading
+
+import httpx
+
+from pco.ratelimit import RateLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_burst_up_to_limit_then_paced():
+    """Test requests go out immediately until the limit, then wait for the window."""
+    clock = FakeClock()
+    limiter = RateLimiter(limit=3, period=10.0, clock=clock)
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.reserve() == 10.0
+    assert limiter.reserve() == 10.0
+    clock.now += 10.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 10.0
+
+
+def test_update_reads_limit_and_period_headers():
+    """Test the limit and period are taken from response headers."""
+    clock = FakeClock()
+    limiter = RateLimiter(limit=100, period=20.0, clock=clock)
+    limiter.update({"X-PCO-API-Request-Rate-Limit": "2", "X-PCO-API-Request-Rate-Period": "5"})
+    assert limiter.limit == 2
+    assert limiter.period == 5.0
+    limiter.reserve()
+    limiter.reserve()
+    assert limiter.reserve() == 5.0
+
+
+def test_update_accounts_for_requests_made_elsewhere():
+    """Test the server-side request count consumes local capacity."""
+    clock = FakeClock()
+    limiter = RateLimiter(limit=5, period=10.0, clock=clock)
+    limiter.reserve()
+    limiter.update({"X-PCO-API-Request-Rate-Count": "5"})
+    assert limiter.reserve() == 10.0
+
+
+def test_retry_after_blocks_all_callers():
+    """Test Retry-After delays every following reservation."""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    limiter.update({"Retry-After": "7"}, status_code=429)
+    assert limiter.reserve() == 7.0
+    clock.now += 7.0
+    assert limiter.reserve() == 0.0
+
+
+def test_ignores_invalid_headers():
+    """Test malformed or missing headers leave the limiter unchanged."""
+    limiter = RateLimiter(limit=10, period=20.0)
+    limiter.update({"X-PCO-API-Request-Rate-Limit": "abc", "Retry-After": None})
+    assert limiter.limit == 10
+    assert limiter.reserve() == 0.0
+
+
+def test_reservations_are_thread_safe():
+    """Test concurrent reservations never oversubscribe the window."""
+    clock = FakeClock()
+    limiter = RateLimiter(limit=50, period=10.0, clock=clock)
+    delays = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(20):
+            delay = limiter.reserve()
+            with lock:
+                delays.append(delay)
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(delays) == [0.0] * 50 + [10.0] * 50 + [20.0] * 50 + [30.0] * 50
+
+
+def test_client_waits_for_retry_after(mock_transport_client, monkeypatch):
+    """Test PCOClient retries a 429 only after Retry-After has elapsed."""
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "3"}),
+        httpx.Response(200, json={"data": []}),
+    ]
+    sleeps = []
+    monkeypatch.setattr("pco.client.time.sleep", sleeps.append)
+    client = mock_transport_client(lambda request: responses.pop(0))
+
+    assert client.get("/people/v2/people") == {"data": []}
+    assert len(sleeps) == 1
+    assert 2.9 < sleeps[0] <= 3.0
+
+
+def test_remaining_budget():
+    """Test the remaining budget shrinks with reservations and is zero while blocked."""
+    clock = FakeClock()
+    limiter = RateLimiter(limit=3, period=10.0, clock=clock)
+    assert limiter.remaining() == 3
+    limiter.reserve()
+    assert limiter.remaining() == 2
+    limiter.update({"Retry-After": "5"}, 429)
+    assert limiter.remaining() == 0
+    clock.now += 10.0
+    assert limiter.remaining() == 3
@@ -0,0 +1,200 @@
+"""Tests for RetryPolicy and CircuitBreaker."""
+
+import httpx
+import pytest
+
+from pco.exceptions import PCOAPIError, PCOAuthError, PCOCircuitOpenError
+from pco.retry import CircuitBreaker, RetryPolicy, parse_retry_after
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_backoff_is_exponential_with_full_jitter():
+    """Test backoff grows exponentially, is capped, and scales with jitter."""
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, random_func=lambda: 1.0)
+    assert [policy.backoff(attempt) for attempt in range(4)] == [1.0, 2.0, 4.0, 5.0]
+    policy = RetryPolicy(backoff_factor=1.0, random_func=lambda: 0.25)
+    assert policy.backoff(2) == 1.0
+
+
+def test_get_delay_respects_max_retries():
+    """Test retries stop once max_retries is reached."""
+    policy = RetryPolicy(max_retries=2, random_func=lambda: 0.0)
+    assert policy.get_delay("GET", 0, 0.0, status_code=503) == 0.0
+    assert policy.get_delay("GET", 1, 0.0, status_code=503) == 0.0
+    assert policy.get_delay("GET", 2, 0.0, status_code=503) is None
+
+
+def test_get_delay_per_status_rules():
+    """Test per-status retry limits and non-retryable statuses."""
+    policy = RetryPolicy(max_retries=3, status_max_retries={503: 0}, random_func=lambda: 0.0)
+    assert policy.get_delay("GET", 0, 0.0, status_code=503) is None
+    assert policy.get_delay("GET", 0, 0.0, status_code=502) == 0.0
+    assert policy.get_delay("GET", 0, 0.0, status_code=404) is None
+
+
+def test_get_delay_only_retries_idempotent_methods_on_server_errors():
+    """Test POST is retried on 429 but not on server or network errors."""
+    policy = RetryPolicy(random_func=lambda: 0.0)
+    assert policy.get_delay("POST", 0, 0.0, status_code=500) is None
+    assert policy.get_delay("POST", 0, 0.0, error=httpx.ConnectError("boom")) is None
+    assert policy.get_delay("POST", 0, 0.0, status_code=429) == 0.0
+
+
+def test_get_delay_respects_retry_after_and_deadline():
+    """Test Retry-After is a lower bound and the deadline caps total time."""
+    policy = RetryPolicy(random_func=lambda: 0.0, deadline=10.0)
+    assert policy.get_delay("GET", 0, 0.0, status_code=429, retry_after=4.0) == 4.0
+    assert policy.get_delay("GET", 0, 8.0, status_code=429, retry_after=4.0) is None
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing."""
+    assert parse_retry_after({"Retry-After": "3"}) == 3.0
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after({}) is None
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """Test the breaker opens after repeated failures and closes after a good trial."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10.0, clock=clock)
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(PCOCircuitOpenError):
+        breaker.before_request()
+
+    clock.now = 10.0
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(PCOCircuitOpenError):
+        breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_failed_trial_reopens():
+    """Test a failed trial request re-opens the circuit."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5.0, clock=clock)
+    breaker.record_failure()
+    clock.now = 5.0
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(PCOCircuitOpenError):
+        breaker.before_request()
+
+
+def test_client_retries_server_errors_iteratively(mock_transport_client, monkeypatch):
+    """Test the client retries 5xx responses with jittered backoff."""
+    responses = [httpx.Response(503), httpx.Response(502), httpx.Response(200, json={"data": []})]
+    sleeps = []
+    monkeypatch.setattr("pco.client.time.sleep", sleeps.append)
+    client = mock_transport_client(
+        lambda request: responses.pop(0),
+        retry_policy=RetryPolicy(backoff_factor=1.0, random_func=lambda: 0.5),
+    )
+
+    assert client.get("/people/v2/people") == {"data": []}
+    assert sleeps == [0.5, 1.0]
+
+
+def test_client_raises_after_network_retries(mock_transport_client, monkeypatch):
+    """Test network errors surface as PCOAPIError once retries are exhausted."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("connection refused")
+
+    monkeypatch.setattr("pco.client.time.sleep", lambda delay: None)
+    client = mock_transport_client(handler, retry_policy=RetryPolicy(max_retries=2))
+
+    with pytest.raises(PCOAPIError, match="Network error"):
+        client.get("/people/v2/people")
+    assert len(calls) == 3
+
+
+def test_client_fails_fast_when_circuit_open(mock_transport_client, monkeypatch):
+    """Test an open circuit stops requests from being sent."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500)
+
+    monkeypatch.setattr("pco.client.time.sleep", lambda delay: None)
+    client = mock_transport_client(
+        handler,
+        retry_policy=RetryPolicy(max_retries=5),
+        circuit_breaker=CircuitBreaker(failure_threshold=2),
+    )
+
+    with pytest.raises(PCOCircuitOpenError):
+        client.get("/people/v2/people")
+    assert len(calls) == 2
+    with pytest.raises(PCOCircuitOpenError):
+        client.get("/people/v2/people")
+    assert len(calls) == 2
+
+
+def test_client_protocol_error_on_trial_reopens_circuit(mock_transport_client, monkeypatch):
+    """Test any transport error on the trial request counts as a failure, not a leaked slot."""
+    clock = FakeClock()
+    responses = [
+        httpx.RemoteProtocolError("server disconnected"),
+        httpx.Response(200, json={"data": []}),
+    ]
+
+    def handler(request):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0, clock=clock)
+    breaker.record_failure()
+    clock.now = 10.0
+    client = mock_transport_client(
+        handler, retry_policy=RetryPolicy(max_retries=0), circuit_breaker=breaker
+    )
+
+    with pytest.raises(PCOAPIError, match="Network error"):
+        client.get("/people/v2/people")
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 20.0
+    assert client.get("/people/v2/people") == {"data": []}
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_client_frees_trial_slot_when_request_is_not_sent(mock_oauth_client, mock_transport_client):
+    """Test an error before the trial request is sent frees the slot for the next request."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0, clock=clock)
+    breaker.record_failure()
+    clock.now = 10.0
+    client = mock_transport_client(
+        lambda request: httpx.Response(200, json={"data": []}),
+        circuit_breaker=breaker,
+    )
+
+    mock_oauth_client.get_authorization_header.side_effect = PCOAuthError("refresh failed")
+    with pytest.raises(PCOAuthError):
+        client.get("/people/v2/people")
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    mock_oauth_client.get_authorization_header.side_effect = None
+    assert client.get("/people/v2/people") == {"data": []}
+    assert breaker.state == CircuitBreaker.CLOSED
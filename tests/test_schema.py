@@ -0,0 +1,43 @@
+"""Tests for resource schemas and sparse fieldset parameters."""
+
+import pytest
+
+from pco.schema import ResourceSchema, query_params
+
+SCHEMAS = {"people": ResourceSchema("Person", {"emails": "Email", "households": "Household"})}
+
+
+def test_no_fields_or_include_keeps_params():
+    """Test params pass through untouched when nothing is requested."""
+    params = {"per_page": 10}
+    assert query_params(SCHEMAS, "people", params) is params
+    assert query_params(SCHEMAS, "people", None) is None
+
+
+def test_include_merges_with_params():
+    """Test includes are merged with an include already in params, without duplicates."""
+    query = query_params(SCHEMAS, "people", {"include": "emails"}, include="households, emails")
+    assert query == {"include": "emails,households"}
+
+
+def test_fields_for_included_types():
+    """Test fieldsets may name the collection's type and its included types."""
+    query = query_params(
+        SCHEMAS, "people", None, fields={"Person": ("first_name",), "Household": ["name"]}
+    )
+    assert query == {"fields[Person]": "first_name", "fields[Household]": "name"}
+
+
+def test_validation_errors():
+    """Test unknown includes, unknown types and empty names are rejected."""
+    with pytest.raises(ValueError, match="can include: emails, households"):
+        query_params(SCHEMAS, "people", None, include=["addresses"])
+    with pytest.raises(ValueError, match="Donation"):
+        query_params(SCHEMAS, "people", None, fields={"Donation": ["amount_cents"]})
+    with pytest.raises(ValueError, match="empty"):
+        query_params(SCHEMAS, "people", None, fields={"Person": "first_name,"})
+
+
+def test_unknown_collection_not_validated():
+    """Test collections missing from the table pass through unvalidated."""
+    assert query_params(SCHEMAS, "notes", None, include="anything") == {"include": "anything"}
@@ -0,0 +1,130 @@
+"""Tests for request coalescing."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from pco.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_shares_result_between_threads():
+    """Test concurrent calls for one key run the function once."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return {"id": "1"}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", func)))
+    leader.start()
+    started.wait()
+    followers = [
+        threading.Thread(target=lambda: results.append(flight.do("k", func))) for _ in range(4)
+    ]
+    for thread in followers:
+        thread.start()
+    while sum(1 for thread in followers if thread.is_alive()) < 4:
+        pass
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+    assert len(flight) == 0
+
+
+def test_single_flight_propagates_errors_and_resets():
+    """Test an exception reaches the caller and the key can be retried."""
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        flight.do("k", fail)
+    assert flight.do("k", lambda: 42) == 42
+
+
+def test_single_flight_distinct_keys_run_separately():
+    """Test different keys are not coalesced."""
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+
+
+def test_client_coalesces_concurrent_gets(mock_transport_client, sample_person_data):
+    """Test concurrent identical GETs through PCOClient send one request."""
+    in_flight = threading.Event()
+    release = threading.Event()
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        in_flight.set()
+        release.wait(timeout=5)
+        return httpx.Response(200, json=sample_person_data)
+
+    client = mock_transport_client(handler, coalesce_requests=True)
+    results = []
+
+    def worker():
+        results.append(client.people.get_person("123"))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    threads[0].start()
+    in_flight.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(requests) == 1
+    assert results == [sample_person_data] * 5
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight():
+    """Test concurrent awaits for one key share a task."""
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": "1"}
+
+    results = await asyncio.gather(*(flight.do("k", func) for _ in range(5)))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesces_concurrent_gets(
+    mock_transport_async_client, sample_person_data
+):
+    """Test concurrent identical GETs through AsyncPCOClient send one request."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=sample_person_data)
+
+    async with mock_transport_async_client(handler, coalesce_requests=True) as client:
+        results = await asyncio.gather(*(client.services.get_plan("1") for _ in range(5)))
+
+    assert len(requests) == 1
+    assert results == [sample_person_data] * 5
@@ -0,0 +1,153 @@
+"""Tests for incremental sync."""
+
+import httpx
+import pytest
+
+from pco.sync import Checkpoint, FileCheckpointStore, MemoryCheckpointStore, SyncEngine
+
+
+def person(person_id, updated_at):
+    """Build a People resource object."""
+    return {"id": person_id, "type": "Person", "attributes": {"updated_at": updated_at}}
+
+
+class FakePeopleAPI:
+    """Serves people filtered by where[updated_at][gte] in updated_at order."""
+
+    def __init__(self, records):
+        self.records = records
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        params = request.url.params
+        since = params.get("where[updated_at][gte]")
+        records = sorted(self.records, key=lambda r: (r["attributes"]["updated_at"], r["id"]))
+        if since is not None:
+            records = [r for r in records if r["attributes"]["updated_at"] >= since]
+        offset = int(params.get("offset", 0))
+        per_page = int(params.get("per_page", 100))
+        page = records[offset : offset + per_page]
+        meta = {"next": {"offset": offset + per_page}} if offset + per_page < len(records) else {}
+        return httpx.Response(200, json={"data": page, "meta": meta})
+
+
+@pytest.fixture
+def api():
+    return FakePeopleAPI(
+        [
+            person("1", "2024-01-01T00:00:00Z"),
+            person("2", "2024-01-02T00:00:00Z"),
+            person("3", "2024-01-02T00:00:00Z"),
+        ]
+    )
+
+
+@pytest.fixture
+def client(mock_transport_client, api):
+    return mock_transport_client(api)
+
+
+def test_initial_sync_emits_everything_and_saves_checkpoint(client, api):
+    """Test the first run pulls the whole collection in updated_at order."""
+    store = MemoryCheckpointStore()
+    upserts = []
+    result = SyncEngine(store, per_page=2).sync(client.people, "people", upserts.append)
+
+    assert [r["id"] for r in upserts] == ["1", "2", "3"]
+    assert result.upserted == 3
+    assert store.load("/people/v2/people") == Checkpoint("2024-01-02T00:00:00Z", ["2", "3"])
+    assert api.requests[0].url.params["order"] == "updated_at"
+    assert "where[updated_at][gte]" not in api.requests[0].url.params
+
+
+def test_next_sync_only_emits_changes(client, api):
+    """Test a second run skips records already seen at the high-water mark."""
+    engine = SyncEngine()
+    engine.sync(client.people, "people", lambda record: None)
+
+    api.records.append(person("4", "2024-01-02T00:00:00Z"))
+    api.records.append(person("5", "2024-01-03T00:00:00Z"))
+    upserts = []
+    result = engine.sync(client.people, "people", upserts.append)
+
+    assert api.requests[-1].url.params["where[updated_at][gte]"] == "2024-01-02T00:00:00Z"
+    assert [r["id"] for r in upserts] == ["4", "5"]
+    assert (result.upserted, result.skipped) == (2, 2)
+    assert result.checkpoint == Checkpoint("2024-01-03T00:00:00Z", ["5"])
+
+
+def test_no_changes_keeps_checkpoint(client):
+    """Test a run without changes emits nothing and leaves the checkpoint."""
+    engine = SyncEngine()
+    first = engine.sync(client.people, "people", lambda record: None)
+    second = engine.sync(client.people, "people", pytest.fail)
+    assert second.upserted == 0
+    assert second.checkpoint == first.checkpoint
+
+
+def test_checkpoint_saved_after_each_page(client):
+    """Test an interrupted run resumes from the last completed page."""
+    store = MemoryCheckpointStore()
+
+    def fail_on_third(record):
+        if record["id"] == "3":
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        SyncEngine(store, per_page=2).sync(client.people, "people", fail_on_third)
+    assert store.load("/people/v2/people") == Checkpoint("2024-01-02T00:00:00Z", ["2"])
+
+    upserts = []
+    SyncEngine(store, per_page=2).sync(client.people, "people", upserts.append)
+    assert [r["id"] for r in upserts] == ["3"]
+
+
+def test_record_edited_mid_run_does_not_hide_others(client, api):
+    """Test pages are queried by keyset so an edit during the run cannot shift records past it."""
+    api.records[:] = [person(str(i), f"2024-01-0{i + 1}T00:00:00Z") for i in range(6)]
+
+    def edit_first(record):
+        upserts.append(record["id"])
+        if record["id"] == "1":
+            api.records[0] = person("0", "2024-02-01T00:00:00Z")
+
+    upserts = []
+    SyncEngine(per_page=2).sync(client.people, "people", edit_first)
+
+    assert upserts == ["0", "1", "2", "3", "4", "5", "0"]
+    assert all("offset" not in request.url.params for request in api.requests)
+
+
+def test_page_of_identical_timestamps(client, api):
+    """Test a run walks past more records sharing one timestamp than fit on a page."""
+    api.records[:] = [person(str(i), "2024-01-01T00:00:00Z") for i in range(5)]
+    api.records.append(person("9", "2024-01-02T00:00:00Z"))
+    upserts = []
+    result = SyncEngine(per_page=2).sync(client.people, "people", upserts.append)
+
+    assert sorted(r["id"] for r in upserts) == ["0", "1", "2", "3", "4", "9"]
+    assert result.upserted == 6
+
+
+def test_file_checkpoint_store_round_trip(tmp_path):
+    """Test checkpoints persist across store instances."""
+    path = tmp_path / "checkpoints.json"
+    FileCheckpointStore(path).save("people", Checkpoint("2024-01-01T00:00:00Z", ["1"]))
+    FileCheckpointStore(path).save("funds", Checkpoint("2024-02-01T00:00:00Z"))
+
+    store = FileCheckpointStore(path)
+    assert store.load("people") == Checkpoint("2024-01-01T00:00:00Z", ["1"])
+    assert store.load("funds") == Checkpoint("2024-02-01T00:00:00Z", [])
+    assert store.load("donations") is None
+
+
+@pytest.mark.asyncio
+async def test_sync_async(mock_transport_async_client, api):
+    """Test syncing through an async module."""
+    client = mock_transport_async_client(api)
+    upserts = []
+    async with client:
+        result = await SyncEngine().sync_async(client.people, "people", upserts.append)
+    assert result.upserted == 3
+    assert [r["id"] for r in upserts] == ["1", "2", "3"]
@@ -0,0 +1,83 @@
+"""Tests for token stores."""
+
+import threading
+
+import httpx
+
+from pco.auth import OAuth2Client, OAuth2Token
+from pco.token_store import FileTokenStore, MemoryTokenStore
+
+
+def test_token_round_trip():
+    """Test tokens keep their absolute expiry through serialization."""
+    token = OAuth2Token(access_token="a", refresh_token="r", expires_in=3600, scope="people")
+    restored = OAuth2Token.from_dict(token.to_dict())
+    assert restored.to_dict() == token.to_dict()
+
+
+def test_file_token_store(tmp_path):
+    """Test tokens are persisted privately and reused until the file changes."""
+    path = tmp_path / "token.json"
+    store = FileTokenStore(path)
+    assert store.load() is None
+
+    store.save(OAuth2Token(access_token="a", expires_in=3600))
+    assert path.stat().st_mode & 0o777 == 0o600
+    first = store.load()
+    assert first.access_token == "a"
+    assert store.load() is first
+
+    FileTokenStore(path).save(OAuth2Token(access_token="b", expires_in=3600))
+    assert store.load().access_token == "b"
+
+
+def test_set_token_writes_store():
+    """Test clients read and write the shared store."""
+    store = MemoryTokenStore()
+    writer = OAuth2Client(client_id="id", client_secret="secret", token_store=store)
+    reader = OAuth2Client(client_id="id", client_secret="secret", token_store=store)
+    writer.set_token(OAuth2Token(access_token="shared"))
+    assert reader.get_authorization_header() == {"Authorization": "Bearer shared"}
+
+
+def test_one_refresh_for_all_clients_sharing_a_file(tmp_path):
+    """Test clients with their own store instances refresh the shared token once."""
+    path = tmp_path / "token.json"
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "access_token": f"new_{len(calls)}",
+                "refresh_token": f"refresh_{len(calls)}",
+                "expires_in": 3600,
+            },
+        )
+
+    expiring = OAuth2Token(access_token="old", refresh_token="refresh_0", expires_in=1)
+    FileTokenStore(path).save(expiring)
+    clients = [
+        OAuth2Client(
+            client_id="id",
+            client_secret="secret",
+            http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            token_store=FileTokenStore(path),
+        )
+        for _ in range(6)
+    ]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda c=client: results.append(c.get_token().access_token))
+        for client in clients
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["new_1"] * 6
+    assert FileTokenStore(path).load().refresh_token == "refresh_1"
@@ -0,0 +1,259 @@
+"""Tests for the webhook receiver."""
+
+import asyncio
+import io
+import json
+import threading
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+import httpx
+import pytest
+
+from pco.exceptions import PCOWebhookError
+from pco.webhooks import WebhookReceiver, compute_signature, parse_events, verify_signature
+
+SECRET = "shh"
+
+
+def delivery(delivery_id="d1", name="people.v2.events.person.updated", person_id="123"):
+    """Build a webhook delivery body."""
+    payload = {"data": {"id": person_id, "type": "Person", "attributes": {"first_name": "John"}}}
+    return json.dumps(
+        {
+            "data": [
+                {
+                    "id": delivery_id,
+                    "type": "EventDelivery",
+                    "attributes": {"name": name, "attempt": 1, "payload": json.dumps(payload)},
+                }
+            ]
+        }
+    ).encode()
+
+
+def signed(body, secret=SECRET):
+    """Headers carrying the signature of a body."""
+    return {"X-PCO-Webhooks-Authenticity": compute_signature(body, secret)}
+
+
+def test_verify_signature():
+    """Test signatures are checked against every configured secret."""
+    body = delivery()
+    assert verify_signature(body, compute_signature(body, SECRET), ["other", SECRET])
+    assert not verify_signature(body, compute_signature(body, "other"), SECRET)
+    assert not verify_signature(body, None, SECRET)
+
+
+def test_parse_events():
+    """Test the embedded payload is parsed into models."""
+    (event,) = parse_events(delivery())
+    assert event.name == "people.v2.events.person.updated"
+    assert event.action == "updated"
+    assert event.record.id == "123"
+    assert event.record.attributes["first_name"] == "John"
+
+
+def test_parse_events_rejects_garbage():
+    """Test malformed bodies raise PCOWebhookError."""
+    with pytest.raises(PCOWebhookError) as exc_info:
+        parse_events(b"{not json")
+    assert exc_info.value.status_code == 400
+
+
+def test_dispatch_by_pattern_and_dedupe():
+    """Test handlers match by pattern and duplicate deliveries are dispatched once."""
+    receiver = WebhookReceiver(SECRET)
+    people, everything = [], []
+    receiver.on("people.v2.events.person.*")(people.append)
+    receiver.on()(everything.append)
+
+    body = delivery()
+    assert len(receiver.handle(body, signed(body))) == 1
+    assert receiver.handle(body, signed(body)) == []
+
+    other = delivery("d2", name="giving.v2.events.donation.created")
+    receiver.handle(other, signed(other))
+    assert [e.id for e in people] == ["d1"]
+    assert [e.id for e in everything] == ["d1", "d2"]
+
+
+def test_failed_handler_is_not_marked_handled():
+    """Test a delivery whose handler failed is dispatched again on retry."""
+    receiver = WebhookReceiver(SECRET)
+    calls = []
+
+    @receiver.on()
+    def flaky(event):
+        calls.append(event.id)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+
+    body = delivery()
+    with pytest.raises(RuntimeError):
+        receiver.handle(body, signed(body))
+    receiver.handle(body, signed(body))
+    assert calls == ["d1", "d1"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_is_not_dispatched():
+    """Test a copy arriving while the first is being handled gets 409, not a second dispatch."""
+    receiver = WebhookReceiver(SECRET)
+    calls = []
+    release = asyncio.Event()
+
+    @receiver.on()
+    async def slow(event):
+        calls.append(event.id)
+        await release.wait()
+
+    body = delivery()
+    first = asyncio.create_task(receiver.handle_async(body, signed(body)))
+    await asyncio.sleep(0)
+    with pytest.raises(PCOWebhookError) as exc_info:
+        await asyncio.wait_for(receiver.handle_async(body, signed(body)), timeout=1)
+    assert exc_info.value.status_code == 409
+
+    release.set()
+    assert [e.id for e in await first] == ["d1"]
+    assert await receiver.handle_async(body, signed(body)) == []
+    assert calls == ["d1"]
+
+
+def test_concurrent_duplicate_retried_after_failure():
+    """Test an event is released for redelivery when its handler raises."""
+    receiver = WebhookReceiver(SECRET)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    @receiver.on()
+    def handler(event):
+        calls.append(event.id)
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+            raise RuntimeError("boom")
+
+    body = delivery()
+    thread = threading.Thread(target=call_wsgi, args=(receiver, "POST", body, signed(body)))
+    thread.start()
+    started.wait(5)
+    assert call_wsgi(receiver, "POST", body, signed(body)) == 409
+    release.set()
+    thread.join()
+
+    assert call_wsgi(receiver, "POST", body, signed(body)) == 204
+    assert calls == ["d1", "d1"]
+
+
+def test_invalid_signature_rejected():
+    """Test deliveries with a bad signature are not dispatched."""
+    receiver = WebhookReceiver(SECRET)
+    receiver.on()(pytest.fail)
+    body = delivery()
+    with pytest.raises(PCOWebhookError) as exc_info:
+        receiver.handle(body, signed(body, "wrong"))
+    assert exc_info.value.status_code == 401
+
+
+def call_wsgi(receiver, method, body, headers):
+    """Call a WSGI app and return the response status code."""
+    environ = {
+        "REQUEST_METHOD": method,
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    }
+    environ.update(
+        {"HTTP_" + key.upper().replace("-", "_"): value for key, value in headers.items()}
+    )
+    statuses = []
+    receiver(environ, lambda status, headers: statuses.append(status))
+    return int(statuses[0].split()[0])
+
+
+def test_wsgi_status_codes(caplog):
+    """Test the WSGI app maps outcomes to status codes."""
+    receiver = WebhookReceiver(SECRET)
+    body = delivery()
+    assert call_wsgi(receiver, "POST", body, signed(body)) == 204
+    assert call_wsgi(receiver, "POST", body, signed(body, "wrong")) == 401
+    assert call_wsgi(receiver, "GET", b"", {}) == 405
+    receiver.on()(lambda event: 1 / 0)
+    other = delivery("d2")
+    assert call_wsgi(receiver, "POST", other, signed(other)) == 500
+    assert "Webhook delivery failed" in caplog.text
+    assert "ZeroDivisionError" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_asgi_awaits_async_handlers():
+    """Test the ASGI app dispatches to coroutine handlers."""
+    receiver = WebhookReceiver(SECRET)
+    received = []
+
+    @receiver.on("people.*")
+    async def handler(event):
+        received.append(event.record.id)
+
+    body = delivery()
+    messages = [
+        {"type": "http.request", "body": body[:10], "more_body": True},
+        {"type": "http.request", "body": body[10:]},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    headers = [(key.lower().encode(), value.encode()) for key, value in signed(body).items()]
+    await receiver.asgi({"type": "http", "method": "POST", "headers": headers}, receive, send)
+    assert sent[0]["status"] == 204
+    assert received == ["123"]
+
+
+@pytest.mark.asyncio
+async def test_asgi_logs_failed_handlers(caplog):
+    """Test the ASGI app logs a failing handler and answers 500."""
+    receiver = WebhookReceiver(SECRET)
+    receiver.on()(lambda event: 1 / 0)
+    body = delivery()
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body}
+
+    async def send(message):
+        sent.append(message)
+
+    headers = [(key.lower().encode(), value.encode()) for key, value in signed(body).items()]
+    await receiver.asgi({"type": "http", "method": "POST", "headers": headers}, receive, send)
+    assert sent[0]["status"] == 500
+    assert "Webhook delivery failed" in caplog.text
+    assert "ZeroDivisionError" in caplog.text
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def test_local_server():
+    """Test the receiver behind a local WSGI server."""
+    receiver = WebhookReceiver(SECRET)
+    received = []
+    receiver.on()(received.append)
+    with make_server("127.0.0.1", 0, receiver, handler_class=QuietHandler) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            body = delivery()
+            response = httpx.post(
+                f"http://127.0.0.1:{server.server_port}/", content=body, headers=signed(body)
+            )
+        finally:
+            server.shutdown()
+    assert response.status_code == 204
+    assert [event.id for event in received] == ["d1"]